@@ -0,0 +1,168 @@
+"""
+Live refresh of in-process data on content changes.
+
+Statement triggers on the content tables bump the row of a version table
+and NOTIFY the data-change channel with the table name and new version. A
+background task holding a dedicated connection, outside the application
+pool, LISTENs on the channel and applies each change: the stores built
+from the changed tables (in-process, and export artifacts on disk) are
+dropped and the dataset version, which versions cached responses, moves
+to the database version.
+
+Install or update the triggers with `python -m db.notify`.
+"""
+import asyncio
+import json
+import asyncpg
+from sqlalchemy import text
+from db.models import Base
+from db.session import async_engine, SQLALCHEMY_DATABASE_URL
+from utils.config import DATASET_VERSION, DATA_CHANGE_CHANNEL, DATA_CHANGE_LISTEN, DATA_CHANGE_DEBOUNCE, DATA_CHANGE_RECONNECT_INTERVAL
+from utils.dataset import apply_data_change, get_dataset_version
+from utils.logger import logger
+
+SCHEMA = "quranhub_schema"
+TRIGGER_NAME = "quranhub_data_change"
+
+_listener = {"task": None}
+
+
+def content_tables():
+    """Names of the content tables of the schema."""
+    return sorted(table.name for table in Base.metadata.sorted_tables if table.schema == SCHEMA)
+
+
+def trigger_statements(tables=None):
+    """SQL installing the version table, the notify function and the triggers."""
+    statements = [
+        f"""
+        CREATE TABLE IF NOT EXISTS {SCHEMA}.data_version (
+            id integer PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+            version bigint NOT NULL DEFAULT 0,
+            changed_at timestamptz NOT NULL DEFAULT now()
+        )
+        """,
+        f"INSERT INTO {SCHEMA}.data_version (id) VALUES (1) ON CONFLICT (id) DO NOTHING",
+        f"""
+        CREATE OR REPLACE FUNCTION {SCHEMA}.notify_data_change() RETURNS trigger AS $$
+        DECLARE
+            new_version bigint;
+        BEGIN
+            UPDATE {SCHEMA}.data_version SET version = version + 1, changed_at = now()
+                WHERE id = 1 RETURNING version INTO new_version;
+            PERFORM pg_notify('{DATA_CHANGE_CHANNEL}', json_build_object('table', TG_TABLE_NAME, 'version', new_version)::text);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+    ]
+    for table in tables or content_tables():
+        statements.append(f"DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON {SCHEMA}.{table}")
+        statements.append(
+            f"CREATE TRIGGER {TRIGGER_NAME} AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {SCHEMA}.{table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {SCHEMA}.notify_data_change()"
+        )
+    return statements
+
+
+async def install_triggers(tables=None):
+    async with async_engine.begin() as connection:
+        for statement in trigger_statements(tables):
+            await connection.execute(text(statement))
+    logger.info(f"Data change triggers installed on {len(tables or content_tables())} tables.")
+
+
+def dataset_version_for(database_version) -> str:
+    """Dataset version for a database data version, shared by all workers."""
+    return f"{DATASET_VERSION}.{database_version}"
+
+
+async def _read_database_version(connection):
+    try:
+        return await connection.fetchval(f"SELECT version FROM {SCHEMA}.data_version WHERE id = 1")
+    except Exception as e:
+        logger.warning(f"Data version table not available, data changes are not tracked: {str(e)}")
+        return None
+
+
+async def _listen():
+    changes = asyncio.Queue()
+
+    def on_notify(connection, pid, channel, payload):
+        changes.put_nowait(payload)
+
+    # A connection of its own, so the listener does not hold one of the application pool
+    driver = await asyncpg.connect(SQLALCHEMY_DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"))
+    # A closed connection wakes the loop up, so the listener reconnects
+    driver.add_termination_listener(lambda connection: changes.put_nowait(None))
+    try:
+        await driver.add_listener(DATA_CHANGE_CHANNEL, on_notify)
+        # Catch up on changes made while this worker was not listening
+        version = await _read_database_version(driver)
+        if version is not None and dataset_version_for(version) != get_dataset_version():
+            apply_data_change(None, dataset_version_for(version))
+        logger.info(f"Listening for data changes on {DATA_CHANGE_CHANNEL}.")
+
+        while True:
+            payloads = [await changes.get()]
+            # Bulk updates notify once per statement; apply them together
+            await asyncio.sleep(DATA_CHANGE_DEBOUNCE)
+            while not changes.empty():
+                payloads.append(changes.get_nowait())
+            if None in payloads:
+                raise ConnectionError("Data change listener connection closed")
+            tables = set()
+            version = None
+            for payload in payloads:
+                change = json.loads(payload)
+                tables.add(change["table"])
+                version = max(version or 0, change["version"])
+            apply_data_change(tables, dataset_version_for(version))
+    finally:
+        if not driver.is_closed():
+            await driver.close()
+
+
+async def _run_listener():
+    while True:
+        try:
+            await _listen()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Data change listener failed, reconnecting in {DATA_CHANGE_RECONNECT_INTERVAL}s: {str(e)}")
+        await asyncio.sleep(DATA_CHANGE_RECONNECT_INTERVAL)
+
+
+def start_data_change_listener():
+    """Start the listener task once per process (on the running event loop)."""
+    task = _listener["task"]
+    if DATA_CHANGE_LISTEN and (task is None or task.done()):
+        _listener["task"] = asyncio.get_running_loop().create_task(_run_listener())
+
+
+async def stop_data_change_listener():
+    task = _listener["task"]
+    _listener["task"] = None
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+class DataChangeListenerMiddleware:
+    """ASGI middleware starting the data change listener with the first request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and _listener["task"] is None:
+            start_data_change_listener()
+        await self.app(scope, receive, send)
+
+
+if __name__ == "__main__":
+    asyncio.run(install_triggers())
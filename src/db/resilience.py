@@ -0,0 +1,148 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils.config import DB_BREAKER_FAILURE_THRESHOLD, DB_BREAKER_RESET_TIMEOUT
+from utils.logger import logger
+
+
+class DatabaseUnavailable(Exception):
+    """Raised without touching the database while the circuit breaker is open."""
+
+
+def is_unavailable_error(error: BaseException) -> bool:
+    """Whether an error means the database cannot be reached, as opposed to a bad query."""
+    if isinstance(error, (DatabaseUnavailable, OSError, asyncio.TimeoutError, exc.TimeoutError)):
+        return True
+    if isinstance(error, exc.DBAPIError):
+        return error.connection_invalidated or isinstance(error, (exc.OperationalError, exc.InterfaceError))
+    return False
+
+
+# Per-request flag set when a database call failed for availability reasons
+_request_state = ContextVar("database_request_state", default=None)
+
+
+def track_request():
+    """Start tracking database availability for the current request."""
+    state = {"unavailable": False}
+    _request_state.set(state)
+    return state
+
+
+def _mark_unavailable():
+    state = _request_state.get()
+    if state is not None:
+        state["unavailable"] = True
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for database access. After `failure_threshold`
+    consecutive availability failures it opens and calls fail fast. After
+    `reset_timeout` seconds one call is let through as a half-open probe:
+    its success closes the breaker, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = DB_BREAKER_FAILURE_THRESHOLD, reset_timeout: float = DB_BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.metrics = {"opened": 0, "rejected": 0}
+
+    def before_call(self) -> bool:
+        """
+        Check that a call may go to the database.
+
+        Returns:
+            bool: True if the call is the half-open probe.
+        """
+        if self.state == self.CLOSED:
+            return False
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self.probing:
+            self.probing = True
+            logger.info("Database circuit breaker half-open, probing.")
+            return True
+        self.metrics["rejected"] += 1
+        raise DatabaseUnavailable("Database circuit breaker is open")
+
+    def record_success(self, probe: bool = False):
+        if probe:
+            self.probing = False
+        if self.state != self.CLOSED:
+            logger.info("Database circuit breaker closed.")
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self, probe: bool = False):
+        if probe:
+            self.probing = False
+        self.failures += 1
+        if probe or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+            if self.state != self.OPEN:
+                self.metrics["opened"] += 1
+                logger.error(f"Database circuit breaker opened after {self.failures} failures.")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    async def call(self, operation):
+        """Await `operation()` under the breaker."""
+        try:
+            probe = self.before_call()
+        except DatabaseUnavailable:
+            _mark_unavailable()
+            raise
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            if probe:
+                self.probing = False
+            raise
+        except BaseException as e:
+            if is_unavailable_error(e):
+                _mark_unavailable()
+                self.record_failure(probe)
+            elif probe:
+                # The database answered, so it is reachable
+                self.record_success(probe)
+            raise
+        self.record_success(probe)
+        return result
+
+    def get_metrics(self):
+        return {"state": self.state, "consecutiveFailures": self.failures, **self.metrics}
+
+
+database_breaker = CircuitBreaker()
+
+
+class ResilientSession(AsyncSession):
+    """AsyncSession whose statements go through the database circuit breaker."""
+
+    async def _call(self, operation):
+        return await database_breaker.call(operation)
+
+    async def execute(self, *args, **kwargs):
+        return await self._call(lambda: AsyncSession.execute(self, *args, **kwargs))
+
+    async def scalar(self, *args, **kwargs):
+        return await self._call(lambda: AsyncSession.scalar(self, *args, **kwargs))
+
+    async def scalars(self, *args, **kwargs):
+        return await self._call(lambda: AsyncSession.scalars(self, *args, **kwargs))
+
+    async def stream(self, *args, **kwargs):
+        return await self._call(lambda: AsyncSession.stream(self, *args, **kwargs))
+
+    async def get(self, *args, **kwargs):
+        return await self._call(lambda: AsyncSession.get(self, *args, **kwargs))
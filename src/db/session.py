@@ -1,31 +1,394 @@
+import asyncio
+import time
+from collections import deque
+from contextvars import ContextVar
+from itertools import count
+from sqlalchemy import Select, exc, text
 from sqlalchemy.ext.asyncio import create_async_engine
 import os
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import AsyncAttrs
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from db.resilience import ResilientSession, is_unavailable_error
+from utils.config import (
+    DB_COMMAND_TIMEOUT, DATABASE_REPLICA_ROUTING, DATABASE_REPLICA_RETRY_INTERVAL,
+    DATABASE_HEDGED_READS, DATABASE_HEDGE_MIN_DELAY, DATABASE_HEDGE_LATENCY_WINDOW, DATABASE_POOL_WAIT_WINDOW
+)
+from utils.logger import logger
 
 # Load environment variables from .env file
 load_dotenv()
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
 ASYNC_SQLALCHEMY_DATABASE_URL=SQLALCHEMY_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
 
 
-# Create an async engine with optimized connection pooling
-async_engine = create_async_engine(
-    ASYNC_SQLALCHEMY_DATABASE_URL,
-    echo=False,  # Set to True only for debugging
-    pool_size=10,  
-    max_overflow=20,  
-    pool_recycle=1800  
-)
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waits = deque(maxlen=DATABASE_POOL_WAIT_WINDOW)
+        self.wait_metrics = {"checkouts": 0, "exhausted": 0, "timeouts": 0, "maxWaitMs": 0.0}
+
+    def _do_get(self):
+        if self._overflow >= self._max_overflow and self._pool.empty():
+            self.wait_metrics["exhausted"] += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.wait_metrics["timeouts"] += 1
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - started) * 1000
+            self.waits.append(wait_ms)
+            self.wait_metrics["checkouts"] += 1
+            self.wait_metrics["maxWaitMs"] = max(self.wait_metrics["maxWaitMs"], wait_ms)
+
+    def get_metrics(self):
+        ordered = sorted(self.waits)
+        return {
+            **self.wait_metrics,
+            "p50WaitMs": round(ordered[len(ordered) // 2], 3) if ordered else 0.0,
+            "p95WaitMs": round(ordered[int(len(ordered) * 0.95) - 1], 3) if len(ordered) >= 20 else None,
+            "maxWaitMs": round(self.wait_metrics["maxWaitMs"], 3),
+            "checkedOut": self.checkedout(),
+            "overflow": self.overflow(),
+        }
+
+
+def _create_engine(url: str):
+    # Create an async engine with optimized connection pooling
+    return create_async_engine(
+        url.replace("postgresql://", "postgresql+asyncpg://"),
+        echo=False,  # Set to True only for debugging
+        poolclass=TimedQueuePool,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=1800,
+        # Bound every statement so a hung database trips the circuit breaker
+        connect_args={"command_timeout": DB_COMMAND_TIMEOUT}
+    )
+
+
+async_engine = _create_engine(SQLALCHEMY_DATABASE_URL)
+
+
+class Replica:
+    def __init__(self, url: str):
+        self.engine = _create_engine(url)
+        self.name = self.engine.url.render_as_string(hide_password=True)
+        self.in_use = 0
+        self.down_until = 0.0
+        self.checking = False
+
+
+class ReplicaSet:
+    """
+    Read replicas with health-checked routing. A replica that fails with a
+    connection error is taken out of rotation; after
+    DATABASE_REPLICA_RETRY_INTERVAL seconds a SELECT 1 check decides whether
+    it comes back. Reads go to the primary when no replica is healthy.
+    """
+
+    def __init__(self, urls, routing: str = DATABASE_REPLICA_ROUTING):
+        self.replicas = [Replica(url) for url in urls]
+        self.routing = routing
+        self.turn = count()
+        self.latencies = deque(maxlen=DATABASE_HEDGE_LATENCY_WINDOW)
+        self.metrics = {"hedges": 0, "hedgeWins": 0, "markedDown": 0}
+
+    def __bool__(self):
+        return bool(self.replicas)
+
+    def healthy(self, exclude=None):
+        now = time.monotonic()
+        healthy = []
+        for replica in self.replicas:
+            if replica is exclude:
+                continue
+            if replica.down_until == 0.0:
+                healthy.append(replica)
+            elif now >= replica.down_until and not replica.checking:
+                replica.checking = True
+                asyncio.get_running_loop().create_task(self._check(replica))
+        return healthy
+
+    def choose(self, exclude=None):
+        """The replica for the next read session, or None to read from the primary."""
+        healthy = self.healthy(exclude)
+        if not healthy:
+            return None
+        if self.routing == "least_connections":
+            return min(healthy, key=lambda replica: replica.in_use)
+        return healthy[next(self.turn) % len(healthy)]
+
+    def mark_down(self, replica: Replica, error):
+        if replica.down_until == 0.0:
+            self.metrics["markedDown"] += 1
+            logger.error(f"Read replica {replica.name} taken out of rotation: {str(error)}")
+        replica.down_until = time.monotonic() + DATABASE_REPLICA_RETRY_INTERVAL
+
+    async def _check(self, replica: Replica):
+        try:
+            async with replica.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            replica.down_until = 0.0
+            logger.info(f"Read replica {replica.name} back in rotation.")
+        except Exception as e:
+            replica.down_until = time.monotonic() + DATABASE_REPLICA_RETRY_INTERVAL
+            logger.warning(f"Read replica {replica.name} still unavailable: {str(e)}")
+        finally:
+            replica.checking = False
+
+    def record_latency(self, seconds: float):
+        self.latencies.append(seconds)
+
+    def hedge_delay(self) -> float:
+        """Delay before a hedged read: the p95 of recent read latencies, at least DATABASE_HEDGE_MIN_DELAY."""
+        if len(self.latencies) < 20:
+            return DATABASE_HEDGE_MIN_DELAY
+        ordered = sorted(self.latencies)
+        return max(DATABASE_HEDGE_MIN_DELAY, ordered[int(len(ordered) * 0.95) - 1])
+
+    def get_metrics(self):
+        return {
+            **self.metrics,
+            "hedgeDelay": self.hedge_delay(),
+            "replicas": [
+                {"name": replica.name, "healthy": replica.down_until == 0.0, "inUse": replica.in_use}
+                for replica in self.replicas
+            ],
+        }
+
+
+replicas = ReplicaSet(DATABASE_REPLICA_URLS)
+
+
+class RoutingSession(Session):
+    """
+    Sends SELECTs to one read replica per session and everything else (and
+    everything when there are no replicas) to the primary.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if replicas and isinstance(clause, Select) and not self._flushing:
+            replica = self.info.get("replica")
+            if replica is None and "replica" not in self.info:
+                replica = replicas.choose()
+                self.info["replica"] = replica
+                if replica is not None:
+                    replica.in_use += 1
+            if replica is not None:
+                return replica.engine.sync_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def repin(self, replica):
+        """Send the following SELECTs to another replica, or the primary when None."""
+        previous = self.info.get("replica")
+        if previous is not None:
+            previous.in_use -= 1
+        self.info["replica"] = replica
+        if replica is not None:
+            replica.in_use += 1
+
+    def close(self):
+        replica = self.info.pop("replica", None)
+        if replica is not None:
+            replica.in_use -= 1
+        super().close()
+
 
-# Create an async session factory
-AsyncSessionLocal = async_sessionmaker(
+class ReadSession(ResilientSession):
+    """
+    Session of the repositories. A replica failure takes the replica out of
+    rotation and the read is retried once on another replica, or on the
+    primary when none is left. With DATABASE_HEDGED_READS a SELECT that runs longer than
+    the hedge delay is also sent to a second replica; the first answer wins.
+    A routed read goes through the circuit breaker as a whole, so only its
+    outcome counts, not the replica failures it recovered from.
+    """
+
+    async def execute(self, statement, *args, **kwargs):
+        if not replicas or not isinstance(statement, Select):
+            return await ResilientSession.execute(self, statement, *args, **kwargs)
+        return await self._call(lambda: self._routed_read(statement, args, kwargs))
+
+    async def _routed_read(self, statement, args, kwargs):
+        if DATABASE_HEDGED_READS and len(replicas.healthy()) >= 2:
+            return await _hedged_read(statement, args, kwargs)
+        started = time.monotonic()
+        try:
+            result = await AsyncSession.execute(self, statement, *args, **kwargs)
+        except Exception as e:
+            replica = self.sync_session.info.get("replica")
+            if replica is None or not is_unavailable_error(e):
+                raise
+            replicas.mark_down(replica, e)
+            # Repository sessions only read, so nothing is lost by starting over
+            await self.rollback()
+            self.sync_session.repin(replicas.choose(exclude=replica))
+            return await AsyncSession.execute(self, statement, *args, **kwargs)
+        replicas.record_latency(time.monotonic() - started)
+        return result
+
+    async def _call(self, operation):
+        try:
+            return await ResilientSession._call(self, operation)
+        except Exception:
+            # A failed statement aborts the transaction of a shared request session
+            self.info["failed"] = True
+            raise
+
+
+async def _read_on(replica: Replica, statement, args, kwargs):
+    # Hedged reads run concurrently, so each gets a session of its own. The
+    # hedged read as a whole goes through the circuit breaker.
+    async with _session_factory() as session:
+        session.sync_session.info["replica"] = replica
+        replica.in_use += 1
+        started = time.monotonic()
+        try:
+            result = await AsyncSession.execute(session, statement, *args, **kwargs)
+            # Fully load the rows so they outlive the session
+            frozen = result.freeze()
+        except Exception as e:
+            if is_unavailable_error(e):
+                replicas.mark_down(replica, e)
+            raise
+        replicas.record_latency(time.monotonic() - started)
+        return frozen
+
+
+async def _hedged_read(statement, args, kwargs):
+    first = replicas.choose()
+    primary_task = asyncio.ensure_future(_read_on(first, statement, args, kwargs))
+    done, _ = await asyncio.wait({primary_task}, timeout=replicas.hedge_delay())
+    if done and primary_task.exception() is None:
+        return primary_task.result()()
+
+    second = replicas.choose(exclude=first)
+    if second is None:
+        return (await primary_task)()
+    if done:
+        # The first replica failed before the hedge delay
+        return (await _read_on(second, statement, args, kwargs))()
+    replicas.metrics["hedges"] += 1
+    hedge_task = asyncio.ensure_future(_read_on(second, statement, args, kwargs))
+    pending = {primary_task, hedge_task}
+    error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge_task:
+                        replicas.metrics["hedgeWins"] += 1
+                    return task.result()()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+_session_factory = async_sessionmaker(
     bind=async_engine,
+    class_=ReadSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False
 )
 
+_session_metrics = {"sessionsOpened": 0, "sessionsReused": 0}
+_request_session = ContextVar("request_session", default=None)
+
+
+class RequestSession:
+    """
+    The session shared by the repository calls of one request. It is opened
+    on first use and lent to one caller at a time; a caller arriving while
+    it is lent out (e.g. a nested call) gets a session of its own.
+    """
+
+    def __init__(self):
+        self.session = None
+        self.lent = False
+        self.closed = False
+
+    async def __aenter__(self):
+        self.lent = True
+        if self.session is None:
+            _session_metrics["sessionsOpened"] += 1
+            self.session = _session_factory()
+        else:
+            _session_metrics["sessionsReused"] += 1
+        return self.session
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.lent = False
+        if self.closed or exc_type is not None or self.session.info.pop("failed", False):
+            # Start over with a new session rather than reuse an aborted transaction
+            await self._close_session()
+
+    async def _close_session(self):
+        session, self.session = self.session, None
+        if session is not None:
+            await session.close()
+
+    async def close(self):
+        self.closed = True
+        if not self.lent:
+            await self._close_session()
+
+
+class SessionFactory:
+    """
+    Session factory of the repositories: `async with AsyncSessionLocal() as
+    session`. Inside a request the request's shared session is lent out, so
+    the request checks out one pool connection instead of one per call.
+    """
+
+    def __call__(self):
+        request_session = _request_session.get()
+        if request_session is None or request_session.lent or request_session.closed:
+            _session_metrics["sessionsOpened"] += 1
+            return _session_factory()
+        return request_session
+
+
+AsyncSessionLocal = SessionFactory()
+
+
+class RequestSessionMiddleware:
+    """ASGI middleware giving each request one session shared by its repository calls."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_session = RequestSession()
+        token = _request_session.set(request_session)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_session.reset(token)
+            await request_session.close()
+
+
+def get_pool_metrics():
+    """Checkout wait times of the primary and replica pools, and session reuse."""
+    pools = {"primary": async_engine.pool.get_metrics()}
+    for replica in replicas.replicas:
+        pools[replica.name] = replica.engine.pool.get_metrics()
+    return {**_session_metrics, "pools": pools}
+
 
 class Base(AsyncAttrs, DeclarativeBase):
-    __abstract__ = True
\ No newline at end of file
+    __abstract__ = True
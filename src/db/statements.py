@@ -0,0 +1,184 @@
+import time
+from cachetools import LRUCache
+from sqlalchemy import event
+from db.session import async_engine, replicas
+from utils.config import DATABASE_PREPARE_STATEMENTS, DATABASE_PREPARE_LIMIT, DATABASE_STATEMENT_CACHE_SIZE
+from utils.logger import logger
+
+# Hot statements are built once, with bind parameters instead of values, and
+# reused. Reuse skips building the construct and its cache key on every call,
+# and gives each statement one SQL string, so it is prepared once per
+# connection by asyncpg. Statements with variants (e.g. the columns of a
+# `fields=` selection) are built once per variant.
+_builders = {}
+_statements = LRUCache(maxsize=DATABASE_STATEMENT_CACHE_SIZE)
+_sql = LRUCache(maxsize=DATABASE_STATEMENT_CACHE_SIZE)
+_metrics = {"built": 0, "reused": 0, "preparedOnConnect": 0, "prepareFailures": 0}
+
+
+def register_statement(name: str, prepare: bool = True):
+    """
+    Register the builder of a statement. The builder is called with the
+    variant arguments given to `statement()`, which must be hashable. With
+    `prepare`, new pool connections prepare the statement's variants in use.
+    """
+    def decorator(build):
+        _builders[name] = (build, prepare)
+        return build
+    return decorator
+
+
+def statement(name: str, *variant):
+    """The registered statement `name` for a variant, built on first use."""
+    key = (name, *variant)
+    built = _statements.get(key)
+    if built is not None:
+        _metrics["reused"] += 1
+        return built
+    build, _ = _builders[name]
+    built = _statements[key] = build(*variant)
+    _metrics["built"] += 1
+    return built
+
+
+def statement_sql(key) -> str:
+    """SQL string of a built statement, as asyncpg prepares it."""
+    sql = _sql.get(key)
+    if sql is None:
+        sql = _sql[key] = str(_statements[key].compile(dialect=async_engine.dialect))
+    return sql
+
+
+def positional_statement(name: str, *variant):
+    """
+    SQL string and bind parameter order of a registered statement, for
+    running it on a raw asyncpg connection.
+    """
+    statement(name, *variant)
+    compiled = _statements[(name, *variant)].compile(dialect=async_engine.dialect)
+    return compiled.string, list(compiled.positiontup)
+
+
+def _statements_to_prepare():
+    keys = [key for key in list(_statements.keys()) if _builders[key[0]][1]]
+    return keys[:DATABASE_PREPARE_LIMIT]
+
+
+def _prepare_statements(dbapi_connection, connection_record):
+    """
+    Prepare the statements in use on each new connection, so their first
+    execution on it skips parsing and planning. The asyncpg adapter keeps
+    prepared statements keyed by their SQL string, and that is the cache
+    they are put in.
+    """
+    if not DATABASE_PREPARE_STATEMENTS or not hasattr(dbapi_connection, "_prepare"):
+        return
+    asof = getattr(async_engine.dialect, "_invalidate_schema_cache_asof", 0)
+    for key in _statements_to_prepare():
+        try:
+            sql = statement_sql(key)
+            dbapi_connection.run_async(lambda _: dbapi_connection._prepare(sql, asof))
+            _metrics["preparedOnConnect"] += 1
+        except Exception as e:
+            _metrics["prepareFailures"] += 1
+            logger.warning(f"Could not prepare statement {key[0]}: {str(e)}")
+            return
+
+
+for engine in [async_engine, *(replica.engine for replica in replicas.replicas)]:
+    event.listen(engine.sync_engine, "connect", _prepare_statements)
+
+
+def get_statement_metrics():
+    return {**_metrics, "statements": len(_statements)}
+
+
+async def benchmark(cases, rounds: int = 500):
+    """
+    Time each case's query built per call against the registered statement,
+    and the parse/plan time a prepared statement saves on its first use on
+    a connection. `cases` are (label, name, variant, params) tuples.
+
+    Returns:
+        list: One dict per case with microseconds per call.
+    """
+    from db.session import _session_factory
+
+    report = []
+    async with _session_factory() as session:
+        connection = await session.connection()
+        raw = (await connection.get_raw_connection()).driver_connection
+        for label, name, variant, params in cases:
+            build, _ = _builders[name]
+            registered = statement(name, *variant)
+            await session.execute(registered, params)
+
+            started = time.perf_counter()
+            for _ in range(rounds):
+                await session.execute(build(*variant), params)
+            per_call = (time.perf_counter() - started) / rounds
+
+            started = time.perf_counter()
+            for _ in range(rounds):
+                await session.execute(registered, params)
+            reused = (time.perf_counter() - started) / rounds
+
+            sql = statement_sql((name, *variant))
+            started = time.perf_counter()
+            for _ in range(20):
+                await raw.prepare(sql)
+            prepare = (time.perf_counter() - started) / 20
+
+            report.append({
+                "endpoint": label,
+                "statement": name,
+                "builtPerCallUs": round(per_call * 1e6, 1),
+                "registeredUs": round(reused * 1e6, 1),
+                "savedPerCallUs": round((per_call - reused) * 1e6, 1),
+                "prepareUs": round(prepare * 1e6, 1),
+            })
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+
+    async def _benchmark_top_endpoints(rounds: int):
+        # The registry the repositories fill is the one of the imported module
+        from db import statements
+        from db.models import Ayat
+        from repositories import ayah_repo, keyword_repo, surah_repo  # noqa: F401 (registers their statements)
+        from repositories.division_repo import get_edition_divisions
+        from repositories.edition_repo import get_edition_by_identifier
+        from utils.config import DEFAULT_EDITION_IDENTIFIER
+        from utils.fields import AYAH_FIELD_COLUMNS, HIZB_AYAH_LAYOUT, SURAH_AYAH_LAYOUT, ayah_columns
+
+        edition = await get_edition_by_identifier(DEFAULT_EDITION_IDENTIFIER)
+        divisions = await get_edition_divisions(edition.id)
+        surah_columns = AYAH_FIELD_COLUMNS["surah"]
+
+        def division_case(endpoint, division, division_id, columns):
+            first, last = divisions[division].bounds(division_id)
+            params = {"edition_id": edition.id, "first": first, "last": last, "limit": 300, "offset": 0}
+            return endpoint, "division_ayahs", (division, False, tuple(columns)), params
+
+        cases = [
+            ("/v1/ayah/{number}", "ayah_by_number", (), {"number": 262, "edition_id": edition.id}),
+            ("/v1/ayah/{surah}:{ayah}", "ayah_by_surah", (), {"surah": 2, "ayah": 255, "edition_id": edition.id}),
+            ("/v1/surah/{number}", "surah_ayahs", (tuple(ayah_columns(None, layout=SURAH_AYAH_LAYOUT)),), {"surah": 2, "edition_id": edition.id, "limit": 300, "offset": 0}),
+            division_case("/v1/page/{number}", "page", 3, ayah_columns(None, Ayat.numberinsurat, *surah_columns)),
+            division_case("/v1/juz/{number}", "juz", 3, ayah_columns(None, *surah_columns)),
+            division_case("/v1/hizb/{number}", "hizb", 5, ayah_columns(None, *surah_columns, layout=HIZB_AYAH_LAYOUT)),
+            division_case("/v1/hizbQuarter/{number}", "hizbQuarter", 9, ayah_columns(None, *surah_columns)),
+            division_case("/v1/ruku/{number}", "ruku", 12, ayah_columns(None, *surah_columns)),
+            division_case("/v1/manzil/{number}", "manzil", 2, ayah_columns(None, *surah_columns)),
+            ("/v1/search/{keyword}", "search_exact", (), {"search_edition_id": edition.id, "search_pattern": "%god%", "limit": 10, "offset": 0}),
+        ]
+        print(f"{'endpoint':<28}{'built/call us':>15}{'registered us':>15}{'saved us':>10}{'prepare us':>12}")
+        for row in await statements.benchmark(cases, rounds):
+            print(f"{row['endpoint']:<28}{row['builtPerCallUs']:>15}{row['registeredUs']:>15}{row['savedPerCallUs']:>10}{row['prepareUs']:>12}")
+
+    parser = argparse.ArgumentParser(description="Benchmark the registered statements of the top endpoints.")
+    parser.add_argument("--rounds", type=int, default=500)
+    asyncio.run(_benchmark_top_endpoints(parser.parse_args().rounds))
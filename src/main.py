@@ -3,6 +3,16 @@ import uvicorn
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from utils.logger import logger
+from utils.single_flight import SingleFlightMiddleware, get_single_flight_metrics
+from utils.cache import get_cache_metrics, PurgeSyncMiddleware
+from db.notify import DataChangeListenerMiddleware
+from db.resilience import database_breaker
+from db.session import replicas, RequestSessionMiddleware, get_pool_metrics
+from db.statements import get_statement_metrics
+from repositories.ayah_fast_repo import get_ayah_fast_path_metrics
+from utils.stale import StaleFallbackMiddleware, get_stale_metrics
+from utils.admission import AdmissionControlMiddleware, get_admission_metrics
+from utils.config import STALE_FALLBACK_ENABLED, ADMISSION_CONTROL_ENABLED, DATABASE_REQUEST_SESSIONS
 import typing as t
 from routers.edition.edition_router import edition_router
 from routers.ruku.ruku_router import ruku_router
@@ -28,6 +38,9 @@ from routers.similar_ayah.similar_ayah_router import similar_ayah_router
 from routers.ayah_theme.ayah_theme_router import ayah_theme_router
 from routers.font.font_router import font_router
 from routers.mushaf_layout.mushaf_layout_router import mushaf_layout_router
+from routers.export.export_router import export_router
+from routers.audio.audio_router import audio_router
+from routers.cache.cache_router import cache_router
 
 
 tags_metadata = [
@@ -51,6 +64,8 @@ tags_metadata = [
     {"name": "Similar Ayah", "description": "Ayahs from the Quran that share similarities in meaning, context, or wording. This data allows you to explore and access Ayahs that closely align with each other."},
     {"name": "Font", "description": "Font metadata, font files, and per-page font resources for Quranic scripts."},
     {"name": "Mushaf Layout", "description": "Mushaf layout metadata, page/line structure, and surah/word lookups for Quranic pages."},
+    {"name": "Export", "description": "Bulk export of complete editions as streamed NDJSON or CSV, for partners mirroring the data."},
+    {"name": "Audio", "description": "Audio playlists and manifests of verse-by-verse recitations for surahs, pages, juzs and ayah ranges."},
 ]
 # Remove lifespan function and argument
 app = FastAPI(
@@ -105,6 +120,19 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+# Innermost, so the shared session is closed as soon as the response is sent
+if DATABASE_REQUEST_SESSIONS:
+    app.add_middleware(RequestSessionMiddleware)
+if STALE_FALLBACK_ENABLED:
+    app.add_middleware(StaleFallbackMiddleware)
+app.add_middleware(DataChangeListenerMiddleware)
+app.add_middleware(PurgeSyncMiddleware)
+# Inside single-flight, so coalesced duplicates do not take admission slots
+if ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware)
+# Registered before CORS so CORS headers are added per request, also on shared responses
+app.add_middleware(SingleFlightMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -129,6 +157,20 @@ async def readiness_probe():
     logger.debug("Readiness probe triggered")
     return {"status": "OK"}
 
+@app.get("/health/metrics", include_in_schema=False)
+async def metrics_probe():
+    return {
+        "singleFlight": get_single_flight_metrics(),
+        "cache": get_cache_metrics(),
+        "database": database_breaker.get_metrics(),
+        "replicas": replicas.get_metrics(),
+        "pool": get_pool_metrics(),
+        "statements": get_statement_metrics(),
+        "ayahFastPath": get_ayah_fast_path_metrics(),
+        "stale": get_stale_metrics(),
+        "admission": get_admission_metrics(),
+    }
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     return JSONResponse(
@@ -174,6 +216,9 @@ app.include_router(similar_ayah_router, prefix="/v1/similar-ayah")
 app.include_router(ayah_theme_router, prefix="/v1/ayah-theme")
 app.include_router(font_router, prefix="/v1/font")
 app.include_router(mushaf_layout_router, prefix="/v1/mushaf-layouts")
+app.include_router(export_router, prefix="/v1/export")
+app.include_router(audio_router, prefix="/v1/audio")
+app.include_router(cache_router, prefix="/internal/cache")
 
 
 excluded_keywords = ["health", "liveness", "startup"]
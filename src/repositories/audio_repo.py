@@ -0,0 +1,107 @@
+from sqlalchemy.future import select
+from db.models import Ayat
+from db.session import AsyncSessionLocal
+from utils.logger import logger
+from utils.helpers import get_ayah_audio_url_templates
+from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_audio
+from repositories.ayah_repo import get_ayah_range_bounds
+
+PLAYLIST_FORMATS = {
+    "json": "application/json",
+    "m3u": "audio/x-mpegurl"
+}
+
+
+async def get_audio_playlist(edition_identifier: str, surah: int = None, page: int = None, juz: int = None, from_reference=None, to_reference=None):
+    """
+    Build the audio playlist of an audio edition for a surah, page, juz or
+    ayah range. Only ayah numbers are read; URLs are generated from the
+    edition's precomputed URL templates, so no ayah text is fetched.
+
+    Returns:
+        dict: The edition, its URL templates and one item per ayah.
+        str: An error message otherwise.
+    """
+    try:
+        if from_reference is not None:
+            bounds = await get_ayah_range_bounds(from_reference, to_reference, [edition_identifier])
+            if isinstance(bounds, str):
+                return bounds
+            edition, edition_id, start, end = bounds[0]
+            if edition.format != "audio":
+                return "Edition is not an audio edition."
+        else:
+            edition = await get_edition_by_identifier(edition_identifier)
+            if isinstance(edition, str):
+                return edition
+            elif isinstance(edition, list):
+                edition = edition[0] if edition[0].type == "versebyverse" else edition[1]
+            if edition.format != "audio":
+                return "Edition is not an audio edition."
+
+            text_edition = await get_text_edition_for_audio(edition)
+            if isinstance(text_edition, str):
+                return text_edition
+            edition_id = text_edition.id
+
+        query = select(Ayat.number, Ayat.surat_id, Ayat.numberinsurat).filter(Ayat.edition_id == edition_id)
+        if from_reference is not None:
+            query = query.filter(Ayat.number.between(start, end))
+        elif surah is not None:
+            query = query.filter(Ayat.surat_id == surah)
+        elif page is not None:
+            query = query.filter(Ayat.page_id == page)
+        elif juz is not None:
+            query = query.filter(Ayat.juz_id == juz)
+        else:
+            return "One of surah, page, juz or range is required."
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(query.order_by(Ayat.number))
+            result = result.fetchall()
+
+        if not result:
+            return "Playlist not found."
+
+        primary, secondary = get_ayah_audio_url_templates(edition.identifier, tuple(edition.bitrates))
+        items = [
+            {
+                "number": item.number,
+                "surah": item.surat_id,
+                "numberInSurah": item.numberinsurat,
+                "audio": f"{primary}{item.number}.mp3"
+            }
+            for item in result
+        ]
+
+        return {
+            "edition": {
+                "identifier": edition.identifier,
+                "language": edition.language,
+                "name": edition.name,
+                "englishName": edition.englishname,
+                "format": edition.format,
+                "type": edition.type,
+                "direction": edition.direction
+            },
+            "templates": {
+                "audio": primary + "{number}.mp3",
+                "audioSecondary": [prefix + "{number}.mp3" for prefix in secondary]
+            },
+            "count": len(items),
+            "items": items
+        }
+
+    except Exception as e:
+        logger.error("An exception occurred while building audio playlist: %s", str(e))
+        return "An error occurred while fetching the audio playlist."
+
+
+def render_m3u(playlist: dict) -> str:
+    """Render a playlist as an extended M3U document."""
+    name = playlist["edition"]["englishName"]
+    lines = ["#EXTM3U", f"#PLAYLIST:{name}"]
+    for item in playlist["items"]:
+        lines.append(f"#EXTINF:-1,{name} - {item['surah']}:{item['numberInSurah']}")
+        lines.append(item["audio"])
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,221 @@
+import asyncio
+import re
+import asyncpg
+from db.resilience import database_breaker, is_unavailable_error
+from db.session import SQLALCHEMY_DATABASE_URL, replicas
+from db.statements import positional_statement
+from repositories.ayah_repo import format_ayah, get_an_ayah, get_an_ayah_by_surah_number
+from repositories.edition_repo import get_edition_catalog
+from utils.config import AYAH_FAST_PATH_POOL_SIZE, DB_COMMAND_TIMEOUT, DEFAULT_EDITION_IDENTIFIER
+from utils.dataset import render_json
+from utils.logger import logger
+
+# Fast path of /v1/ayah/{reference}[/{edition}]: the registered ayah lookups
+# run on a dedicated asyncpg pool and the response body is rendered straight
+# from the record with format_ayah. Anything but a found ayah of an
+# unambiguous edition returns None, and the request takes the regular path,
+# which produces the error responses. With read replicas, the lookups are
+# routed like other reads: one pool per replica, and the primary's pool when
+# no replica is healthy.
+_REFERENCE = re.compile(r"([0-9]+)(?::([0-9]+))?")
+
+_pools = {}
+_pool_lock = asyncio.Lock()
+_metrics = {"served": 0, "fallbacks": 0, "errors": 0}
+
+
+class AyahRecord(asyncpg.Record):
+    """Record with attribute access, so format_ayah reads it like a row."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _lookups():
+    return {
+        "number": positional_statement("ayah_by_number"),
+        "surah": positional_statement("ayah_by_surah"),
+    }
+
+
+async def _prepare_lookups(connection):
+    # Run each lookup once so it is prepared and kept in the statement cache
+    for sql, names in _lookups().values():
+        await connection.fetchrow(sql, *(0 for _ in names))
+
+
+def _dsn(replica=None) -> str:
+    if replica is None:
+        return SQLALCHEMY_DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+    return replica.engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+async def get_pool(replica=None):
+    """Fast path pool of a replica, or of the primary when None."""
+    pool = _pools.get(replica)
+    if pool is not None:
+        return pool
+    async with _pool_lock:
+        if replica not in _pools:
+            _pools[replica] = await asyncpg.create_pool(
+                _dsn(replica),
+                min_size=1,
+                max_size=AYAH_FAST_PATH_POOL_SIZE,
+                command_timeout=DB_COMMAND_TIMEOUT,
+                record_class=AyahRecord,
+                init=_prepare_lookups,
+            )
+    return _pools[replica]
+
+
+def _is_unavailable(error) -> bool:
+    return isinstance(error, (asyncpg.PostgresConnectionError, asyncpg.InterfaceError)) or is_unavailable_error(error)
+
+
+async def _fetchrow_on(replica, sql: str, values):
+    if replica is not None:
+        replica.in_use += 1
+    try:
+        pool = await get_pool(replica)
+        return await pool.fetchrow(sql, *values)
+    finally:
+        if replica is not None:
+            replica.in_use -= 1
+
+
+async def _fetchrow(sql: str, values):
+    """Run a lookup on a healthy replica, retried once elsewhere when the replica is unreachable."""
+    replica = replicas.choose() if replicas else None
+    try:
+        return await _fetchrow_on(replica, sql, values)
+    except Exception as e:
+        if replica is None or not _is_unavailable(e):
+            raise
+        replicas.mark_down(replica, e)
+        return await _fetchrow_on(replicas.choose(exclude=replica), sql, values)
+
+
+def _resolve_edition(catalog, edition_identifier: str):
+    """The edition get_edition_by_identifier and get_an_ayah would pick, or None if that is not certain."""
+    editions = catalog.by_identifier.get(edition_identifier, [])
+    if len(editions) == 1:
+        return editions[0]
+    verse_by_verse = [item for item in editions if item.type == "versebyverse"]
+    if len(editions) == 2 and len(verse_by_verse) == 1:
+        return verse_by_verse[0]
+    return None
+
+
+def _resolve_text_edition(catalog, edition_identifier: str):
+    """The edition get_text_edition_for_narrator would return, or None if that is not certain."""
+    text_editions = [item for item in catalog.by_identifier.get(edition_identifier, []) if item.format == "text"]
+    if len(text_editions) == 1:
+        return text_editions[0]
+    if text_editions:
+        return None
+    defaults = catalog.by_identifier.get(DEFAULT_EDITION_IDENTIFIER, [])
+    return defaults[0] if len(defaults) == 1 else None
+
+
+async def get_ayah_body(reference: str, edition_identifier: str = DEFAULT_EDITION_IDENTIFIER):
+    """
+    Response body of a single-ayah lookup, byte-identical to the regular path.
+
+    Returns:
+        bytes: The rendered {"code": 200, "status": "OK", "data": ...} body.
+        None: If the request has to take the regular path.
+    """
+    match = _REFERENCE.fullmatch(reference)
+    if match is None:
+        _metrics["fallbacks"] += 1
+        return None
+    try:
+        catalog = await get_edition_catalog()
+        edition = _resolve_edition(catalog, edition_identifier)
+        edition_id = edition.id if edition is not None else None
+        if edition is not None and edition.format == "audio":
+            text_edition = _resolve_text_edition(catalog, edition.identifier)
+            edition_id = text_edition.id if text_edition is not None else None
+        if edition_id is None:
+            _metrics["fallbacks"] += 1
+            return None
+
+        if match.group(2) is None:
+            sql, names = _lookups()["number"]
+            params = {"number": int(match.group(1)), "edition_id": edition_id}
+        else:
+            sql, names = _lookups()["surah"]
+            params = {"surah": int(match.group(1)), "ayah": int(match.group(2)), "edition_id": edition_id}
+        row = await database_breaker.call(lambda: _fetchrow(sql, [params[name] for name in names]))
+    except Exception as e:
+        _metrics["errors"] += 1
+        logger.warning(f"Ayah fast path failed for {reference} ({edition_identifier}), using the regular path: {str(e)}")
+        return None
+
+    if row is None:
+        _metrics["fallbacks"] += 1
+        return None
+    _metrics["served"] += 1
+    return render_json({"code": 200, "status": "OK", "data": format_ayah(row, edition)})
+
+
+def get_ayah_fast_path_metrics():
+    return dict(_metrics)
+
+
+async def check_parity(edition_identifier: str = DEFAULT_EDITION_IDENTIFIER):
+    """
+    Compare the fast path with the regular path for every ayah of an
+    edition, by global number and by surah:ayah.
+
+    Returns:
+        dict: Numbers of ayahs checked, mismatches, fallbacks, and the first mismatching references.
+    """
+    catalog = await get_edition_catalog()
+    edition = _resolve_edition(catalog, edition_identifier)
+    if edition is not None and edition.format == "audio":
+        edition = _resolve_text_edition(catalog, edition.identifier)
+    if edition is None:
+        return {"error": f"No unambiguous edition for {edition_identifier}."}
+    pool = await get_pool()
+    rows = await pool.fetch(
+        "SELECT number, surat_id, numberinsurat FROM quranhub_schema.ayat WHERE edition_id = $1 ORDER BY number",
+        edition.id
+    )
+
+    report = {"edition": edition_identifier, "ayahs": len(rows), "checked": 0, "mismatches": 0, "fallbacks": 0, "examples": []}
+    for row in rows:
+        for reference, regular in (
+            (str(row["number"]), get_an_ayah(row["number"], edition_identifier)),
+            (f"{row['surat_id']}:{row['numberinsurat']}", get_an_ayah_by_surah_number(row["surat_id"], row["numberinsurat"], edition_identifier)),
+        ):
+            expected = await regular
+            body = await get_ayah_body(reference, edition_identifier)
+            report["checked"] += 1
+            if body is None:
+                report["fallbacks"] += 1
+            elif isinstance(expected, str) or body != render_json({"code": 200, "status": "OK", "data": expected}):
+                report["mismatches"] += 1
+                if len(report["examples"]) < 10:
+                    report["examples"].append(reference)
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+
+    async def _run(edition_identifier: str):
+        # The pool and counters are those of the imported module
+        from repositories import ayah_fast_repo
+        return await ayah_fast_repo.check_parity(edition_identifier)
+
+    parser = argparse.ArgumentParser(description="Check the ayah fast path against the regular path for every ayah of an edition.")
+    parser.add_argument("--edition", default=DEFAULT_EDITION_IDENTIFIER)
+    report = asyncio.run(_run(parser.parse_args().edition))
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if not report.get("error") and report["mismatches"] == 0 and report["fallbacks"] == 0 else 1)
@@ -1,11 +1,130 @@
+from sqlalchemy import bindparam, or_, tuple_
 from sqlalchemy.future import select
-from db.models import Ayat, Surat
+from db.models import Ayat, Surat, NarrationsNumbering
 from db.session import AsyncSessionLocal
+from db.statements import register_statement, statement
 from utils.logger import logger
-from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
-from utils.config import DEFAULT_EDITION_IDENTIFIER
+from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator, get_text_edition_for_audio
+from repositories.narrations_numbering_repo import get_narration_numbering_from_narration
+from utils.config import DEFAULT_EDITION_IDENTIFIER, AYAH_RANGE_CHUNK_SIZE
 from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
 
+
+def format_ayah(result, edition):
+    """
+    Build the ayah response dict from an Ayat/Surat row and its edition,
+    adding the audio URLs for audio editions.
+    """
+    ayah = {
+        "number": result.number,
+        "text": result.text,
+        "edition": {
+            "identifier": edition.identifier,
+            "language": edition.language,
+            "name": edition.name,
+            "englishName": edition.englishname,
+            "format": edition.format,
+            "type": edition.type,
+            "direction": edition.direction
+        },
+        "surah": {
+            "number": result.id,
+            "name": result.name,
+            "englishName": result.englishname,
+            "englishNameTranslation": result.englishtranslation,
+            "revelationType": result.revelationcity,
+            "numberOfAyahs": result.numberofayats
+        },
+        "numberInSurah": result.numberinsurat,
+        "juz": result.juz_id,
+        "manzil": result.manzil_id,
+        "page": result.page_id,
+        "ruku": result.ruku_id,
+        "hizbQuarter": result.hizbquarter_id,
+        "sajda": result.sajda_id if result.sajda_id else False
+    }
+
+    if edition.format == "audio":
+        bitrates = edition.bitrates
+        max_bitrate = max(bitrates)
+        remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
+        ayah["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, ayah["number"])
+        ayah["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, ayah["number"])
+
+    return ayah
+
+
+def select_ayah_rows():
+    """Base query for the Ayat/Surat columns consumed by format_ayah."""
+    return select(
+        Ayat.number,
+        Ayat.text,
+        Ayat.numberinsurat,
+        Ayat.juz_id,
+        Ayat.manzil_id,
+        Ayat.page_id,
+        Ayat.ruku_id,
+        Ayat.hizbquarter_id,
+        Ayat.sajda_id,
+        Surat.id,
+        Surat.name,
+        Surat.englishname,
+        Surat.englishtranslation,
+        Surat.revelationcity,
+        Surat.numberofayats
+    ).join(Surat, Ayat.surat_id == Surat.id)
+
+
+@register_statement("ayah_by_number")
+def _ayah_by_number():
+    return select_ayah_rows().filter(Ayat.number == bindparam("number"), Ayat.edition_id == bindparam("edition_id"))
+
+
+@register_statement("ayah_by_surah")
+def _ayah_by_surah():
+    return select_ayah_rows().filter(
+        Ayat.numberinsurat == bindparam("ayah"),
+        Ayat.surat_id == bindparam("surah"),
+        Ayat.edition_id == bindparam("edition_id")
+    )
+
+
+@register_statement("ayah_number_by_surah")
+def _ayah_number_by_surah():
+    return select(Ayat.number).filter(
+        Ayat.edition_id == bindparam("edition_id"),
+        Ayat.surat_id == bindparam("surah"),
+        Ayat.numberinsurat == bindparam("ayah")
+    )
+
+
+@register_statement("ayah_reference_by_number")
+def _ayah_reference_by_number():
+    return select(Ayat.surat_id, Ayat.numberinsurat).filter(
+        Ayat.edition_id == bindparam("edition_id"),
+        Ayat.number == bindparam("number")
+    )
+
+
+def parse_ayah_reference(reference):
+    """
+    Parse an ayah reference given as a global number or surah:ayah.
+
+    Returns:
+        int: The global ayah number.
+        tuple: (surah_number, ayah_number_in_surah).
+        None: If the reference is invalid.
+    """
+    reference = str(reference).strip()
+    if ":" in reference:
+        parts = reference.split(":")
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            return int(parts[0]), int(parts[1])
+        return None
+    if reference.isdigit():
+        return int(reference)
+    return None
+
 async def get_an_ayah(ayah_number: int, edition_identifier: str):
     try:
         # Fetch the edition asynchronously
@@ -25,71 +144,16 @@ async def get_an_ayah(ayah_number: int, edition_identifier: str):
 
         # Query the Ayah and Surah details asynchronously
         async with AsyncSessionLocal() as session:
-            query = select(
-                Ayat.number,
-                Ayat.text,
-                Ayat.numberinsurat,
-                Ayat.juz_id,
-                Ayat.manzil_id,
-                Ayat.page_id,
-                Ayat.ruku_id,
-                Ayat.hizbquarter_id,
-                Ayat.sajda_id,
-                Surat.id,
-                Surat.name,
-                Surat.englishname,
-                Surat.englishtranslation,
-                Surat.revelationcity,
-                Surat.numberofayats
-            ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                Ayat.number == ayah_number,
-                Ayat.edition_id == edition_id
+            result = await session.execute(
+                statement("ayah_by_number"),
+                {"number": ayah_number, "edition_id": edition_id}
             )
-            result = await session.execute(query)
             result = result.first()  # Fetch the first result
 
         if not result:
             return "Ayah not found."
 
-        # Construct the response
-        ayah = {
-            "number": result.number,
-            "text": result.text,
-            "edition": {
-                "identifier": edition.identifier,
-                "language": edition.language,
-                "name": edition.name,
-                "englishName": edition.englishname,
-                "format": edition.format,
-                "type": edition.type,
-                "direction": edition.direction
-            },
-            "surah": {
-                "number": result.id,
-                "name": result.name,
-                "englishName": result.englishname,
-                "englishNameTranslation": result.englishtranslation,
-                "revelationType": result.revelationcity,
-                "numberOfAyahs": result.numberofayats
-            },
-            "numberInSurah": result.numberinsurat,
-            "juz": result.juz_id,
-            "manzil": result.manzil_id,
-            "page": result.page_id,
-            "ruku": result.ruku_id,
-            "hizbQuarter": result.hizbquarter_id,
-            "sajda": result.sajda_id if result.sajda_id else False
-        }
-
-        # If the edition is audio, add the audio details
-        if edition.format == "audio":
-            bitrates = edition.bitrates
-            max_bitrate = max(bitrates)
-            remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-            ayah["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, ayah["number"])
-            ayah["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, ayah["number"])
-
-        return ayah
+        return format_ayah(result, edition)
 
     except Exception as e:
         logger.error("An exception occurred while fetching Ayah: %s", str(e))
@@ -122,72 +186,15 @@ async def get_an_ayah_by_multiple_editions(ayah_number: int, edition_identifiers
                         return text_edition
                     edition_id = text_edition.id
 
-                query = select(
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.juz_id,
-                    Ayat.manzil_id,
-                    Ayat.page_id,
-                    Ayat.ruku_id,
-                    Ayat.hizbquarter_id,
-                    Ayat.sajda_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                    Ayat.number == ayah_number,
-                    Ayat.edition_id == edition_id
+                result = await session.execute(
+                    statement("ayah_by_number"),
+                    {"number": ayah_number, "edition_id": edition_id}
                 )
-                result = await session.execute(query)
                 result = result.first()  # Fetch the first result
                 results.append(result)
 
         for i in range(len(results)):
-            ayah = {
-                "number": results[i].number,
-                "text": results[i].text,
-                "edition": {
-                    "identifier": editions[i].identifier,
-                    "language": editions[i].language,
-                    "name": editions[i].name,
-                    "englishName": editions[i].englishname,
-                    "format": editions[i].format,
-                    "type": editions[i].type,
-                    "direction": editions[i].direction
-                },
-                "surah": {
-                    "number": results[i].id,
-                    "name": results[i].name,
-                    "englishName": results[i].englishname,
-                    "englishNameTranslation": results[i].englishtranslation,
-                    "revelationType": results[i].revelationcity,
-                    "numberOfAyahs": results[i].numberofayats
-                },
-                "numberInSurah": results[i].numberinsurat,
-                "juz": results[i].juz_id,
-                "manzil": results[i].manzil_id,
-                "page": results[i].page_id,
-                "ruku": results[i].ruku_id,
-                "hizbQuarter": results[i].hizbquarter_id,
-                "sajda": results[i].sajda_id if results[i].sajda_id else False
-            }
-
-            edition_format = ayah['edition']['format']
-            if edition_format == "audio":
-                # Find the edition with the correct identifier
-                edition = next((item for item in editions if item.identifier == ayah['edition']['identifier']), None)
-                if edition:
-                    bitrates = edition.bitrates
-                    max_bitrate = max(bitrates)
-                    remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-                    ayah["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, ayah["number"])
-                    ayah["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, ayah["number"])
-
-            data.append(ayah)
+            data.append(format_ayah(results[i], editions[i]))
 
         return data
 
@@ -216,72 +223,16 @@ async def get_an_ayah_by_surah_number(surah_number: int, ayah_number: int, editi
         
         # Query Ayah and Surah details asynchronously
         async with AsyncSessionLocal() as session:
-            query = select(
-                Ayat.number,
-                Ayat.text,
-                Ayat.numberinsurat,
-                Ayat.juz_id,
-                Ayat.manzil_id,
-                Ayat.page_id,
-                Ayat.ruku_id,
-                Ayat.hizbquarter_id,
-                Ayat.sajda_id,
-                Surat.id,
-                Surat.name,
-                Surat.englishname,
-                Surat.englishtranslation,
-                Surat.revelationcity,
-                Surat.numberofayats
-            ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                Ayat.numberinsurat == ayah_number,
-                Ayat.surat_id == surah_number,
-                Ayat.edition_id == edition_id
+            result = await session.execute(
+                statement("ayah_by_surah"),
+                {"surah": surah_number, "ayah": ayah_number, "edition_id": edition_id}
             )
-            result = await session.execute(query)
             result = result.first()  # Fetch the first result
             
             if not result:
                 return "Ayah not found."
         
-        # Construct the response data
-        ayah = {
-            "number": result.number,
-            "text": result.text,
-            "edition": {
-                "identifier": edition.identifier,
-                "language": edition.language,
-                "name": edition.name,
-                "englishName": edition.englishname,
-                "format": edition.format,
-                "type": edition.type,
-                "direction": edition.direction
-            },
-            "surah": {
-                "number": result.id,
-                "name": result.name,
-                "englishName": result.englishname,
-                "englishNameTranslation": result.englishtranslation,
-                "revelationType": result.revelationcity,
-                "numberOfAyahs": result.numberofayats
-            },
-            "numberInSurah": result.numberinsurat,
-            "juz": result.juz_id,
-            "manzil": result.manzil_id,
-            "page": result.page_id,
-            "ruku": result.ruku_id,
-            "hizbQuarter": result.hizbquarter_id,
-            "sajda": result.sajda_id if result.sajda_id else False
-        }
-
-        # If the format is audio, add the audio URLs
-        if edition.format == "audio":
-            bitrates = edition.bitrates
-            max_bitrate = max(bitrates)
-            remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-            ayah["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, ayah["number"])
-            ayah["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, ayah["number"])
-
-        return ayah
+        return format_ayah(result, edition)
 
     except Exception as e:
         logger.error("An exception occurred while fetching Ayah by Surah number: %s", str(e))
@@ -314,28 +265,10 @@ async def get_an_ayah_by_surah_number_and_multiple_editions(surah_number: int, a
                         return text_edition
                     edition_id = text_edition.id
 
-                query = select(
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.juz_id,
-                    Ayat.manzil_id,
-                    Ayat.page_id,
-                    Ayat.ruku_id,
-                    Ayat.hizbquarter_id,
-                    Ayat.sajda_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                    Ayat.numberinsurat == ayah_number,
-                    Ayat.surat_id == surah_number,
-                    Ayat.edition_id == edition_id
+                result = await session.execute(
+                    statement("ayah_by_surah"),
+                    {"surah": surah_number, "ayah": ayah_number, "edition_id": edition_id}
                 )
-                result = await session.execute(query)
                 result = result.first()  # Fetch the first result
                 
                 if not result:
@@ -344,52 +277,218 @@ async def get_an_ayah_by_surah_number_and_multiple_editions(surah_number: int, a
 
         # Construct the response data
         for i in range(len(results)):
-            ayah = {
-                "number": results[i].number,
-                "text": results[i].text,
-                "edition": {
-                    "identifier": editions[i].identifier,
-                    "language": editions[i].language,
-                    "name": editions[i].name,
-                    "englishName": editions[i].englishname,
-                    "format": editions[i].format,
-                    "type": editions[i].type,
-                    "direction": editions[i].direction
-                },
-                "surah": {
-                    "number": results[i].id,
-                    "name": results[i].name,
-                    "englishName": results[i].englishname,
-                    "englishNameTranslation": results[i].englishtranslation,
-                    "revelationType": results[i].revelationcity,
-                    "numberOfAyahs": results[i].numberofayats
-                },
-                "numberInSurah": results[i].numberinsurat,
-                "juz": results[i].juz_id,
-                "manzil": results[i].manzil_id,
-                "page": results[i].page_id,
-                "ruku": results[i].ruku_id,
-                "hizbQuarter": results[i].hizbquarter_id,
-                "sajda": results[i].sajda_id if results[i].sajda_id else False
-            }
-
-            # If the format is audio, add the audio URLs
-            edition_format = ayah['edition']['format']
-            if edition_format == "audio":
-                for item in editions:
-                    if item.identifier == ayah['edition']['identifier']:
-                        edition = item
-                        break
-                bitrates = edition.bitrates
-                max_bitrate = max(bitrates)
-                remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-                ayah["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, ayah["number"])
-                ayah["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, ayah["number"])
-
-            data.append(ayah)
+            data.append(format_ayah(results[i], editions[i]))
 
         return data
 
     except Exception as e:
         logger.error("An exception occurred while fetching Ayah by Surah number and multiple editions: %s", str(e))
-        return "An error occurred while fetching this Ayah."
\ No newline at end of file
+        return "An error occurred while fetching this Ayah."
+
+
+async def get_ayahs_batch(references: list, edition_identifiers: list):
+    """
+    Resolve many ayah references for many editions at once.
+
+    Each edition is resolved once and all of its ayahs are fetched with a
+    single set-based query. Results keep the input order (references first,
+    then editions) and carry a per-item error instead of failing the batch.
+
+    Returns:
+        list: One item per (reference, edition) pair.
+        str: An error message if the batch could not be processed.
+    """
+    try:
+        parsed_references = [parse_ayah_reference(reference) for reference in references]
+        numbers = {item for item in parsed_references if isinstance(item, int)}
+        surah_ayahs = {item for item in parsed_references if isinstance(item, tuple)}
+
+        editions = {}
+        rows = {}
+        async with AsyncSessionLocal() as session:
+            for identifier in dict.fromkeys(edition_identifiers):
+                edition = await get_edition_by_identifier(identifier)
+                if isinstance(edition, str):
+                    editions[identifier] = edition
+                    continue
+                elif isinstance(edition, list):
+                    edition = edition[0] if edition[0].type == "versebyverse" else edition[1]
+
+                edition_id = edition.id
+                if edition.format == "audio":
+                    text_edition = await get_text_edition_for_narrator(edition.identifier)
+                    if isinstance(text_edition, str):
+                        editions[identifier] = text_edition
+                        continue
+                    edition_id = text_edition.id
+                editions[identifier] = edition
+
+                conditions = []
+                if numbers:
+                    conditions.append(Ayat.number.in_(sorted(numbers)))
+                if surah_ayahs:
+                    conditions.append(tuple_(Ayat.surat_id, Ayat.numberinsurat).in_(sorted(surah_ayahs)))
+                if not conditions:
+                    rows[identifier] = {}
+                    continue
+
+                result = await session.execute(
+                    select_ayah_rows().filter(
+                        Ayat.edition_id == edition_id,
+                        or_(*conditions)
+                    )
+                )
+                edition_rows = {}
+                for row in result.fetchall():
+                    edition_rows[row.number] = row
+                    edition_rows[(row.id, row.numberinsurat)] = row
+                rows[identifier] = edition_rows
+
+        data = []
+        for reference, parsed in zip(references, parsed_references):
+            for identifier in edition_identifiers:
+                item = {"reference": reference, "edition": identifier}
+                edition = editions[identifier]
+                if parsed is None:
+                    item.update({"status": "Error", "data": "Invalid reference format."})
+                elif isinstance(edition, str):
+                    item.update({"status": "Error", "data": edition})
+                elif parsed not in rows[identifier]:
+                    item.update({"status": "Error", "data": "Ayah not found."})
+                else:
+                    item.update({"status": "OK", "data": format_ayah(rows[identifier][parsed], edition)})
+                data.append(item)
+
+        return data
+
+    except Exception as e:
+        logger.error("An exception occurred while fetching Ayah batch: %s", str(e))
+        return "An error occurred while fetching these Ayahs."
+
+
+async def _get_ayah_number(session, edition_id: int, reference):
+    """Global ayah number of a surah:ayah reference within an edition."""
+    if isinstance(reference, int):
+        return reference
+    result = await session.execute(
+        statement("ayah_number_by_surah"),
+        {"surah": reference[0], "ayah": reference[1], "edition_id": edition_id}
+    )
+    return result.scalar()
+
+
+async def _get_hafs_reference(session, reference):
+    """Hafs surah:ayah of a global ayah number, using the default edition."""
+    if isinstance(reference, tuple):
+        return reference
+    edition = await get_edition_by_identifier(DEFAULT_EDITION_IDENTIFIER)
+    if isinstance(edition, str):
+        return None
+    result = await session.execute(
+        statement("ayah_reference_by_number"),
+        {"number": reference, "edition_id": edition.id}
+    )
+    result = result.first()
+    return (result.surat_id, result.numberinsurat) if result else None
+
+
+async def get_ayah_range_bounds(from_reference, to_reference, edition_identifiers: list):
+    """
+    Resolve an ayah range to global ayah number bounds for each edition.
+
+    References are global ayah numbers or surah:ayah in Hafs numbering. For
+    editions of other narrations, the bounds are mapped through the
+    narrations numbering table so the range covers the same ayahs.
+
+    Returns:
+        list: (edition, text_edition_id, start_number, end_number) per edition.
+        str: An error message otherwise.
+    """
+    try:
+        start_reference = parse_ayah_reference(from_reference)
+        end_reference = parse_ayah_reference(to_reference)
+        if start_reference is None or end_reference is None:
+            return "Invalid reference format."
+
+        bounds = []
+        async with AsyncSessionLocal() as session:
+            for identifier in edition_identifiers:
+                edition = await get_edition_by_identifier(identifier)
+                if isinstance(edition, str):
+                    return edition
+                elif isinstance(edition, list):
+                    edition = edition[0] if edition[0].type == "versebyverse" else edition[1]
+
+                # Bounds are mapped into the numbering of the edition that is queried
+                text_edition = edition
+                if edition.format == "audio":
+                    text_edition = await get_text_edition_for_audio(edition)
+                    if isinstance(text_edition, str):
+                        return text_edition
+                edition_id = text_edition.id
+
+                edition_start, edition_end = start_reference, end_reference
+                narrator_id = text_edition.identifier
+                if narrator_id and narrator_id != "quran-hafs" and hasattr(NarrationsNumbering, narrator_id.replace('-', '_')):
+                    hafs_start = await _get_hafs_reference(session, start_reference)
+                    hafs_end = await _get_hafs_reference(session, end_reference)
+                    if not hafs_start or not hafs_end:
+                        return "Ayah not found."
+                    start_numbers = await get_narration_numbering_from_narration(hafs_start[0], hafs_start[1], "quran-hafs", narrator_id)
+                    end_numbers = await get_narration_numbering_from_narration(hafs_end[0], hafs_end[1], "quran-hafs", narrator_id)
+                    if not start_numbers or not end_numbers:
+                        return "Ayah not found."
+                    edition_start = (hafs_start[0], min(start_numbers))
+                    edition_end = (hafs_end[0], max(end_numbers))
+
+                start = await _get_ayah_number(session, edition_id, edition_start)
+                end = await _get_ayah_number(session, edition_id, edition_end)
+                if not start or not end:
+                    return "Ayah not found."
+                if start > end:
+                    return "Invalid range: the first ayah comes after the last ayah."
+                bounds.append((edition, edition_id, start, end))
+
+        return bounds
+
+    except Exception as e:
+        logger.error("An exception occurred while resolving Ayah range: %s", str(e))
+        return "An error occurred while fetching this Ayah range."
+
+
+async def iter_ayah_range(edition, edition_id: int, start: int, end: int):
+    """
+    Yield lists of formatted ayahs with number BETWEEN start AND end, read
+    with a server-side cursor so large ranges are never held in memory.
+    """
+    query = select_ayah_rows().filter(
+        Ayat.edition_id == edition_id,
+        Ayat.number.between(start, end)
+    ).order_by(Ayat.number).execution_options(yield_per=AYAH_RANGE_CHUNK_SIZE)
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(query)
+        async for partition in result.partitions():
+            yield [format_ayah(item, edition) for item in partition]
+
+
+async def get_ayah_range(bounds: list):
+    """
+    Fetch the ayahs of a resolved range, one list per edition.
+
+    Returns:
+        list: Lists of ayahs in the order of the editions.
+        str: An error message otherwise.
+    """
+    try:
+        data = []
+        for edition, edition_id, start, end in bounds:
+            ayahs = []
+            async for chunk in iter_ayah_range(edition, edition_id, start, end):
+                ayahs.extend(chunk)
+            data.append(ayahs)
+        return data
+
+    except Exception as e:
+        logger.error("An exception occurred while fetching Ayah range: %s", str(e))
+        return "An error occurred while fetching this Ayah range."
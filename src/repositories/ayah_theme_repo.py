@@ -1,7 +1,15 @@
-from sqlalchemy import select
-from db.models import QuranTheme, QuranAyahTheme, Ayat, Surat
+import asyncio
+from bisect import bisect_right
+from sqlalchemy import select, tuple_
+from db.models import QuranTheme, QuranAyahTheme, Ayat, Surat, NarrationsNumbering
 from db.session import AsyncSessionLocal
 from typing import List, Optional
+from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
+from repositories.division_repo import get_edition_divisions
+from repositories.narrations_numbering_repo import get_hafs_numbering_map
+from utils.config import DEFAULT_EDITION_IDENTIFIER
+from utils.logger import logger
+from utils.dataset import register_data_store
 
 # Canonical repo pattern for ayah theme feature
 
@@ -50,3 +58,232 @@ async def get_themes_for_ayah(surat_id: int, numberinsurat: int, limit: int = 20
             .limit(limit).offset(offset)
         )
         return result.scalars().all()
+
+
+class ThemeIndex:
+    """
+    Inverted index of the ayah themes: for each theme, the sorted global
+    numbers of its ayahs. Ayahs are numbered in the standard (Hafs) order
+    the theme data is recorded in, so set operations across themes need
+    no joins.
+    """
+
+    def __init__(self, themes, links, surah_lengths):
+        # surah_first_ayah[s] is the global number of ayah 1 of surah s
+        self.surah_first_ayah = [0, 1]
+        for length in surah_lengths:
+            self.surah_first_ayah.append(self.surah_first_ayah[-1] + length)
+
+        self.themes = {theme.theme_id: theme for theme in themes}
+        self.keywords = {}
+        for theme in themes:
+            for keyword in theme.keywords or ():
+                self.keywords.setdefault(keyword.lower(), []).append(theme.theme_id)
+
+        postings = {theme_id: set() for theme_id in self.themes}
+        for link in links:
+            number = self.ayah_number(link.surat_id, link.numberinsurat)
+            if number is not None and link.theme_id in postings:
+                postings[link.theme_id].add(number)
+        self.postings = {theme_id: sorted(numbers) for theme_id, numbers in postings.items()}
+
+    def ayah_number(self, surah: int, number_in_surah: int):
+        """Global number of an ayah, or None if it is out of range."""
+        if not 1 <= surah < len(self.surah_first_ayah) - 1:
+            return None
+        number = self.surah_first_ayah[surah] + number_in_surah - 1
+        if not self.surah_first_ayah[surah] <= number < self.surah_first_ayah[surah + 1]:
+            return None
+        return number
+
+    def surah_ayah(self, number: int):
+        """(surah, numberInSurah) of a global ayah number."""
+        surah = bisect_right(self.surah_first_ayah, number) - 1
+        return surah, number - self.surah_first_ayah[surah] + 1
+
+    def surah_bounds(self, surah: int):
+        return self.surah_first_ayah[surah], self.surah_first_ayah[surah + 1] - 1
+
+    def themes_for_keyword(self, keyword: str):
+        """Themes tagged with a keyword, case-insensitively, in theme order."""
+        return [self.themes[theme_id] for theme_id in sorted(self.keywords.get(keyword.strip().lower(), ()))]
+
+    def query(self, all_of=(), any_of=None, none_of=(), bounds=None):
+        """
+        Global ayah numbers of the ayahs in every theme of all_of, in at least
+        one theme of any_of (unless it is None) and in no theme of none_of,
+        optionally limited to the (first, last) ayah bounds, in order.
+        """
+        groups = [set(self.postings.get(theme_id, ())) for theme_id in all_of]
+        if any_of is not None:
+            groups.append(set().union(*(self.postings.get(theme_id, ()) for theme_id in any_of)))
+        if not groups:
+            return []
+        numbers = set.intersection(*groups)
+        for theme_id in none_of:
+            numbers.difference_update(self.postings.get(theme_id, ()))
+        if bounds is not None:
+            first, last = bounds
+            numbers = {number for number in numbers if first <= number <= last}
+        return sorted(numbers)
+
+
+_theme_index = None
+_theme_index_lock = asyncio.Lock()
+
+
+async def get_theme_index() -> ThemeIndex:
+    """Load the theme index once and keep it in memory."""
+    global _theme_index
+    if _theme_index is not None:
+        return _theme_index
+    async with _theme_index_lock:
+        if _theme_index is None:
+            async with AsyncSessionLocal() as session:
+                themes = (await session.execute(select(QuranTheme).order_by(QuranTheme.theme_id))).scalars().all()
+                links = (await session.execute(
+                    select(QuranAyahTheme.theme_id, QuranAyahTheme.surat_id, QuranAyahTheme.numberinsurat)
+                )).all()
+                surah_lengths = (await session.execute(select(Surat.numberofayats).order_by(Surat.id))).scalars().all()
+            _theme_index = ThemeIndex(themes, links, surah_lengths)
+            logger.info(f"Theme index built with {len(themes)} themes and {len(links)} ayah links.")
+    return _theme_index
+
+
+@register_data_store("quran_theme", "quran_ayah_theme", "surat")
+def clear_theme_index():
+    """Drop the theme index so it is rebuilt on next use."""
+    global _theme_index
+    _theme_index = None
+
+
+async def get_themes_by_keyword(keyword: str) -> List[QuranTheme]:
+    index = await get_theme_index()
+    return index.themes_for_keyword(keyword)
+
+
+async def query_theme_ayahs(
+    edition_identifier: str = DEFAULT_EDITION_IDENTIFIER,
+    all_of: List[int] = (),
+    any_of: List[int] = (),
+    none_of: List[int] = (),
+    keywords: List[str] = (),
+    surah: Optional[int] = None,
+    juz: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0
+):
+    """
+    Ayahs matching a combination of themes: in all themes of all_of, in at
+    least one theme of any_of or tagged with one of the keywords, and in none
+    of none_of, optionally within a surah or juz. The matching ayahs are
+    found on the theme index and the requested page is hydrated from the
+    edition in one query. The index is in Hafs numbering: for editions of
+    other narrations the page is mapped through the narrations numbering
+    table, and `total` counts the matching ayahs in Hafs numbering.
+
+    Returns:
+        dict: total number of matching ayahs and the ayahs of the page.
+        str: An error message otherwise.
+    """
+    try:
+        if not all_of and not any_of and not keywords:
+            return "At least one theme or keyword to match is required"
+
+        index = await get_theme_index()
+        any_group = None
+        if any_of or keywords:
+            any_group = list(any_of)
+            for keyword in keywords:
+                any_group.extend(theme.theme_id for theme in index.themes_for_keyword(keyword))
+
+        edition = await get_edition_by_identifier(edition_identifier)
+        if isinstance(edition, str):
+            return edition
+        elif isinstance(edition, list):
+            edition = edition[0] if edition[0].type == "versebyverse" else edition[1]
+
+        edition_id = edition.id
+        text_identifier = edition.identifier
+        if edition.format == "audio":
+            # Get text edition for the same narrator_identifier
+            if edition.narrator_identifier:
+                text_edition = await get_text_edition_for_narrator(edition.narrator_identifier)
+            else:
+                text_edition = await get_edition_by_identifier(DEFAULT_EDITION_IDENTIFIER)
+
+            if isinstance(text_edition, str):
+                return text_edition
+            edition_id = text_edition.id
+            text_identifier = text_edition.identifier
+
+        bounds = None
+        if surah is not None:
+            if not 1 <= surah < len(index.surah_first_ayah) - 1:
+                return "Surah not found"
+            bounds = index.surah_bounds(surah)
+        if juz is not None:
+            # Juz boundaries of the standard numbering the themes are recorded in
+            default_edition = await get_edition_by_identifier(DEFAULT_EDITION_IDENTIFIER)
+            if isinstance(default_edition, str):
+                return default_edition
+            juz_bounds = (await get_edition_divisions(default_edition.id))["juz"].bounds(juz)
+            if juz_bounds is None:
+                return "Juz not found"
+            bounds = juz_bounds if bounds is None else (max(bounds[0], juz_bounds[0]), min(bounds[1], juz_bounds[1]))
+
+        numbers = index.query(all_of, any_group, none_of, bounds)
+        page = [index.surah_ayah(number) for number in numbers[offset:offset + limit]]
+
+        # The index is in Hafs numbering; other narrations number some ayahs differently
+        if page and text_identifier != "quran-hafs" and hasattr(NarrationsNumbering, text_identifier.replace('-', '_')):
+            numbering = await get_hafs_numbering_map([surah for surah, _ in page], text_identifier)
+            page = list(dict.fromkeys(
+                (surah, narration_ayah)
+                for surah, ayah in page
+                for narration_ayah in numbering.get((surah, ayah)) or [ayah]
+            ))
+
+        ayahs = []
+        if page:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(
+                        Ayat.number,
+                        Ayat.text,
+                        Ayat.numberinsurat,
+                        Surat.id,
+                        Surat.name,
+                        Surat.englishname,
+                        Surat.englishtranslation,
+                        Surat.revelationcity,
+                        Surat.numberofayats
+                    ).join(Surat, Ayat.surat_id == Surat.id).filter(
+                        Ayat.edition_id == edition_id,
+                        tuple_(Ayat.surat_id, Ayat.numberinsurat).in_(page)
+                    )
+                )
+                rows = {(item.id, item.numberinsurat): item for item in result.all()}
+            for key in page:
+                item = rows.get(key)
+                if item is None:
+                    continue
+                ayahs.append({
+                    "number": item.number,
+                    "text": item.text,
+                    "numberInSurah": item.numberinsurat,
+                    "surah": {
+                        "number": item.id,
+                        "name": item.name,
+                        "englishName": item.englishname,
+                        "englishNameTranslation": item.englishtranslation,
+                        "revelationType": item.revelationcity,
+                        "numberOfAyahs": item.numberofayats
+                    }
+                })
+
+        return {"total": len(numbers), "ayahs": ayahs}
+
+    except Exception as e:
+        logger.error("An exception occurred while querying theme ayahs: %s", str(e))
+        return "An error occurred while querying theme ayahs."
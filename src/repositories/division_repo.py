@@ -0,0 +1,211 @@
+import asyncio
+from bisect import bisect_left, bisect_right
+from sqlalchemy import bindparam
+from sqlalchemy.future import select
+from db.models import Ayat, Surat
+from db.session import AsyncSessionLocal
+from db.statements import register_statement, statement
+from utils.logger import logger
+from utils.dataset import register_data_store
+
+# Ayah columns of the divisions of the Quran. A new division only needs an
+# entry here to get boundary lookups, range filters and first-ayah metadata.
+DIVISION_COLUMNS = {
+    "juz": Ayat.juz_id,
+    "hizb": Ayat.hizb_id,
+    "hizbQuarter": Ayat.hizbquarter_id,
+    "manzil": Ayat.manzil_id,
+    "ruku": Ayat.ruku_id,
+    "page": Ayat.page_id,
+    "sajda": Ayat.sajda_id,
+}
+
+
+class DivisionBoundaries:
+    """
+    Boundaries of one division of an edition as sorted arrays of global ayah
+    numbers: division ids[i] spans ayahs starts[i]..ends[i]. A division whose
+    ayahs are not consecutive (e.g. sajdas) keeps its ayah numbers instead.
+    """
+
+    def __init__(self, spans):
+        # spans: division id -> sorted list of ayah numbers
+        ordered = sorted(spans.items(), key=lambda item: item[1][0])
+        self.ids = [division_id for division_id, _ in ordered]
+        self.starts = [numbers[0] for _, numbers in ordered]
+        self.ends = [numbers[-1] for _, numbers in ordered]
+        self.positions = {division_id: index for index, division_id in enumerate(self.ids)}
+        self.scattered = {
+            division_id: numbers
+            for division_id, numbers in ordered
+            if len(numbers) != numbers[-1] - numbers[0] + 1
+        }
+        self.ends_sorted = all(self.ends[index] <= self.ends[index + 1] for index in range(len(self.ends) - 1))
+        self.first_ayahs = None
+
+    def bounds(self, division_id: int):
+        """(first, last) global ayah numbers of a division, or None if unknown."""
+        index = self.positions.get(division_id)
+        if index is None:
+            return None
+        return self.starts[index], self.ends[index]
+
+    def overlapping(self, start: int, end: int):
+        """Ids of the divisions that contain any ayah in start..end, in order."""
+        first = bisect_left(self.ends, start) if self.ends_sorted else 0
+        last = bisect_right(self.starts, end)
+        return [self.ids[index] for index in range(first, last) if self.ends[index] >= start]
+
+    def ayah_numbers(self):
+        """Global numbers of all ayahs that belong to any division, in order."""
+        numbers = []
+        for division_id, start, end in zip(self.ids, self.starts, self.ends):
+            numbers.extend(self.scattered.get(division_id) or range(start, end + 1))
+        return sorted(numbers)
+
+
+class EditionDivisions:
+    """All division boundaries of one edition, built from a single scan."""
+
+    def __init__(self, rows):
+        spans = {name: {} for name in DIVISION_COLUMNS}
+        for row in rows:
+            for name, column in DIVISION_COLUMNS.items():
+                division_id = getattr(row, column.key)
+                if division_id is not None:
+                    spans[name].setdefault(division_id, []).append(row.number)
+        self.divisions = {name: DivisionBoundaries(division_spans) for name, division_spans in spans.items()}
+
+    def __getitem__(self, name: str) -> DivisionBoundaries:
+        return self.divisions[name]
+
+
+_edition_divisions = {}
+_edition_divisions_lock = asyncio.Lock()
+
+
+async def get_edition_divisions(edition_id: int) -> EditionDivisions:
+    """Load the division boundaries of an edition once and keep them in memory."""
+    divisions = _edition_divisions.get(edition_id)
+    if divisions is not None:
+        return divisions
+    async with _edition_divisions_lock:
+        divisions = _edition_divisions.get(edition_id)
+        if divisions is None:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(Ayat.number, *DIVISION_COLUMNS.values())
+                    .filter(Ayat.edition_id == edition_id)
+                    .order_by(Ayat.number)
+                )
+                divisions = EditionDivisions(result.all())
+            _edition_divisions[edition_id] = divisions
+    return divisions
+
+
+@register_data_store("ayat")
+def clear_edition_divisions(edition_id: int = None):
+    """Drop the cached division boundaries of an edition, or of all editions."""
+    if edition_id is None:
+        _edition_divisions.clear()
+    else:
+        _edition_divisions.pop(edition_id, None)
+
+
+@register_statement("division_ayahs")
+def _division_ayahs(division: str, by_column: bool, columns):
+    if by_column:
+        division_clause = DIVISION_COLUMNS[division] == bindparam("division_id")
+    else:
+        division_clause = Ayat.number.between(bindparam("first"), bindparam("last"))
+    return (
+        select(*columns)
+        .join(Surat, Ayat.surat_id == Surat.id)
+        .filter(division_clause, Ayat.edition_id == bindparam("edition_id"))
+        .order_by(Ayat.number)
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+
+
+async def division_ayahs_query(edition_id: int, division: str, division_id: int, columns, limit: int, offset: int):
+    """
+    Registered statement and parameters selecting `columns` (Ayat joined
+    with Surat) for the ayahs of one division of an edition, in order. A
+    range scan on the global ayah number when the division is consecutive,
+    and the division column otherwise.
+
+    Returns:
+        tuple: (statement, parameters) for session.execute.
+    """
+    boundaries = (await get_edition_divisions(edition_id))[division]
+    bounds = boundaries.bounds(division_id)
+    params = {"edition_id": edition_id, "limit": limit, "offset": offset}
+    if bounds is None or division_id in boundaries.scattered:
+        return statement("division_ayahs", division, True, tuple(columns)), {**params, "division_id": division_id}
+    return statement("division_ayahs", division, False, tuple(columns)), {**params, "first": bounds[0], "last": bounds[1]}
+
+
+async def any_division_filter(edition_id: int, division: str):
+    """Filter on Ayat selecting the ayahs that belong to any division, e.g. all sajdas."""
+    boundaries = (await get_edition_divisions(edition_id))[division]
+    return Ayat.number.in_(boundaries.ayah_numbers())
+
+
+async def get_division_first_ayahs(edition_id: int, division: str):
+    """
+    Metadata of the first ayah of every division of an edition, in division
+    order, built once from one query on the first ayah numbers.
+
+    Returns:
+        list: Dicts with number, firstPage, firstAyah and firstSurah.
+    """
+    boundaries = (await get_edition_divisions(edition_id))[division]
+    if boundaries.first_ayahs is not None:
+        return boundaries.first_ayahs
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(
+                Ayat.number,
+                Ayat.text,
+                Ayat.numberinsurat,
+                Ayat.page_id,
+                Surat.id,
+                Surat.name,
+                Surat.englishname,
+                Surat.englishtranslation,
+                Surat.revelationcity,
+                Surat.numberofayats
+            ).join(Surat, Ayat.surat_id == Surat.id).filter(
+                Ayat.edition_id == edition_id,
+                Ayat.number.in_(boundaries.starts)
+            )
+        )
+        rows = {item.number: item for item in result.all()}
+
+    first_ayahs = []
+    for division_id in sorted(boundaries.ids):
+        item = rows.get(boundaries.starts[boundaries.positions[division_id]])
+        if item is None:
+            logger.warning("First ayah of %s %s not found for edition %s.", division, division_id, edition_id)
+            continue
+        first_ayahs.append({
+            "number": division_id,
+            "firstPage": item.page_id,
+            "firstAyah": {
+                "number": item.number,
+                "text": item.text,
+                "numberInSurah": item.numberinsurat,
+            },
+            "firstSurah": {
+                "number": item.id,
+                "name": item.name,
+                "englishName": item.englishname,
+                "englishNameTranslation": item.englishtranslation,
+                "revelationType": item.revelationcity,
+                "numberOfAyahs": item.numberofayats
+            }
+        })
+    boundaries.first_ayahs = first_ayahs
+    return first_ayahs
@@ -1,11 +1,14 @@
 
 # Canonical: Get tafsir edition by identifier (matches get_distinct_audio_edition_by_identifier pattern)
-from sqlalchemy import select
+import asyncio
+import time
+from sqlalchemy import select, func
 from sqlalchemy.exc import SQLAlchemyError
 from db.session import AsyncSessionLocal
 from db.models import Edition  # Assuming Edition is in a models module
 from utils.logger import logger  # Assuming you have a logger module
-from utils.config import TAFSIR_BOOKS_TRANSLATION, TAFSIR_BOOKS_LANGUAGES, TAFSIR_BOOKS_LEVELS, DEFAULT_EDITION_IDENTIFIER
+from utils.config import TAFSIR_BOOKS_TRANSLATION, TAFSIR_BOOKS_LANGUAGES, TAFSIR_BOOKS_LEVELS, DEFAULT_EDITION_IDENTIFIER, EDITION_ANALYSIS_PROBE_INTERVAL, EDITION_CATALOG_PROBE_INTERVAL
+from utils.dataset import get_dataset_version, register_data_store
 from sqlalchemy.orm import selectinload
 
 async def get_text_edition_for_narrator(narrator_identifier):
@@ -34,6 +37,13 @@ async def get_text_edition_for_narrator(narrator_identifier):
         logger.error(f"Error fetching text edition for identifier {narrator_identifier}: {str(e)}")
         return await get_edition_by_identifier(DEFAULT_EDITION_IDENTIFIER)
 
+async def get_text_edition_for_audio(edition):
+    """
+    Get the text edition an audio edition's ayahs are read from: the text
+    edition of its narrator_identifier, or the default edition.
+    """
+    return await get_text_edition_for_narrator(edition.narrator_identifier or DEFAULT_EDITION_IDENTIFIER)
+
 async def get_editions_types():
     try:
         async with AsyncSessionLocal() as session:
@@ -195,36 +205,131 @@ def _format_tafsir_edition(item):
     }
 
 
-async def get_edition(language=None, type=None, format=None, narrator=None):
-    try:
-        async with AsyncSessionLocal() as session:
-            query = select(Edition).options(
-                selectinload(Edition.reciter),
-                selectinload(Edition.tafsir)  # newly added
-            )
+class EditionCatalog:
+    """
+    All editions with their response objects formatted once, indexed by
+    language, type, format and narrator identifier, and the Edition objects
+    by identifier. A catalog is never modified after it is built; a refresh
+    builds a new one and swaps it in.
+    """
 
-            if language:
-                query = query.filter(Edition.language == language)
-            if type:
-                query = query.filter(Edition.type == type)
-            if format:
-                query = query.filter(Edition.format == format)
-            if narrator:
-                query = query.filter(Edition.narrator_identifier == narrator)
+    def __init__(self, editions, audio_order):
+        self.formatted = []
+        self.indexes = {"language": {}, "type": {}, "format": {}, "narrator": {}}
+        self.by_identifier = {}
+        for position, item in enumerate(editions):
+            self.by_identifier.setdefault(item.identifier, []).append(item)
+            # Each listing uses the tafsir shape when filtered on tafsirs and
+            # the audio shape when filtered on audio, as get_edition does
+            self.formatted.append({
+                "default": _format_default_edition(item),
+                "audio": _format_audio_edition(item) if item.format == "audio" else None,
+                "tafsir": _format_tafsir_edition(item) if item.type == "tafsir" else None,
+            })
+            for name, value in (("language", item.language), ("type", item.type), ("format", item.format), ("narrator", item.narrator_identifier)):
+                self.indexes[name].setdefault(value, []).append(position)
+        self.listings = {}
+
+        # Distinct audio editions by englishname, in the database collation order
+        positions = {item.id: position for position, item in enumerate(editions)}
+        unique = {}
+        for edition_id in audio_order:
+            item = editions[positions[edition_id]]
+            if item.englishname not in unique:
+                formatted = dict(self.formatted[positions[edition_id]]["audio"])
+                # Remove identifier, type, narratorIdentifier
+                formatted.pop("identifier", None)
+                formatted.pop("type", None)
+                formatted.pop("narratorIdentifier", None)
+                unique[item.englishname] = formatted
+        self.distinct_audio = list(unique.values())
 
-            result = await session.execute(query)
-            result = result.scalars().all()
+    def listing(self, language=None, type=None, format=None, narrator=None):
+        """Formatted editions matching the filters, in catalog order."""
+        key = (language, type, format, narrator)
+        listing = self.listings.get(key)
+        if listing is not None:
+            return listing
+
+        positions = None
+        for name, value in (("language", language), ("type", type), ("format", format), ("narrator", narrator)):
+            if value:
+                matches = self.indexes[name].get(value, ())
+                positions = set(matches) if positions is None else positions.intersection(matches)
+        positions = range(len(self.formatted)) if positions is None else sorted(positions)
+
+        shape = "tafsir" if type == "tafsir" else "audio" if format == "audio" else "default"
+        listing = [self.formatted[position][shape] for position in positions]
+        # Only listings that exist are kept, so arbitrary filter values cannot grow the catalog
+        if listing:
+            self.listings[key] = listing
+        return listing
 
-        if not result:
-            return "Edition not found"
 
-        if type == "tafsir":
-            return [_format_tafsir_edition(item) for item in result]
+_edition_catalog = {"stamp": None, "checked_at": 0.0, "catalog": None}
+_edition_catalog_lock = asyncio.Lock()
 
-        if format == "audio":
-            return [_format_audio_edition(item) for item in result]
 
-        return [_format_default_edition(item) for item in result]
+async def _probe_editions(session):
+    """
+    Cheap change stamp of the edition table: the dataset version, row count,
+    max id and last update. Changes to reciters and tafsirs only show up
+    through the dataset version.
+    """
+    row = (await session.execute(
+        select(func.count(Edition.id), func.max(Edition.id), func.max(Edition.lastupdated))
+    )).one()
+    return (get_dataset_version(), row[0], row[1], row[2])
+
+
+async def get_edition_catalog() -> EditionCatalog:
+    """
+    The edition catalog, built once and kept in memory. The edition table is
+    probed at most every EDITION_CATALOG_PROBE_INTERVAL seconds and the
+    catalog is rebuilt and swapped in as a whole when editions changed.
+    """
+    if _edition_catalog["catalog"] is not None and time.monotonic() - _edition_catalog["checked_at"] < EDITION_CATALOG_PROBE_INTERVAL:
+        return _edition_catalog["catalog"]
+
+    async with _edition_catalog_lock:
+        if _edition_catalog["catalog"] is None or time.monotonic() - _edition_catalog["checked_at"] >= EDITION_CATALOG_PROBE_INTERVAL:
+            async with AsyncSessionLocal() as session:
+                stamp = await _probe_editions(session)
+                if stamp != _edition_catalog["stamp"]:
+                    result = await session.execute(
+                        select(Edition).options(
+                            selectinload(Edition.reciter),
+                            selectinload(Edition.tafsir)
+                        )
+                    )
+                    editions = result.scalars().all()
+                    result = await session.execute(
+                        select(Edition.id).filter(Edition.format == "audio").order_by(Edition.englishname)
+                    )
+                    catalog = EditionCatalog(editions, result.scalars().all())
+                    _edition_catalog["catalog"] = catalog
+                    _edition_catalog["stamp"] = stamp
+                    logger.info(f"Edition catalog built with {len(editions)} editions.")
+            _edition_catalog["checked_at"] = time.monotonic()
+
+    return _edition_catalog["catalog"]
+
+
+@register_data_store("edition", "reciter", "tafsir")
+def clear_edition_catalog():
+    """Drop the edition catalog so the next listing rebuilds it."""
+    _edition_catalog.update(stamp=None, checked_at=0.0, catalog=None)
+
+
+async def get_edition(language=None, type=None, format=None, narrator=None):
+    try:
+        catalog = await get_edition_catalog()
+        result = catalog.listing(language=language, type=type, format=format, narrator=narrator)
+
+        if not result:
+            return "Edition not found"
+
+        return result
 
     except Exception as e:
         logger.error("An exception occurred: %s", str(e))
@@ -324,227 +429,275 @@ async def get_distinct_audio_editions_by_englishname():
     Returns a list of distinct audio editions using englishname.
     """
     try:
-        async with AsyncSessionLocal() as session:
-            # Get all audio editions, eager load reciter, order by englishname
-            result = await session.execute(
-                select(Edition)
-                .options(selectinload(Edition.reciter))
-                .filter(Edition.format == "audio")
-                .order_by(Edition.englishname)
-            )
-            editions = result.scalars().all()
-
-        # Use a dict to ensure uniqueness by englishname (first occurrence after sorting)
-        unique = {}
-        for item in editions:
-            if item.englishname not in unique:
-                formatted = _format_audio_edition(item)
-                # Remove identifier, type, narratorIdentifier
-                formatted.pop("identifier", None)
-                formatted.pop("type", None)
-                formatted.pop("narratorIdentifier", None)
-                unique[item.englishname] = formatted
-
-        return list(unique.values())
+        catalog = await get_edition_catalog()
+        return catalog.distinct_audio
 
     except Exception as e:
         logger.error("An exception occurred: %s", str(e))
         return "An error occurred while fetching distinct audio editions."
 
-async def get_edition_analysis():
+# Edition columns the analysis is computed from
+EDITION_ANALYSIS_COLUMNS = (
+    Edition.id,
+    Edition.format,
+    Edition.type,
+    Edition.language,
+    Edition.narrator_identifier,
+    Edition.bitrates,
+    Edition.reciter_id
+)
+
+# Materialized analysis: the probe stamp it was built for, the edition rows
+# by id and the resulting statistics
+_edition_analysis = {"stamp": None, "checked_at": 0.0, "editions": {}, "analysis": None}
+_edition_analysis_lock = asyncio.Lock()
+
+
+def _analyze_editions(editions):
     """
-    Perform clean analysis of all editions in the database.
+    Compute the edition statistics from edition rows.
     Returns organized statistics with clear breakdowns by language, type, and format.
     """
-    try:
-        async with AsyncSessionLocal() as session:
-            # Load all editions with their relationships
-            result = await session.execute(
-                select(Edition).options(selectinload(Edition.reciter))
-            )
-            all_editions = result.scalars().all()
-
-            if not all_editions:
-                return {"error": "No editions found in database"}
-
-            # Initialize analysis structure
-            analysis = {
-                "overview": {
-                    "totalEditions": len(all_editions),
-                    "textEditions": 0,
-                    "audioEditions": 0,
-                    "totalAudioFiles": 0
-                },
-                "formats": {},
-                "types": {},
-                "languages": {},
-                "narrations": {},
-                "reciters": {
-                    "totalUniqueReciters": 0
-                },
-                "audioAnalysis": {
-                    "byLanguage": {},
-                    "byNarration": {},
-                    "bitrates": {
-                        "uniqueBitrates": 0,
-                        "availableBitrates": [],
-                        "statistics": {}
-                    }
-                }
+    # Initialize analysis structure
+    analysis = {
+        "overview": {
+            "totalEditions": len(editions),
+            "textEditions": 0,
+            "audioEditions": 0,
+            "totalAudioFiles": 0
+        },
+        "formats": {},
+        "types": {},
+        "languages": {},
+        "narrations": {},
+        "reciters": {
+            "totalUniqueReciters": 0
+        },
+        "audioAnalysis": {
+            "byLanguage": {},
+            "byNarration": {},
+            "bitrates": {
+                "uniqueBitrates": 0,
+                "availableBitrates": [],
+                "statistics": {}
             }
+        }
+    }
 
-            # Track unique values
-            all_bitrates = []
-            reciter_counts = {}
-            total_audio_files = 0  # New: sum of all audio files (per bitrate)
-
-            # Process each edition
-            for edition in all_editions:
-                format_type = edition.format or "unknown"
-                edition_type = edition.type or "unknown"
-                language = edition.language or "unknown"
-                narrator_id = edition.narrator_identifier
-
-                # Overview counts
-                if format_type == "text":
-                    analysis["overview"]["textEditions"] += 1
-                elif format_type == "audio":
-                    analysis["overview"]["audioEditions"] += 1
-
-                # Count formats
-                if format_type not in analysis["formats"]:
-                    analysis["formats"][format_type] = 0
-                analysis["formats"][format_type] += 1
-
-                # Count types
-                if edition_type not in analysis["types"]:
-                    analysis["types"][edition_type] = 0
-                analysis["types"][edition_type] += 1
-
-                # Enhanced language analysis with type breakdown
-                if language not in analysis["languages"]:
-                    analysis["languages"][language] = {
-                        "total": 0,
-                        "textEditions": 0,
-                        "audioEditions": 0,
-                        "textTypes": {},
-                        "audioTypes": {}
+    # Track unique values
+    all_bitrates = []
+    reciter_counts = {}
+    total_audio_files = 0  # New: sum of all audio files (per bitrate)
+
+    # Process each edition
+    for edition in editions:
+        format_type = edition.format or "unknown"
+        edition_type = edition.type or "unknown"
+        language = edition.language or "unknown"
+        narrator_id = edition.narrator_identifier
+
+        # Overview counts
+        if format_type == "text":
+            analysis["overview"]["textEditions"] += 1
+        elif format_type == "audio":
+            analysis["overview"]["audioEditions"] += 1
+
+        # Count formats
+        if format_type not in analysis["formats"]:
+            analysis["formats"][format_type] = 0
+        analysis["formats"][format_type] += 1
+
+        # Count types
+        if edition_type not in analysis["types"]:
+            analysis["types"][edition_type] = 0
+        analysis["types"][edition_type] += 1
+
+        # Enhanced language analysis with type breakdown
+        if language not in analysis["languages"]:
+            analysis["languages"][language] = {
+                "total": 0,
+                "textEditions": 0,
+                "audioEditions": 0,
+                "textTypes": {},
+                "audioTypes": {}
+            }
+        analysis["languages"][language]["total"] += 1
+
+        if format_type == "text":
+            analysis["languages"][language]["textEditions"] += 1
+            if edition_type not in analysis["languages"][language]["textTypes"]:
+                analysis["languages"][language]["textTypes"][edition_type] = 0
+            analysis["languages"][language]["textTypes"][edition_type] += 1
+
+        elif format_type == "audio":
+            analysis["languages"][language]["audioEditions"] += 1
+            if edition_type not in analysis["languages"][language]["audioTypes"]:
+                analysis["languages"][language]["audioTypes"][edition_type] = 0
+            analysis["languages"][language]["audioTypes"][edition_type] += 1
+
+        # Narrations analysis - each narration has 1 text edition and multiple audio editions
+        if narrator_id:
+            if narrator_id not in analysis["narrations"]:
+                analysis["narrations"][narrator_id] = {
+                    "totalEditions": 0,
+                    "textEditions": 1,  # Each narration has exactly 1 text edition
+                    "audioEditions": 0
+                }
+            analysis["narrations"][narrator_id]["totalEditions"] += 1
+            # Only count audio editions - text edition is always 1 per narration
+            if format_type == "audio":
+                analysis["narrations"][narrator_id]["audioEditions"] += 1
+
+        # Audio-specific analysis
+        if format_type == "audio":
+            # Count audio files for this edition (per bitrate)
+            if edition_type in ("surah", "versebyverse"):
+                num_bitrates = len(edition.bitrates) if edition.bitrates else 0
+                if edition_type == "surah":
+                    total_audio_files += num_bitrates * 114
+                elif edition_type == "versebyverse":
+                    total_audio_files += num_bitrates * 6236
+
+            # Audio by language
+            if language not in analysis["audioAnalysis"]["byLanguage"]:
+                analysis["audioAnalysis"]["byLanguage"][language] = {
+                    "editionCount": 0,
+                    "types": {},
+                    "uniqueNarrations": set()
+                }
+            analysis["audioAnalysis"]["byLanguage"][language]["editionCount"] += 1
+
+            if edition_type not in analysis["audioAnalysis"]["byLanguage"][language]["types"]:
+                analysis["audioAnalysis"]["byLanguage"][language]["types"][edition_type] = 0
+            analysis["audioAnalysis"]["byLanguage"][language]["types"][edition_type] += 1
+
+            if narrator_id:
+                analysis["audioAnalysis"]["byLanguage"][language]["uniqueNarrations"].add(narrator_id)
+
+            # Audio by narration
+            if narrator_id:
+                if narrator_id not in analysis["audioAnalysis"]["byNarration"]:
+                    analysis["audioAnalysis"]["byNarration"][narrator_id] = {
+                        "editionCount": 0,
+                        "languages": set(),
+                        "types": {}
                     }
-                analysis["languages"][language]["total"] += 1
-
-                if format_type == "text":
-                    analysis["languages"][language]["textEditions"] += 1
-                    if edition_type not in analysis["languages"][language]["textTypes"]:
-                        analysis["languages"][language]["textTypes"][edition_type] = 0
-                    analysis["languages"][language]["textTypes"][edition_type] += 1
-
-                elif format_type == "audio":
-                    analysis["languages"][language]["audioEditions"] += 1
-                    if edition_type not in analysis["languages"][language]["audioTypes"]:
-                        analysis["languages"][language]["audioTypes"][edition_type] = 0
-                    analysis["languages"][language]["audioTypes"][edition_type] += 1
-
-                # Narrations analysis - each narration has 1 text edition and multiple audio editions
-                if narrator_id:
-                    if narrator_id not in analysis["narrations"]:
-                        analysis["narrations"][narrator_id] = {
-                            "totalEditions": 0,
-                            "textEditions": 1,  # Each narration has exactly 1 text edition
-                            "audioEditions": 0
-                        }
-                    analysis["narrations"][narrator_id]["totalEditions"] += 1
-                    # Only count audio editions - text edition is always 1 per narration
-                    if format_type == "audio":
-                        analysis["narrations"][narrator_id]["audioEditions"] += 1
-
-                # Audio-specific analysis
-                if format_type == "audio":
-                    # Count audio files for this edition (per bitrate)
-                    if edition_type in ("surah", "versebyverse"):
-                        num_bitrates = len(edition.bitrates) if edition.bitrates else 0
-                        if edition_type == "surah":
-                            total_audio_files += num_bitrates * 114
-                        elif edition_type == "versebyverse":
-                            total_audio_files += num_bitrates * 6236
-
-                    # Audio by language
-                    if language not in analysis["audioAnalysis"]["byLanguage"]:
-                        analysis["audioAnalysis"]["byLanguage"][language] = {
-                            "editionCount": 0,
-                            "types": {},
-                            "uniqueNarrations": set()
-                        }
-                    analysis["audioAnalysis"]["byLanguage"][language]["editionCount"] += 1
-
-                    if edition_type not in analysis["audioAnalysis"]["byLanguage"][language]["types"]:
-                        analysis["audioAnalysis"]["byLanguage"][language]["types"][edition_type] = 0
-                    analysis["audioAnalysis"]["byLanguage"][language]["types"][edition_type] += 1
-
-                    if narrator_id:
-                        analysis["audioAnalysis"]["byLanguage"][language]["uniqueNarrations"].add(narrator_id)
-
-                    # Audio by narration
-                    if narrator_id:
-                        if narrator_id not in analysis["audioAnalysis"]["byNarration"]:
-                            analysis["audioAnalysis"]["byNarration"][narrator_id] = {
-                                "editionCount": 0,
-                                "languages": set(),
-                                "types": {}
-                            }
-                        analysis["audioAnalysis"]["byNarration"][narrator_id]["editionCount"] += 1
-                        analysis["audioAnalysis"]["byNarration"][narrator_id]["languages"].add(language)
-
-                        if edition_type not in analysis["audioAnalysis"]["byNarration"][narrator_id]["types"]:
-                            analysis["audioAnalysis"]["byNarration"][narrator_id]["types"][edition_type] = 0
-                        analysis["audioAnalysis"]["byNarration"][narrator_id]["types"][edition_type] += 1
-
-                    # Collect bitrates
-                    if edition.bitrates:
-                        for bitrate in edition.bitrates:
-                            all_bitrates.append(bitrate)
-
-                # Track reciters
-                if edition.reciter and edition.reciter.id:
-                    reciter_id = edition.reciter.id
-                    if reciter_id not in reciter_counts:
-                        reciter_counts[reciter_id] = 0
-                    reciter_counts[reciter_id] += 1
-
-
-            # Finalize analysis
-            # Convert sets to counts for JSON serialization
-            for lang_data in analysis["audioAnalysis"]["byLanguage"].values():
-                lang_data["uniqueNarrationsCount"] = len(lang_data["uniqueNarrations"])
-                del lang_data["uniqueNarrations"]
-
-            for narr_data in analysis["audioAnalysis"]["byNarration"].values():
-                narr_data["languageCount"] = len(narr_data["languages"])
-                del narr_data["languages"]
-
-            # Reciter analysis - simplified
-            analysis["reciters"]["totalUniqueReciters"] = len(reciter_counts)
-
-            # Calculate total audio files: sum of (num_bitrates * 114) for surah, (num_bitrates * 6236) for versebyverse
-            analysis["overview"]["totalAudioFiles"] = total_audio_files
-
-            # Bitrate analysis
-            unique_bitrates_list = sorted(list(set(all_bitrates))) if all_bitrates else []
-            analysis["audioAnalysis"]["bitrates"]["uniqueBitrates"] = len(unique_bitrates_list)
-            analysis["audioAnalysis"]["bitrates"]["availableBitrates"] = unique_bitrates_list
+                analysis["audioAnalysis"]["byNarration"][narrator_id]["editionCount"] += 1
+                analysis["audioAnalysis"]["byNarration"][narrator_id]["languages"].add(language)
+
+                if edition_type not in analysis["audioAnalysis"]["byNarration"][narrator_id]["types"]:
+                    analysis["audioAnalysis"]["byNarration"][narrator_id]["types"][edition_type] = 0
+                analysis["audioAnalysis"]["byNarration"][narrator_id]["types"][edition_type] += 1
+
+            # Collect bitrates
+            if edition.bitrates:
+                for bitrate in edition.bitrates:
+                    all_bitrates.append(bitrate)
+
+        # Track reciters
+        if edition.reciter_id:
+            reciter_id = edition.reciter_id
+            if reciter_id not in reciter_counts:
+                reciter_counts[reciter_id] = 0
+            reciter_counts[reciter_id] += 1
+
+
+    # Finalize analysis
+    # Convert sets to counts for JSON serialization
+    for lang_data in analysis["audioAnalysis"]["byLanguage"].values():
+        lang_data["uniqueNarrationsCount"] = len(lang_data["uniqueNarrations"])
+        del lang_data["uniqueNarrations"]
+
+    for narr_data in analysis["audioAnalysis"]["byNarration"].values():
+        narr_data["languageCount"] = len(narr_data["languages"])
+        del narr_data["languages"]
+
+    # Reciter analysis - simplified
+    analysis["reciters"]["totalUniqueReciters"] = len(reciter_counts)
+
+    # Calculate total audio files: sum of (num_bitrates * 114) for surah, (num_bitrates * 6236) for versebyverse
+    analysis["overview"]["totalAudioFiles"] = total_audio_files
+
+    # Bitrate analysis
+    unique_bitrates_list = sorted(list(set(all_bitrates))) if all_bitrates else []
+    analysis["audioAnalysis"]["bitrates"]["uniqueBitrates"] = len(unique_bitrates_list)
+    analysis["audioAnalysis"]["bitrates"]["availableBitrates"] = unique_bitrates_list
+
+    if all_bitrates:
+        analysis["audioAnalysis"]["bitrates"]["statistics"] = {
+            "average": round(sum(all_bitrates) / len(all_bitrates), 2),
+            "minimum": min(all_bitrates),
+            "maximum": max(all_bitrates)
+        }
 
-            if all_bitrates:
-                analysis["audioAnalysis"]["bitrates"]["statistics"] = {
-                    "average": round(sum(all_bitrates) / len(all_bitrates), 2),
-                    "minimum": min(all_bitrates),
-                    "maximum": max(all_bitrates)
-                }
+    return analysis
+
+
+async def _refresh_edition_analysis(session):
+    """
+    Bring the materialized analysis up to date with the edition table.
+
+    A cheap probe (dataset version, row count, max id, last update) decides
+    whether anything changed. When editions were only added, just the new
+    rows are loaded; any other change reloads all edition rows.
+    """
+    stamp = await _probe_editions(session)
+    previous = _edition_analysis["stamp"]
+    if stamp == previous:
+        return
+
+    editions = _edition_analysis["editions"]
+    new_rows = None
+    if previous is not None and previous[0] == stamp[0] and previous[3] == stamp[3] and previous[2] is not None and stamp[1] > previous[1]:
+        result = await session.execute(select(*EDITION_ANALYSIS_COLUMNS).filter(Edition.id > previous[2]))
+        new_rows = result.all()
+        # Any difference means rows were also removed, so fall back to a full reload
+        if len(new_rows) != stamp[1] - previous[1]:
+            new_rows = None
+
+    if new_rows is not None:
+        editions = {**editions, **{item.id: item for item in new_rows}}
+        logger.info(f"Edition analysis updated with {len(new_rows)} new editions.")
+    else:
+        result = await session.execute(select(*EDITION_ANALYSIS_COLUMNS))
+        editions = {item.id: item for item in result.all()}
+
+    _edition_analysis["editions"] = editions
+    _edition_analysis["analysis"] = _analyze_editions([editions[edition_id] for edition_id in sorted(editions)]) if editions else None
+    _edition_analysis["stamp"] = stamp
 
-            return analysis
+
+async def get_edition_analysis():
+    """
+    Statistics of all editions, materialized once and kept in memory. The
+    edition table is probed at most every EDITION_ANALYSIS_PROBE_INTERVAL
+    seconds and the analysis is only recomputed when editions changed.
+    """
+    try:
+        if _edition_analysis["analysis"] is not None and time.monotonic() - _edition_analysis["checked_at"] < EDITION_ANALYSIS_PROBE_INTERVAL:
+            return _edition_analysis["analysis"]
+
+        async with _edition_analysis_lock:
+            if _edition_analysis["analysis"] is None or time.monotonic() - _edition_analysis["checked_at"] >= EDITION_ANALYSIS_PROBE_INTERVAL:
+                async with AsyncSessionLocal() as session:
+                    await _refresh_edition_analysis(session)
+                _edition_analysis["checked_at"] = time.monotonic()
+
+        if _edition_analysis["analysis"] is None:
+            return {"error": "No editions found in database"}
+        return _edition_analysis["analysis"]
 
     except Exception as e:
         logger.error(f"Error in editions analysis: {str(e)}", exc_info=True)
         return {"error": "An error occurred while performing editions analysis."}
 
+
+@register_data_store("edition")
+def clear_edition_analysis():
+    """Drop the materialized analysis so it is recomputed on next use."""
+    _edition_analysis.update(stamp=None, checked_at=0.0, editions={}, analysis=None)
+
+
 async def get_tafsir_edition_by_identifier(edition_identifier: str):
     """
     Returns a single tafsir edition object (same shape as canonical tafsir edition response) for the given edition identifier.
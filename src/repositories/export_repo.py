@@ -0,0 +1,251 @@
+import csv
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+from sqlalchemy.future import select
+from db.models import Ayat
+from db.session import AsyncSessionLocal
+from utils.logger import logger
+from utils.cache import register_purge_handler
+from utils.dataset import get_dataset_version, register_data_store
+from utils.config import DEFAULT_EDITION_IDENTIFIER, EXPORT_CACHE_DIR, EXPORT_CHUNK_SIZE
+from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
+from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+EXPORT_COLUMNS = ["number", "surah", "numberInSurah", "juz", "manzil", "page", "ruku", "hizbQuarter", "hizb", "sajda", "text"]
+AUDIO_EXPORT_COLUMNS = ["audio", "audioSecondary"]
+
+
+async def get_export_edition(edition_identifier: str):
+    """
+    Resolve the edition to export and the edition id holding its ayah text.
+
+    Returns:
+        tuple: (edition, text_edition_id) when found.
+        str: An error message otherwise.
+    """
+    try:
+        edition = await get_edition_by_identifier(edition_identifier)
+        if isinstance(edition, str):
+            return edition
+        elif isinstance(edition, list):
+            edition = edition[0] if edition[0].type == "versebyverse" else edition[1]
+
+        edition_id = edition.id
+        if edition.format == "audio":
+            # Get text edition for the same narrator_identifier
+            if edition.narrator_identifier:
+                text_edition = await get_text_edition_for_narrator(edition.narrator_identifier)
+            else:
+                text_edition = await get_edition_by_identifier(DEFAULT_EDITION_IDENTIFIER)
+
+            if isinstance(text_edition, str):
+                return text_edition
+            edition_id = text_edition.id
+
+        return edition, edition_id
+
+    except Exception as e:
+        logger.error("An exception occurred while resolving export edition: %s", str(e))
+        return "An error occurred while fetching the edition."
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", name).lstrip(".")
+
+
+def _version_dir() -> str:
+    return os.path.join(EXPORT_CACHE_DIR, _safe_name(get_dataset_version()) or "_")
+
+
+def get_export_artifact_path(edition_identifier: str, export_format: str) -> str:
+    """
+    Location of the generated export artifact for an edition and format.
+    Artifacts are kept per dataset version, so a new version is exported afresh.
+    """
+    return os.path.join(_version_dir(), f"{_safe_name(edition_identifier)}.{export_format}")
+
+
+def _prune_export_artifacts():
+    """Remove the artifacts of other dataset versions."""
+    if not os.path.isdir(EXPORT_CACHE_DIR):
+        return
+    current = os.path.basename(_version_dir())
+    for name in os.listdir(EXPORT_CACHE_DIR):
+        path = os.path.join(EXPORT_CACHE_DIR, name)
+        if name != current and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+@register_data_store("ayat", "edition", "surat")
+def clear_export_artifacts():
+    """Remove every export artifact; they are regenerated on next request."""
+    shutil.rmtree(EXPORT_CACHE_DIR, ignore_errors=True)
+
+
+@register_purge_handler
+def _purge_export_artifacts(matches) -> int:
+    """Remove the artifacts whose Cache-Tag (export:{edition}:{format}) is purged."""
+    version_dir = _version_dir()
+    if not os.path.isdir(version_dir):
+        return 0
+    purged = 0
+    for name in os.listdir(version_dir):
+        identifier, _, export_format = name.rpartition(".")
+        if export_format in EXPORT_FORMATS and matches(f"export:{identifier}:{export_format}"):
+            try:
+                os.remove(os.path.join(version_dir, name))
+                purged += 1
+            except FileNotFoundError:
+                pass
+    return purged
+
+
+def _export_columns(edition):
+    if edition.format == "audio":
+        return EXPORT_COLUMNS + AUDIO_EXPORT_COLUMNS
+    return EXPORT_COLUMNS
+
+
+async def _iter_export_rows(edition, edition_id: int):
+    """
+    Yield lists of ayah rows for the edition using a server-side cursor,
+    so only one partition of rows is held in memory at a time.
+    """
+    query = select(
+        Ayat.number,
+        Ayat.surat_id,
+        Ayat.numberinsurat,
+        Ayat.juz_id,
+        Ayat.manzil_id,
+        Ayat.page_id,
+        Ayat.ruku_id,
+        Ayat.hizbquarter_id,
+        Ayat.hizb_id,
+        Ayat.sajda_id,
+        Ayat.text
+    ).filter(
+        Ayat.edition_id == edition_id
+    ).order_by(Ayat.number).execution_options(yield_per=EXPORT_CHUNK_SIZE)
+
+    if edition.format == "audio":
+        bitrates = edition.bitrates
+        max_bitrate = max(bitrates)
+        remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(query)
+        async for partition in result.partitions():
+            rows = []
+            for item in partition:
+                row = {
+                    "number": item.number,
+                    "surah": item.surat_id,
+                    "numberInSurah": item.numberinsurat,
+                    "juz": item.juz_id,
+                    "manzil": item.manzil_id,
+                    "page": item.page_id,
+                    "ruku": item.ruku_id,
+                    "hizbQuarter": item.hizbquarter_id,
+                    "hizb": item.hizb_id,
+                    "sajda": item.sajda_id if item.sajda_id else False,
+                    "text": item.text
+                }
+                if edition.format == "audio":
+                    row["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, item.number)
+                    row["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, item.number)
+                rows.append(row)
+            yield rows
+
+
+def _encode_ndjson(rows) -> bytes:
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode("utf-8")
+
+
+def _encode_csv(rows, columns, include_header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if include_header:
+        writer.writerow(columns)
+    for row in rows:
+        values = []
+        for column in columns:
+            value = row.get(column)
+            if isinstance(value, list):
+                value = " ".join(value)
+            values.append(value)
+        writer.writerow(values)
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream_export(edition, edition_id: int, export_format: str, artifact_path: str = None):
+    """
+    Stream the whole edition as NDJSON or CSV chunks.
+
+    When artifact_path is given, the streamed bytes are also written to a
+    temporary file which replaces the artifact once the stream completes,
+    so later requests (including Range/resume requests) are served from disk.
+    A failure is re-raised, so the response aborts instead of ending cleanly.
+    """
+    columns = _export_columns(edition)
+    spool = None
+    spool_path = None
+    try:
+        if artifact_path:
+            os.makedirs(os.path.dirname(artifact_path), exist_ok=True)
+            fd, spool_path = tempfile.mkstemp(dir=os.path.dirname(artifact_path), suffix=".part")
+            spool = os.fdopen(fd, "wb")
+
+        include_header = export_format == "csv"
+        async for rows in _iter_export_rows(edition, edition_id):
+            if export_format == "csv":
+                chunk = _encode_csv(rows, columns, include_header)
+                include_header = False
+            else:
+                chunk = _encode_ndjson(rows)
+            if spool:
+                spool.write(chunk)
+            yield chunk
+
+        if spool:
+            spool.close()
+            spool = None
+            try:
+                os.replace(spool_path, artifact_path)
+                spool_path = None
+                _prune_export_artifacts()
+            except OSError as e:
+                # The response is complete; only the artifact is lost (e.g. cleared meanwhile)
+                logger.warning("Could not store the export artifact of %s: %s", edition.identifier, str(e))
+
+    except Exception as e:
+        logger.error("An exception occurred while exporting edition %s: %s", edition.identifier, str(e), exc_info=True)
+        raise
+    finally:
+        if spool:
+            spool.close()
+        if spool_path and os.path.exists(spool_path):
+            os.remove(spool_path)
+
+
+async def build_export_artifact(edition, edition_id: int, export_format: str):
+    """
+    Generate the export artifact on disk without holding it in memory.
+
+    Returns:
+        str: The artifact path if generated, or None if the export failed.
+    """
+    artifact_path = get_export_artifact_path(edition.identifier, export_format)
+    try:
+        async for _ in stream_export(edition, edition_id, export_format, artifact_path):
+            pass
+    except Exception:
+        return None
+    return artifact_path if os.path.exists(artifact_path) else None
@@ -1,13 +1,12 @@
-from sqlalchemy.future import select
 from db.session import AsyncSessionLocal  # Assuming AsyncSessionLocal is defined for async sessions
 from utils.logger import logger
-from db.models import Ayat, Surat  # Assuming these are imported correctly
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
+from repositories.division_repo import division_ayahs_query
 from utils.config import DEFAULT_EDITION_IDENTIFIER
-from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
+from utils.fields import AYAH_FIELD_COLUMNS, ayah_columns, build_ayah, add_ayah_audio
 
 
-async def get_hizb_quarter(hizb_quarter_number: int, edition_identifier: str, limit: int, offset: int):
+async def get_hizb_quarter(hizb_quarter_number: int, edition_identifier: str, limit: int, offset: int, fields=None):
     try:
         # Retrieve the edition asynchronously
         edition = await get_edition_by_identifier(edition_identifier)
@@ -25,29 +24,9 @@ async def get_hizb_quarter(hizb_quarter_number: int, edition_identifier: str, li
 
         async with AsyncSessionLocal() as session:
             # Perform the query asynchronously
-            result = await session.execute(
-                select(
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.juz_id,
-                    Ayat.manzil_id,
-                    Ayat.page_id,
-                    Ayat.ruku_id,
-                    Ayat.hizbquarter_id,
-                    Ayat.sajda_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                ).join(Surat, Ayat.surat_id == Surat.id)
-                 .filter(Ayat.hizbquarter_id == hizb_quarter_number, Ayat.edition_id == edition_id)
-                 .order_by(Ayat.number)
-                 .limit(limit)
-                 .offset(offset)
-            )
+            result = await session.execute(*await division_ayahs_query(
+                edition_id, "hizbQuarter", hizb_quarter_number, ayah_columns(fields, *AYAH_FIELD_COLUMNS["surah"]), limit, offset
+            ))
             result = result.all()
 
         ayahs = []
@@ -56,25 +35,7 @@ async def get_hizb_quarter(hizb_quarter_number: int, edition_identifier: str, li
 
         # Process the result
         for item in result:
-            ayahs.append({
-                "number": item.number,
-                "text": item.text,
-                "surah": {
-                    "number": item.id,
-                    "name": item.name,
-                    "englishName": item.englishname,
-                    "englishNameTranslation": item.englishtranslation,
-                    "revelationType": item.revelationcity,
-                    "numberOfAyahs": item.numberofayats
-                },
-                "numberInSurah": item.numberinsurat,
-                "juz": item.juz_id,
-                "manzil": item.manzil_id,
-                "page": item.page_id,
-                "ruku": item.ruku_id,
-                "hizbQuarter": item.hizbquarter_id,
-                "sajda": item.sajda_id if item.sajda_id else False
-            })
+            ayahs.append(build_ayah(item, fields))
             if item.id not in surahs_ids:
                 surahs.append({
                     "number": item.id,
@@ -87,13 +48,7 @@ async def get_hizb_quarter(hizb_quarter_number: int, edition_identifier: str, li
                 surahs_ids.append(item.id)
 
         # Audio handling for audio editions
-        if edition.format == "audio":
-            bitrates = edition.bitrates
-            max_bitrate = max(bitrates)
-            remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-            for item in ayahs:
-                item["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, item["number"])
-                item["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, item["number"])
+        add_ayah_audio(ayahs, [item.number for item in result], edition, fields)
 
         # Prepare edition information
         edition_info = {
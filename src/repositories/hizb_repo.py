@@ -1,24 +1,19 @@
-from sqlalchemy.future import select
-from db.models import Ayat, Surat
 from db.session import AsyncSessionLocal
 from typing import List
 from utils.logger import logger
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
+from repositories.division_repo import division_ayahs_query, get_edition_divisions, get_division_first_ayahs
 from utils.config import DEFAULT_EDITION_IDENTIFIER
-from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
+from utils.fields import AYAH_FIELD_COLUMNS, HIZB_AYAH_LAYOUT, ayah_columns, build_ayah, add_ayah_audio
 
 async def get_hizb_numbers(page_number: int, edition_id: str) -> List[int]:
-    async with AsyncSessionLocal() as session:
-        result = await session.execute(
-            select(Ayat.hizb_id)
-            .filter(Ayat.edition_id == edition_id, Ayat.page_id == page_number)
-            .distinct()
-        )
-        distinct_hizb_ids = result.scalars().all()
-    
-    return distinct_hizb_ids
+    divisions = await get_edition_divisions(edition_id)
+    bounds = divisions["page"].bounds(page_number)
+    if bounds is None:
+        return []
+    return divisions["hizb"].overlapping(*bounds)
 
-async def get_hizb(hizb_number: int, edition_identifier: str, limit: int, offset: int):
+async def get_hizb(hizb_number: int, edition_identifier: str, limit: int, offset: int, fields=None, compact=False):
     try:
         # Retrieve the edition asynchronously
         edition = await get_edition_by_identifier(edition_identifier)
@@ -36,29 +31,9 @@ async def get_hizb(hizb_number: int, edition_identifier: str, limit: int, offset
 
         async with AsyncSessionLocal() as session:
             # Perform the query asynchronously
-            result = await session.execute(
-                select(
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.juz_id,
-                    Ayat.manzil_id,
-                    Ayat.page_id,
-                    Ayat.ruku_id,
-                    Ayat.hizb_id,
-                    Ayat.sajda_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                ).join(Surat, Ayat.surat_id == Surat.id)
-                 .filter(Ayat.hizb_id == hizb_number, Ayat.edition_id == edition_id)
-                 .order_by(Ayat.number)
-                 .limit(limit)
-                 .offset(offset)
-            )
+            result = await session.execute(*await division_ayahs_query(
+                edition_id, "hizb", hizb_number, ayah_columns(fields, *AYAH_FIELD_COLUMNS["surah"], layout=HIZB_AYAH_LAYOUT), limit, offset
+            ))
             result = result.all()
 
         ayahs = []
@@ -67,25 +42,7 @@ async def get_hizb(hizb_number: int, edition_identifier: str, limit: int, offset
 
         # Process the result
         for item in result:
-            ayahs.append({
-                "number": item.number,
-                "text": item.text,
-                "surah": {
-                    "number": item.id,
-                    "name": item.name,
-                    "englishName": item.englishname,
-                    "englishNameTranslation": item.englishtranslation,
-                    "revelationType": item.revelationcity,
-                    "numberOfAyahs": item.numberofayats
-                },
-                "numberInSurah": item.numberinsurat,
-                "juz": item.juz_id,
-                "manzil": item.manzil_id,
-                "page": item.page_id,
-                "ruku": item.ruku_id,
-                "hizb": item.hizb_id,
-                "sajda": item.sajda_id if item.sajda_id else False
-            })
+            ayahs.append(build_ayah(item, fields, layout=HIZB_AYAH_LAYOUT, compact=compact))
             if item.id not in surahs_ids:
                 surahs.append({
                     "number": item.id,
@@ -98,13 +55,7 @@ async def get_hizb(hizb_number: int, edition_identifier: str, limit: int, offset
                 surahs_ids.append(item.id)
 
         # Audio handling for audio editions
-        if edition.format == "audio":
-            bitrates = edition.bitrates
-            max_bitrate = max(bitrates)
-            remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-            for item in ayahs:
-                item["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, item["number"])
-                item["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, item["number"])
+        add_ayah_audio(ayahs, [item.number for item in result], edition, fields)
 
         # Prepare edition information
         edition_info = {
@@ -138,54 +89,8 @@ async def get_all_hizbs(edition_identifier=DEFAULT_EDITION_IDENTIFIER):
                 return text_edition
             edition_id = text_edition.id
             
-        hizbs_info = []
-
-        async with AsyncSessionLocal() as session:
-            # Query first ayah of each hizb in a single query
-            result = await session.execute(
-                select(
-                    Ayat.hizb_id,
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.page_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                    Ayat.edition_id == edition_id
-                ).order_by(Ayat.hizb_id, Ayat.number)
-            )
-
-            fetched_data = result.fetchall()
-            hizb_data_map = {}
-
-            # Process the fetched data to group by hizb_id
-            for item in fetched_data:
-                hizb_id = item.hizb_id
-                if hizb_id not in hizb_data_map:
-                    hizb_data_map[hizb_id] = {
-                        "number": hizb_id,
-                        "firstPage": item.page_id,
-                        "firstAyah": {
-                            "number": item.number,
-                            "text": item.text,
-                            "numberInSurah": item.numberinsurat,
-                        },
-                        "firstSurah": {
-                            "number": item.id,
-                            "name": item.name,
-                            "englishName": item.englishname,
-                            "englishNameTranslation": item.englishtranslation,
-                            "revelationType": item.revelationcity,
-                            "numberOfAyahs": item.numberofayats
-                        }
-                    }
-
-            hizbs_info = list(hizb_data_map.values())
+        # First ayah of each hizb from the division boundaries
+        hizbs_info = await get_division_first_ayahs(edition_id, "hizb")
 
         if not hizbs_info:
             return "No Hizbs found."
@@ -1,12 +1,13 @@
-from sqlalchemy.future import select
 from utils.logger import logger
+from utils.cache import cached
 from utils.config import DEFAULT_EDITION_IDENTIFIER
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
-from db.models import Ayat, Surat
-from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
+from repositories.division_repo import division_ayahs_query, get_division_first_ayahs
+from utils.fields import AYAH_FIELD_COLUMNS, ayah_columns, build_ayah, add_ayah_audio
 from db.session import AsyncSessionLocal  # Assuming AsyncSessionLocal is defined for async sessions
 
-async def get_juz(juz_number, edition_identifier, limit, offset):
+@cached("juz", tag=lambda juz_number, edition_identifier, *args, **kwargs: f"juz:{juz_number}:edition:{edition_identifier}")
+async def get_juz(juz_number, edition_identifier, limit, offset, fields=None, compact=False):
     try:
         edition = await get_edition_by_identifier(edition_identifier)
         if isinstance(edition, str):  # Error fetching edition
@@ -28,28 +29,9 @@ async def get_juz(juz_number, edition_identifier, limit, offset):
 
         # Query Ayahs and Surah metadata asynchronously
         async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.juz_id,
-                    Ayat.manzil_id,
-                    Ayat.page_id,
-                    Ayat.ruku_id,
-                    Ayat.hizbquarter_id,
-                    Ayat.sajda_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                    Ayat.juz_id == juz_number,
-                    Ayat.edition_id == edition_id
-                ).order_by(Ayat.number).limit(limit).offset(offset)
-            )
+            result = await session.execute(*await division_ayahs_query(
+                edition_id, "juz", juz_number, ayah_columns(fields, *AYAH_FIELD_COLUMNS["surah"]), limit, offset
+            ))
 
             result = result.fetchall()
 
@@ -58,25 +40,7 @@ async def get_juz(juz_number, edition_identifier, limit, offset):
 
             # Process the result
             for item in result:
-                ayah = {
-                    "number": item.number,
-                    "text": item.text,
-                    "surah": {
-                        "number": item.id,
-                        "name": item.name,
-                        "englishName": item.englishname,
-                        "englishNameTranslation": item.englishtranslation,
-                        "revelationType": item.revelationcity,
-                        "numberOfAyahs": item.numberofayats
-                    },
-                    "numberInSurah": item.numberinsurat,
-                    "juz": item.juz_id,
-                    "manzil": item.manzil_id,
-                    "page": item.page_id,
-                    "ruku": item.ruku_id,
-                    "hizbQuarter": item.hizbquarter_id,
-                    "sajda": item.sajda_id if item.sajda_id else False
-                }
+                ayah = build_ayah(item, fields, compact=compact)
                 results.append(ayah)
 
                 if item.id not in surahs_ids:
@@ -91,13 +55,7 @@ async def get_juz(juz_number, edition_identifier, limit, offset):
                     surahs_ids.append(item.id)
 
         # If edition format is audio, add audio URLs for the Ayahs
-        if edition.format == "audio":
-            bitrates = edition.bitrates
-            max_bitrate = max(bitrates)
-            remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-            for item in results:
-                item["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, item["number"])
-                item["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, item["number"])
+        add_ayah_audio(results, [item.number for item in result], edition, fields)
 
         edition_data = {
             "identifier": edition.identifier,
@@ -132,54 +90,8 @@ async def get_all_juzs(edition_identifier=DEFAULT_EDITION_IDENTIFIER):
                 return text_edition
             edition_id = text_edition.id
             
-        juzs_info = []
-
-        async with AsyncSessionLocal() as session:
-            # Query first ayah of each juz in a single query
-            result = await session.execute(
-                select(
-                    Ayat.juz_id,
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.page_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                    Ayat.edition_id == edition_id
-                ).order_by(Ayat.juz_id, Ayat.number)
-            )
-
-            fetched_data = result.fetchall()
-            juz_data_map = {}
-
-            # Process the fetched data to group by juz_id
-            for item in fetched_data:
-                juz_id = item.juz_id
-                if juz_id not in juz_data_map:
-                    juz_data_map[juz_id] = {
-                        "number": juz_id,
-                        "firstPage": item.page_id,
-                        "firstAyah": {
-                            "number": item.number,
-                            "text": item.text,
-                            "numberInSurah": item.numberinsurat,
-                        },
-                        "firstSurah": {
-                            "number": item.id,
-                            "name": item.name,
-                            "englishName": item.englishname,
-                            "englishNameTranslation": item.englishtranslation,
-                            "revelationType": item.revelationcity,
-                            "numberOfAyahs": item.numberofayats
-                        }
-                    }
-
-            juzs_info = list(juz_data_map.values())
+        # First ayah of each juz from the division boundaries
+        juzs_info = await get_division_first_ayahs(edition_id, "juz")
 
         if not juzs_info:
             return "No Juzs found."
@@ -12,10 +12,12 @@ from sqlalchemy.sql import func
 
 from db.models import Surat, Ayat, Edition
 from db.session import AsyncSessionLocal
+from db.statements import register_statement, statement
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
 from repositories.narrations_numbering_repo import get_narration_numbering_from_narration
 from utils.config import DEFAULT_EDITION_IDENTIFIER
 from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
+from utils.fields import build_ayah
 from utils.logger import logger
 
 
@@ -23,6 +25,125 @@ from utils.logger import logger
 CLEAN_ARABIC_EDITION_ID = 78  # quran-simple-clean edition for Arabic search
 
 
+@register_statement("search_exact")
+def _search_exact():
+    return text("""
+        SELECT DISTINCT a.surat_id, a.numberinsurat, a.number
+        FROM quranhub_schema.ayat a
+        WHERE a.edition_id = :search_edition_id
+        AND LOWER(a.text) LIKE LOWER(:search_pattern)
+        ORDER BY a.number
+        LIMIT :limit OFFSET :offset
+    """)
+
+
+@register_statement("search_fuzzy_arabic")
+def _search_fuzzy_arabic():
+    return text("""
+        WITH scored_results AS (
+            SELECT 
+                a.surat_id, 
+                a.numberinsurat, 
+                a.number,
+                a.text,
+                similarity(a.text, :normalized_keyword) as sim_score,
+                GREATEST(
+                    word_similarity(:normalized_keyword, a.text),
+                    word_similarity(a.text, :normalized_keyword)
+                ) as word_sim_score,
+                -- Enhanced relevance scoring
+                CASE 
+                    WHEN a.text ILIKE :search_pattern THEN 100
+                    WHEN word_similarity(:normalized_keyword, a.text) > 0.6 THEN 90
+                    WHEN similarity(a.text, :normalized_keyword) > 0.4 THEN 80
+                    WHEN word_similarity(:normalized_keyword, a.text) > 0.4 THEN 70
+                    WHEN similarity(a.text, :normalized_keyword) > 0.3 THEN 60
+                    ELSE 50
+                END as relevance_score
+            FROM quranhub_schema.ayat a
+            WHERE a.edition_id = :search_edition_id
+            AND (
+                -- Exact matches (highest priority) - no similarity threshold needed
+                a.text ILIKE :search_pattern
+                OR
+                -- Fuzzy matching for non-exact matches
+                (
+                    a.text NOT ILIKE :search_pattern
+                    AND (
+                        -- Higher thresholds for better precision
+                        similarity(a.text, :normalized_keyword) > 0.25
+                        OR
+                        word_similarity(:normalized_keyword, a.text) > 0.35
+                        OR
+                        -- More selective partial word matches
+                        (
+                            a.text % :normalized_keyword 
+                            AND word_similarity(:normalized_keyword, a.text) > 0.25
+                        )
+                    )
+                )
+            )
+            -- More lenient length filtering
+            AND LENGTH(:normalized_keyword) > 2
+        )
+        SELECT 
+            surat_id, numberinsurat, number, sim_score, word_sim_score, relevance_score
+        FROM scored_results
+        ORDER BY 
+            relevance_score DESC,
+            word_sim_score DESC,
+            sim_score DESC,
+            number ASC
+        LIMIT :limit OFFSET :offset
+    """)
+
+
+@register_statement("search_fuzzy")
+def _search_fuzzy():
+    return text("""
+        SELECT 
+            a.surat_id, 
+            a.numberinsurat, 
+            a.number,
+            similarity(LOWER(a.text), LOWER(:normalized_keyword)) as sim_score,
+            GREATEST(
+                word_similarity(LOWER(:normalized_keyword), LOWER(a.text)),
+                word_similarity(LOWER(a.text), LOWER(:normalized_keyword))
+            ) as word_sim_score,
+            CASE 
+                WHEN LOWER(a.text) = LOWER(:normalized_keyword) THEN 100
+                WHEN a.text ILIKE :search_pattern THEN 90
+                WHEN word_similarity(LOWER(:normalized_keyword), LOWER(a.text)) > 0.6 THEN 80
+                WHEN similarity(LOWER(a.text), LOWER(:normalized_keyword)) > 0.4 THEN 70
+                ELSE GREATEST(
+                    similarity(LOWER(a.text), LOWER(:normalized_keyword)) * 60,
+                    word_similarity(LOWER(:normalized_keyword), LOWER(a.text)) * 65
+                )
+            END as relevance_score
+        FROM quranhub_schema.ayat a
+        WHERE a.edition_id = :search_edition_id
+        AND (
+            -- Exact substring matches (fastest)
+            a.text ILIKE :search_pattern
+            OR
+            -- Full-text search using GIN index (fast for English-like languages)
+            to_tsvector('simple', a.text) @@ plainto_tsquery('simple', :normalized_keyword)
+            OR
+            -- Fallback trigram similarity for other languages (slower but works)
+            (
+                LENGTH(:normalized_keyword) > 3 
+                AND similarity(LOWER(a.text), LOWER(:normalized_keyword)) > 0.35
+            )
+        )
+        ORDER BY 
+            relevance_score DESC,
+            word_sim_score DESC,
+            sim_score DESC,
+            a.number ASC
+        LIMIT :limit OFFSET :offset
+    """)
+
+
 def is_arabic_text(keyword: str) -> bool:
     """Check if text contains Arabic characters."""
     return bool(re.search(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]', keyword or ''))
@@ -66,7 +187,8 @@ async def search_ayahs_by_keyword(
     edition_identifier: str = DEFAULT_EDITION_IDENTIFIER,
     exact_search: bool = False,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    compact: bool = False
 ):
     """
     Enhanced search function supporting both Arabic and non-Arabic text with fuzzy matching.
@@ -77,6 +199,7 @@ async def search_ayahs_by_keyword(
         exact_search: True for exact matching, False for fuzzy/typo-tolerant search
         limit: Maximum number of results
         offset: Offset for pagination
+        compact: Reference surahs by number from the ayahs instead of nesting them
         
     Returns:
         Dictionary with search results
@@ -114,14 +237,7 @@ async def search_ayahs_by_keyword(
             # Search on the appropriate edition (clean Arabic or English)
             if exact_search:
                 # Exact search using simple text matching
-                search_query = text("""
-                    SELECT DISTINCT a.surat_id, a.numberinsurat, a.number
-                    FROM quranhub_schema.ayat a
-                    WHERE a.edition_id = :search_edition_id
-                    AND LOWER(a.text) LIKE LOWER(:search_pattern)
-                    ORDER BY a.number
-                    LIMIT :limit OFFSET :offset
-                """)
+                search_query = statement("search_exact")
                 
                 search_pattern = f"%{normalized_keyword}%"
                 
@@ -129,107 +245,10 @@ async def search_ayahs_by_keyword(
                 # Fuzzy search using pg_trgm for typo tolerance
                 if is_arabic:
                     # Balanced Arabic fuzzy search with explicit similarity calculation
-                    search_query = text("""
-                        WITH scored_results AS (
-                            SELECT 
-                                a.surat_id, 
-                                a.numberinsurat, 
-                                a.number,
-                                a.text,
-                                similarity(a.text, :normalized_keyword) as sim_score,
-                                GREATEST(
-                                    word_similarity(:normalized_keyword, a.text),
-                                    word_similarity(a.text, :normalized_keyword)
-                                ) as word_sim_score,
-                                -- Enhanced relevance scoring
-                                CASE 
-                                    WHEN a.text ILIKE :search_pattern THEN 100
-                                    WHEN word_similarity(:normalized_keyword, a.text) > 0.6 THEN 90
-                                    WHEN similarity(a.text, :normalized_keyword) > 0.4 THEN 80
-                                    WHEN word_similarity(:normalized_keyword, a.text) > 0.4 THEN 70
-                                    WHEN similarity(a.text, :normalized_keyword) > 0.3 THEN 60
-                                    ELSE 50
-                                END as relevance_score
-                            FROM quranhub_schema.ayat a
-                            WHERE a.edition_id = :search_edition_id
-                            AND (
-                                -- Exact matches (highest priority) - no similarity threshold needed
-                                a.text ILIKE :search_pattern
-                                OR
-                                -- Fuzzy matching for non-exact matches
-                                (
-                                    a.text NOT ILIKE :search_pattern
-                                    AND (
-                                        -- Higher thresholds for better precision
-                                        similarity(a.text, :normalized_keyword) > 0.25
-                                        OR
-                                        word_similarity(:normalized_keyword, a.text) > 0.35
-                                        OR
-                                        -- More selective partial word matches
-                                        (
-                                            a.text % :normalized_keyword 
-                                            AND word_similarity(:normalized_keyword, a.text) > 0.25
-                                        )
-                                    )
-                                )
-                            )
-                            -- More lenient length filtering
-                            AND LENGTH(:normalized_keyword) > 2
-                        )
-                        SELECT 
-                            surat_id, numberinsurat, number, sim_score, word_sim_score, relevance_score
-                        FROM scored_results
-                        ORDER BY 
-                            relevance_score DESC,
-                            word_sim_score DESC,
-                            sim_score DESC,
-                            number ASC
-                        LIMIT :limit OFFSET :offset
-                    """)
+                    search_query = statement("search_fuzzy_arabic")
                 else:
                     # Optimized multi-language search using available indexes
-                    search_query = text("""
-                        SELECT 
-                            a.surat_id, 
-                            a.numberinsurat, 
-                            a.number,
-                            similarity(LOWER(a.text), LOWER(:normalized_keyword)) as sim_score,
-                            GREATEST(
-                                word_similarity(LOWER(:normalized_keyword), LOWER(a.text)),
-                                word_similarity(LOWER(a.text), LOWER(:normalized_keyword))
-                            ) as word_sim_score,
-                            CASE 
-                                WHEN LOWER(a.text) = LOWER(:normalized_keyword) THEN 100
-                                WHEN a.text ILIKE :search_pattern THEN 90
-                                WHEN word_similarity(LOWER(:normalized_keyword), LOWER(a.text)) > 0.6 THEN 80
-                                WHEN similarity(LOWER(a.text), LOWER(:normalized_keyword)) > 0.4 THEN 70
-                                ELSE GREATEST(
-                                    similarity(LOWER(a.text), LOWER(:normalized_keyword)) * 60,
-                                    word_similarity(LOWER(:normalized_keyword), LOWER(a.text)) * 65
-                                )
-                            END as relevance_score
-                        FROM quranhub_schema.ayat a
-                        WHERE a.edition_id = :search_edition_id
-                        AND (
-                            -- Exact substring matches (fastest)
-                            a.text ILIKE :search_pattern
-                            OR
-                            -- Full-text search using GIN index (fast for English-like languages)
-                            to_tsvector('simple', a.text) @@ plainto_tsquery('simple', :normalized_keyword)
-                            OR
-                            -- Fallback trigram similarity for other languages (slower but works)
-                            (
-                                LENGTH(:normalized_keyword) > 3 
-                                AND similarity(LOWER(a.text), LOWER(:normalized_keyword)) > 0.35
-                            )
-                        )
-                        ORDER BY 
-                            relevance_score DESC,
-                            word_sim_score DESC,
-                            sim_score DESC,
-                            a.number ASC
-                        LIMIT :limit OFFSET :offset
-                    """)
+                    search_query = statement("search_fuzzy")
                 
                 search_pattern = f"%{normalized_keyword}%"
             
@@ -390,25 +409,7 @@ async def search_ayahs_by_keyword(
             surah_ids = set()
             
             for verse in target_verses:
-                ayah_data = {
-                    "number": verse.number,
-                    "text": verse.text,
-                    "surah": {
-                        "number": verse.id,
-                        "name": verse.name,
-                        "englishName": verse.englishname,
-                        "englishNameTranslation": verse.englishtranslation,
-                        "revelationType": verse.revelationcity,
-                        "numberOfAyahs": verse.numberofayats
-                    },
-                    "numberInSurah": verse.numberinsurat,
-                    "juz": verse.juz_id,
-                    "manzil": verse.manzil_id,
-                    "page": verse.page_id,
-                    "ruku": verse.ruku_id,
-                    "hizbQuarter": verse.hizbquarter_id,
-                    "sajda": verse.sajda_id if verse.sajda_id else False
-                }
+                ayah_data = build_ayah(verse, compact=compact)
                 
                 # Add similarity scores for fuzzy search
                 if not exact_search and verse.number in similarity_scores:
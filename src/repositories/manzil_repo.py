@@ -1,12 +1,11 @@
-from sqlalchemy.future import select
-from db.models import Surat, Ayat
 from db.session import AsyncSessionLocal
 from utils.logger import logger
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
+from repositories.division_repo import division_ayahs_query
 from utils.config import DEFAULT_EDITION_IDENTIFIER
-from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
+from utils.fields import AYAH_FIELD_COLUMNS, ayah_columns, build_ayah, add_ayah_audio
 
-async def get_manzil(manzil_number: int, edition_identifier: str, limit: int, offset: int):
+async def get_manzil(manzil_number: int, edition_identifier: str, limit: int, offset: int, fields=None):
     try:
         # Fetch the edition asynchronously
         edition = await get_edition_by_identifier(edition_identifier)
@@ -27,29 +26,12 @@ async def get_manzil(manzil_number: int, edition_identifier: str, limit: int, of
         # Use async session to fetch data
         async with AsyncSessionLocal() as session:
             # Build the query for ayahs and surahs
-            query = select(
-                Ayat.number,
-                Ayat.text,
-                Ayat.numberinsurat,
-                Ayat.juz_id,
-                Ayat.manzil_id,
-                Ayat.page_id,
-                Ayat.ruku_id,
-                Ayat.hizbquarter_id,
-                Ayat.sajda_id,
-                Surat.id,
-                Surat.name,
-                Surat.englishname,
-                Surat.englishtranslation,
-                Surat.revelationcity,
-                Surat.numberofayats
-            ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                Ayat.manzil_id == manzil_number,
-                Ayat.edition_id == edition_id
-            ).limit(limit).offset(offset)
+            query, params = await division_ayahs_query(
+                edition_id, "manzil", manzil_number, ayah_columns(fields, *AYAH_FIELD_COLUMNS["surah"]), limit, offset
+            )
 
             # Execute the query asynchronously
-            result = await session.execute(query)
+            result = await session.execute(query, params)
             results = result.fetchall()
 
         # Prepare the response for ayahs and surahs
@@ -58,25 +40,7 @@ async def get_manzil(manzil_number: int, edition_identifier: str, limit: int, of
         surah_ids = []
 
         for item in results:
-            ayah_data = {
-                "number": item.number,
-                "text": item.text,
-                "surah": {
-                    "number": item.id,
-                    "name": item.name,
-                    "englishName": item.englishname,
-                    "englishNameTranslation": item.englishtranslation,
-                    "revelationType": item.revelationcity,
-                    "numberOfAyahs": item.numberofayats
-                },
-                "numberInSurah": item.numberinsurat,
-                "juz": item.juz_id,
-                "manzil": item.manzil_id,
-                "page": item.page_id,
-                "ruku": item.ruku_id,
-                "hizbQuarter": item.hizbquarter_id,
-                "sajda": item.sajda_id if item.sajda_id else False
-            }
+            ayah_data = build_ayah(item, fields)
             ayahs.append(ayah_data)
 
             # Ensure surahs are added only once
@@ -92,13 +56,7 @@ async def get_manzil(manzil_number: int, edition_identifier: str, limit: int, of
                 surah_ids.append(item.id)
 
         # Add audio URLs if the edition is audio format
-        if edition.format == "audio":
-            bitrates = edition.bitrates
-            max_bitrate = max(bitrates)
-            remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-            for item in ayahs:
-                item["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, item["number"])
-                item["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, item["number"])
+        add_ayah_audio(ayahs, [item.number for item in results], edition, fields)
 
         # Prepare edition info
         edition_info = {
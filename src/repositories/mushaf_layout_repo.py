@@ -1,9 +1,15 @@
 # Mushaf Layout repository: data access and service layer for mushaf_layout, mushaf_line
 
+import asyncio
+from bisect import bisect_left, bisect_right
 from sqlalchemy.future import select
 from sqlalchemy import func
-from db.models import MushafLayout, MushafLine, Font
+from cachetools import LRUCache
+from db.models import MushafLayout, MushafLine, Font, FontPageFile, Word
 from db.session import AsyncSessionLocal
+from utils.config import MUSHAF_PAGE_BUNDLE_CACHE_SIZE
+from utils.cache import register_purge_handler
+from utils.dataset import register_data_store
 
 # Canonical repo pattern for mushaf layout feature
 
@@ -57,7 +63,72 @@ async def get_lines_for_surah(layout_id: int, surah_number: int):
         result = await session.execute(stmt)
         return result.scalars().all()
 
-async def lookup_lines(layout_id: int, from_word_id=None, to_word_id=None):
+class MushafLineIndex:
+    """
+    In-memory interval index over the lines of one layout that carry word ids.
+
+    Lines are kept in page/line order along with their first and last word
+    ids. Mushaf lines cover consecutive, non-overlapping word spans, so both
+    boundary lists are sorted and the lines overlapping a word range are a
+    contiguous slice found with two binary searches.
+    """
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.first_word_ids = [line.ext_first_word_id for line in lines]
+        self.last_word_ids = [line.ext_last_word_id for line in lines]
+        self.is_sorted = all(
+            self.first_word_ids[i] <= self.first_word_ids[i + 1] and self.last_word_ids[i] <= self.last_word_ids[i + 1]
+            for i in range(len(lines) - 1)
+        )
+
+    def lookup(self, from_word_id=None, to_word_id=None):
+        start = bisect_left(self.last_word_ids, from_word_id) if from_word_id is not None else 0
+        end = bisect_right(self.first_word_ids, to_word_id) if to_word_id is not None else len(self.lines)
+        return self.lines[start:end]
+
+
+_line_indexes = {}
+_line_index_lock = asyncio.Lock()
+
+
+async def get_line_index(layout_id: int):
+    """Load the interval index of a layout once and keep it in memory."""
+    index = _line_indexes.get(layout_id)
+    if index is not None:
+        return index
+    async with _line_index_lock:
+        index = _line_indexes.get(layout_id)
+        if index is None:
+            async with AsyncSessionLocal() as session:
+                stmt = select(
+                    MushafLine.page_number,
+                    MushafLine.line_number,
+                    MushafLine.line_type,
+                    MushafLine.is_centered,
+                    MushafLine.ext_first_word_id,
+                    MushafLine.ext_last_word_id
+                ).where(
+                    MushafLine.layout_id == layout_id,
+                    MushafLine.ext_first_word_id.isnot(None),
+                    MushafLine.ext_last_word_id.isnot(None)
+                ).order_by(MushafLine.page_number, MushafLine.line_number)
+                result = await session.execute(stmt)
+                index = MushafLineIndex(result.all())
+            _line_indexes[layout_id] = index
+    return index
+
+
+@register_data_store("mushaf_line")
+def clear_line_indexes(layout_id: int = None):
+    """Drop the in-memory line index of a layout, or of all layouts."""
+    if layout_id is None:
+        _line_indexes.clear()
+    else:
+        _line_indexes.pop(layout_id, None)
+
+
+async def _query_lines(layout_id: int, from_word_id=None, to_word_id=None):
     async with AsyncSessionLocal() as session:
         filters = [MushafLine.layout_id == layout_id]
         # Overlap logic: only consider lines with non-null word ids
@@ -73,4 +144,126 @@ async def lookup_lines(layout_id: int, from_word_id=None, to_word_id=None):
             filters.append(MushafLine.ext_first_word_id <= to_word_id)
         stmt = select(MushafLine).where(*filters).order_by(MushafLine.page_number, MushafLine.line_number)
         result = await session.execute(stmt)
-        return result.scalars().all()
\ No newline at end of file
+        return result.scalars().all()
+
+
+async def lookup_lines(layout_id: int, from_word_id=None, to_word_id=None):
+    if from_word_id is None and to_word_id is None:
+        return await _query_lines(layout_id)
+    index = await get_line_index(layout_id)
+    if not index.is_sorted:
+        # Overlapping spans cannot be sliced; fall back to the range query
+        return await _query_lines(layout_id, from_word_id, to_word_id)
+    return index.lookup(from_word_id, to_word_id)
+
+
+_page_bundles = LRUCache(maxsize=MUSHAF_PAGE_BUNDLE_CACHE_SIZE)
+
+
+def _build_bundle_word(word):
+    return {
+        "id": word.id,
+        "location": f"{word.surat_id}:{word.numberinsurat}:{word.position}",
+        "verseKey": f"{word.surat_id}:{word.numberinsurat}",
+        "position": word.position,
+        "text": word.text,
+        "images": {"v4": word.v4_img_url, "rq": word.rq_img_url, "qa": word.qa_img_url}
+    }
+
+
+async def get_page_bundle(layout_code: str, page: int):
+    """
+    Everything needed to render one mushaf page: the layout and its font, the
+    page's font files, and the page lines with their words and word images.
+
+    Assembled with four queries regardless of the page size (layout and font,
+    lines, words, font page files) and cached per (layout, page).
+
+    Returns:
+        dict: The page bundle.
+        str: An error message if the layout or page was not found.
+    """
+    key = (layout_code, page)
+    bundle = _page_bundles.get(key)
+    if bundle is not None:
+        return bundle
+
+    async with AsyncSessionLocal() as session:
+        stmt = select(MushafLayout, Font).join(Font, isouter=True).where(MushafLayout.code == layout_code)
+        row = (await session.execute(stmt)).first()
+        if not row:
+            return "Layout not found."
+        layout, font = row
+
+        stmt = select(MushafLine).where(MushafLine.layout_id == layout.layout_id, MushafLine.page_number == page).order_by(MushafLine.line_number)
+        lines = (await session.execute(stmt)).scalars().all()
+        if not lines:
+            return "Layout or page not found."
+
+        word_lines = [line for line in lines if line.ext_first_word_id is not None and line.ext_last_word_id is not None]
+        words = []
+        if word_lines:
+            stmt = select(
+                Word.id, Word.surat_id, Word.numberinsurat, Word.position, Word.text,
+                Word.v4_img_url, Word.rq_img_url, Word.qa_img_url
+            ).where(
+                Word.id.between(min(line.ext_first_word_id for line in word_lines), max(line.ext_last_word_id for line in word_lines))
+            ).order_by(Word.id)
+            words = (await session.execute(stmt)).all()
+
+        page_files = []
+        if font:
+            stmt = select(FontPageFile.format, FontPageFile.url).where(FontPageFile.font_id == font.font_id, FontPageFile.page_number == page).order_by(FontPageFile.format)
+            page_files = (await session.execute(stmt)).all()
+
+    word_ids = [word.id for word in words]
+    bundle_lines = []
+    for line in lines:
+        line_words = []
+        if line.ext_first_word_id is not None and line.ext_last_word_id is not None:
+            start = bisect_left(word_ids, line.ext_first_word_id)
+            end = bisect_right(word_ids, line.ext_last_word_id)
+            line_words = [_build_bundle_word(word) for word in words[start:end]]
+        bundle_lines.append({
+            "lineNumber": line.line_number,
+            "lineType": line.line_type,
+            "isCentered": line.is_centered,
+            "surahNumber": line.surah_number,
+            "fromWord": line.ext_first_word_id,
+            "toWord": line.ext_last_word_id,
+            "words": line_words
+        })
+
+    bundle = {
+        "layout": {
+            "code": layout.code,
+            "name": layout.name,
+            "numberOfPages": layout.number_of_pages,
+            "linesPerPage": layout.lines_per_page
+        },
+        "font": {
+            "code": font.code,
+            "name": font.name,
+            "category": font.category,
+            "pageFiles": {page_file.format: page_file.url for page_file in page_files}
+        } if font else None,
+        "pageNumber": page,
+        "lines": bundle_lines
+    }
+    _page_bundles[key] = bundle
+    return bundle
+
+
+@register_data_store("mushaf_layout", "mushaf_line", "word", "font", "font_file", "font_page_file")
+def clear_page_bundles():
+    """Drop all cached page bundles."""
+    _page_bundles.clear()
+
+
+@register_purge_handler
+def _purge_page_bundles(matches) -> int:
+    """Drop the page bundles whose Cache-Tag is purged."""
+    keys = [key for key in list(_page_bundles.keys()) if matches(f"mushaf_layout:bundle:{key[0]}:{key[1]}")]
+    for key in keys:
+        _page_bundles.pop(key, None)
+    return len(keys)
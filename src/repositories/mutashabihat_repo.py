@@ -1,10 +1,11 @@
 
 
 from db.session import AsyncSessionLocal
-from db.models import QuranPhraseOccurrence, Word, Ayat, QuranPhrase, Surat
+from db.models import QuranPhraseOccurrence, Ayat, QuranPhrase, Surat
 from sqlalchemy.future import select
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
 from repositories.narrations_numbering_repo import get_narration_numbering_from_narration
+from repositories.word_repo import get_word_table
 from utils.config import DEFAULT_EDITION_IDENTIFIER
 from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
 
@@ -79,17 +80,8 @@ async def get_mutashabihat_for_ayah(
                     source_surat_id = phrase.source_surat_id
                     source_numberinsurat = phrase.source_numberinsurat
 
-                words = (await session.execute(
-                    select(Word)
-                    .where(
-                        Word.surat_id == occ.surat_id,
-                        Word.numberinsurat == occ.numberinsurat,
-                        Word.position >= occ.start_pos,
-                        Word.position <= occ.end_pos
-                    )
-                    .order_by(Word.position)
-                )).scalars().all()
-                phrase_text = ' '.join([w.text for w in words if w.text])
+                word_table = await get_word_table()
+                phrase_text = word_table.span_text(occ.surat_id, occ.numberinsurat, occ.start_pos, occ.end_pos)
 
                 # Get ayah object for this phrase occurrence (match ayah_repo structure)
                 if is_hafs:
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from utils.logger import logger
 from db.models import NarrationsNumbering
 from db.session import AsyncSessionLocal
@@ -123,4 +123,31 @@ async def get_narration_numbering_from_hafs(
 
     except Exception as e:
         logger.error(f"Error fetching narration numbering from Hafs: {str(e)}", exc_info=True)
-        return [], []
\ No newline at end of file
+        return [], []
+
+
+async def get_hafs_numbering_map(surah_numbers: List[int], edition_id: str) -> Dict[Tuple[int, int], List[int]]:
+    """
+    Map Hafs ayahs of the given surahs to their numbering in another edition,
+    with one query.
+
+    Args:
+        surah_numbers (List[int]): The Surah numbers.
+        edition_id (str): Target edition ID column name.
+
+    Returns:
+        Dict[Tuple[int, int], List[int]]: Target ayah numbers by (surah, hafs ayah),
+        for the ayahs numbered differently only.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(NarrationsNumbering).filter(NarrationsNumbering.surah_number.in_(set(surah_numbers)))
+        )
+        rows = result.scalars().all()
+
+    numbering = {}
+    for row in rows:
+        target_column_data = getattr(row, edition_id.replace('-', '_'), [])
+        for ayah_number in row.quran_hafs or []:
+            numbering.setdefault((row.surah_number, ayah_number), []).extend(target_column_data)
+    return numbering
@@ -1,14 +1,16 @@
-from sqlalchemy.future import select
-from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
-from db.models import Ayat, Surat
+from db.models import Ayat
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
+from repositories.division_repo import division_ayahs_query, get_division_first_ayahs
 from repositories.hizb_repo import get_hizb_numbers
 from repositories.word_repo import get_words
 from utils.logger import logger
+from utils.cache import cached
 from db.session import AsyncSessionLocal
 from utils.config import DEFAULT_EDITION_IDENTIFIER
+from utils.fields import AYAH_FIELD_COLUMNS, ayah_columns, build_ayah, add_ayah_audio
 
-async def get_page(page_number: int, edition_identifier: str, words: bool, limit: int, offset: int):
+@cached("page", tag=lambda page_number, edition_identifier, *args, **kwargs: f"page:number:{page_number}:edition:{edition_identifier}")
+async def get_page(page_number: int, edition_identifier: str, words: bool, limit: int, offset: int, fields=None, compact=False):
     try:
         edition = await get_edition_by_identifier(edition_identifier)
         if isinstance(edition, str):
@@ -38,31 +40,15 @@ async def get_page(page_number: int, edition_identifier: str, words: bool, limit
         if words and (edition.language != "ar" or edition.type == "tafsir"):
             return "Words are not available for this edition. Words are available only for Arabic editions and not Tafsir editions."
 
+        # Words are split from the ayah text, even when `fields` leaves it out
+        required = [Ayat.numberinsurat, *AYAH_FIELD_COLUMNS["surah"]]
+        if words:
+            required.append(Ayat.text)
+
         async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.juz_id,
-                    Ayat.manzil_id,
-                    Ayat.page_id,
-                    Ayat.ruku_id,
-                    Ayat.hizbquarter_id,
-                    Ayat.sajda_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                )
-                .join(Surat, Ayat.surat_id == Surat.id)
-                .filter(Ayat.page_id == page_number, Ayat.edition_id == edition_id)
-                .order_by(Ayat.number)
-                .limit(limit)
-                .offset(offset)
-            )
+            result = await session.execute(*await division_ayahs_query(
+                edition_id, "page", page_number, ayah_columns(fields, *required), limit, offset
+            ))
             result = result.all()
 
         if not result:
@@ -74,25 +60,7 @@ async def get_page(page_number: int, edition_identifier: str, words: bool, limit
         surahs_ayat_counter = {}
 
         for item in result:
-            ayah = {
-                "number": item.number,
-                "text": item.text,
-                "surah": {
-                    "number": item.id,
-                    "name": item.name,
-                    "englishName": item.englishname,
-                    "englishNameTranslation": item.englishtranslation,
-                    "revelationType": item.revelationcity,
-                    "numberOfAyahs": item.numberofayats
-                },
-                "numberInSurah": item.numberinsurat,
-                "juz": item.juz_id,
-                "manzil": item.manzil_id,
-                "page": item.page_id,
-                "ruku": item.ruku_id,
-                "hizbQuarter": item.hizbquarter_id,
-                "sajda": item.sajda_id if item.sajda_id else False
-            }
+            ayah = build_ayah(item, fields, compact=compact)
 
             if words:
                 last_ayah = ayahs[-1] if ayahs else None
@@ -118,14 +86,7 @@ async def get_page(page_number: int, edition_identifier: str, words: bool, limit
             else:
                 surahs_ayat_counter[item.id] += 1
 
-        if edition.format == "audio":
-            bitrates = edition.bitrates
-            max_bitrate = max(bitrates)
-            remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-            for item in ayahs:
-                verse_number = item["number"]
-                item["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, verse_number)
-                item["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, verse_number)
+        add_ayah_audio(ayahs, [item.number for item in result], edition, fields)
 
         edition_info = {
             "identifier": edition.identifier,
@@ -139,10 +100,11 @@ async def get_page(page_number: int, edition_identifier: str, words: bool, limit
 
         hizb_numbers = await get_hizb_numbers(page_number, edition_id)
         top_page_surah = max(surahs_ayat_counter, key=surahs_ayat_counter.get)
-        for surah in surahs:
-            if surah["number"] == top_page_surah:
-                top_page_surah = surah
-                break
+        if not compact:
+            for surah in surahs:
+                if surah["number"] == top_page_surah:
+                    top_page_surah = surah
+                    break
 
         return {
             "number": page_number,
@@ -177,50 +139,11 @@ async def get_all_pages(edition_identifier=DEFAULT_EDITION_IDENTIFIER):
                 return text_edition
             edition_id = text_edition.id
 
-        async with AsyncSessionLocal() as session:
-            # Query first ayah of each page in a single query
-            result = await session.execute(
-                select(
-                    Ayat.page_id,
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                    Ayat.edition_id == edition_id
-                ).order_by(Ayat.page_id, Ayat.number)
-            )
-
-            fetched_data = result.fetchall()
-            page_data_map = {}
-
-            # Process the fetched data to group by page_id
-            for item in fetched_data:
-                page_id = item.page_id
-                if page_id not in page_data_map:
-                    page_data_map[page_id] = {
-                        "number": page_id,
-                        "firstAyah": {
-                            "number": item.number,
-                            "text": item.text,
-                            "numberInSurah": item.numberinsurat,
-                        },
-                        "firstSurah": {
-                            "number": item.id,
-                            "name": item.name,
-                            "englishName": item.englishname,
-                            "englishNameTranslation": item.englishtranslation,
-                            "revelationType": item.revelationcity,
-                            "numberOfAyahs": item.numberofayats
-                        }
-                    }
-
-            pages_info = list(page_data_map.values())
+        # First ayah of each page from the division boundaries
+        pages_info = [
+            {key: value for key, value in page.items() if key != "firstPage"}
+            for page in await get_division_first_ayahs(edition_id, "page")
+        ]
 
         if not pages_info:
             return "No Pages found."
@@ -1,12 +1,11 @@
-from sqlalchemy.future import select
-from db.models import Ayat, Surat
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
+from repositories.division_repo import division_ayahs_query
 from utils.logger import logger
 from db.session import AsyncSessionLocal
 from utils.config import DEFAULT_EDITION_IDENTIFIER
-from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
+from utils.fields import AYAH_FIELD_COLUMNS, ayah_columns, build_ayah, add_ayah_audio
 
-async def get_ruku(ruku_number: int, edition_identifier: str, limit: int, offset: int):
+async def get_ruku(ruku_number: int, edition_identifier: str, limit: int, offset: int, fields=None):
     try:
         edition = await get_edition_by_identifier(edition_identifier)
         if isinstance(edition, str):
@@ -30,29 +29,9 @@ async def get_ruku(ruku_number: int, edition_identifier: str, limit: int, offset
             edition_id = text_edition.id
 
         async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.juz_id,
-                    Ayat.manzil_id,
-                    Ayat.page_id,
-                    Ayat.ruku_id,
-                    Ayat.hizbquarter_id,
-                    Ayat.sajda_id,
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.revelationcity,
-                    Surat.numberofayats
-                )
-                .join(Surat, Ayat.surat_id == Surat.id)
-                .filter(Ayat.ruku_id == ruku_number, Ayat.edition_id == edition_id)
-                .limit(limit)
-                .offset(offset)
-            )
+            result = await session.execute(*await division_ayahs_query(
+                edition_id, "ruku", ruku_number, ayah_columns(fields, *AYAH_FIELD_COLUMNS["surah"]), limit, offset
+            ))
             result = result.all()
 
         ayahs = []
@@ -60,25 +39,7 @@ async def get_ruku(ruku_number: int, edition_identifier: str, limit: int, offset
         surah_ids = []
 
         for item in result:
-            ayahs.append({
-                "number": item.number,
-                "text": item.text,
-                "surah": {
-                    "number": item.id,
-                    "name": item.name,
-                    "englishName": item.englishname,
-                    "englishNameTranslation": item.englishtranslation,
-                    "revelationType": item.revelationcity,
-                    "numberOfAyahs": item.numberofayats
-                },
-                "numberInSurah": item.numberinsurat,
-                "juz": item.juz_id,
-                "manzil": item.manzil_id,
-                "page": item.page_id,
-                "ruku": item.ruku_id,
-                "hizbQuarter": item.hizbquarter_id,
-                "sajda": item.sajda_id if item.sajda_id else False
-            })
+            ayahs.append(build_ayah(item, fields))
             if item.id not in surah_ids:
                 surahs.append({
                     "number": item.id,
@@ -90,13 +51,7 @@ async def get_ruku(ruku_number: int, edition_identifier: str, limit: int, offset
                 })
                 surah_ids.append(item.id)
 
-        if edition.format == "audio":
-            bitrates = edition.bitrates
-            max_bitrate = max(bitrates)
-            remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-            for item in ayahs:
-                item["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, item["number"])
-                item["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, item["number"])
+        add_ayah_audio(ayahs, [item.number for item in result], edition, fields)
 
         edition_info = {
             "identifier": edition.identifier,
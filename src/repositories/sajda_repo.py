@@ -3,6 +3,7 @@ from db.session import AsyncSessionLocal  # Assuming AsyncSessionLocal is define
 from utils.logger import logger
 from db.models import Ayat, Surat, Sajda  # Assuming these are imported correctly
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
+from repositories.division_repo import any_division_filter
 from utils.config import DEFAULT_EDITION_IDENTIFIER
 from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
 
@@ -48,7 +49,7 @@ async def get_sajdas(edition_identifier: str):
                     Surat.numberofayats
                 )
                 .join(Surat, Ayat.surat_id == Surat.id)
-                .filter(Ayat.edition_id == edition_id, Ayat.sajda_id.isnot(None))
+                .filter(Ayat.edition_id == edition_id, await any_division_filter(edition_id, "sajda"))
                 .subquery()
             )
 
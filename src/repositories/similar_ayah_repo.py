@@ -1,9 +1,10 @@
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from db.models import QuranAyahMatch, QuranAyahMatchSpan, Ayat, Surat, Word
+from db.models import QuranAyahMatch, QuranAyahMatchSpan, Ayat, Surat
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
 from repositories.narrations_numbering_repo import get_narration_numbering_from_narration
+from repositories.word_repo import get_word_table
 from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
 
 
@@ -92,16 +93,9 @@ async def get_similar_ayahs_for_ayah(
                 spans = span_result.scalars().all()
                 # For each span, get the matched text
                 span_objs = []
+                word_table = await get_word_table()
                 for span in spans:
-                    word_q = select(Word).where(
-                        Word.surat_id == span.matched_surat_id,
-                        Word.numberinsurat == span.matched_numberinsurat,
-                        Word.position >= span.start_pos,
-                        Word.position <= span.end_pos
-                    ).order_by(Word.position)
-                    word_result = await db.execute(word_q)
-                    words = word_result.scalars().all()
-                    matched_text = ' '.join([w.text for w in words if w.text])
+                    matched_text = word_table.span_text(span.matched_surat_id, span.matched_numberinsurat, span.start_pos, span.end_pos)
                     span_objs.append({
                         "startPos": span.start_pos,
                         "endPos": span.end_pos,
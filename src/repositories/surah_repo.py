@@ -1,12 +1,38 @@
 from sqlalchemy.future import select
-from sqlalchemy import func, literal_column, and_
+from sqlalchemy import bindparam, func, literal_column, and_
 from sqlalchemy.orm import aliased
 from db.models import Surat, Ayat
 from db.session import AsyncSessionLocal
+from db.statements import register_statement, statement
 from utils.logger import logger
 from repositories.edition_repo import get_edition_by_identifier, get_text_edition_for_narrator
 from utils.config import DEFAULT_EDITION_IDENTIFIER
-from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls, get_surah_audio_url, get_surah_audio_secondary_urls
+from utils.helpers import get_surah_audio_url, get_surah_audio_secondary_urls
+from utils.fields import SURAH_AYAH_LAYOUT, ayah_columns, build_ayah, add_ayah_audio
+
+@register_statement("surah_meta")
+def _surah_meta():
+    return select(
+        Surat.id,
+        Surat.name,
+        Surat.englishname,
+        Surat.englishtranslation,
+        Surat.numberofayats,
+        Surat.revelationcity
+    ).filter(Surat.id == bindparam("surah"))
+
+
+@register_statement("surah_ayahs")
+def _surah_ayahs(columns):
+    return (
+        select(*columns)
+        .join(Surat, Ayat.surat_id == Surat.id)
+        .filter(Ayat.surat_id == bindparam("surah"), Ayat.edition_id == bindparam("edition_id"))
+        .order_by(Ayat.number)
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+
 
 async def get_all_surahs(order_by_revelation_order=False):
     try:
@@ -201,7 +227,7 @@ async def get_all_juzs_with_surahs():
 
 
 
-async def get_surah(surah_number, edition_identifier, limit, offset):
+async def get_surah(surah_number, edition_identifier, limit, offset, fields=None):
     try:
         # Fetch the edition based on the provided identifier
         edition = await get_edition_by_identifier(edition_identifier)
@@ -237,50 +263,19 @@ async def get_surah(surah_number, edition_identifier, limit, offset):
 
         # Query Surah metadata
         async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.numberofayats,
-                    Surat.revelationcity
-                ).filter(Surat.id == surah_number)
-            )
+            result = await session.execute(statement("surah_meta"), {"surah": surah_number})
             surah_meta = result.fetchone()
             if not surah_meta:
                 return "Surah not found."
 
             # Query Ayah data for the Surah
             result = await session.execute(
-                select(
-                    Ayat.number,
-                    Ayat.text,
-                    Ayat.numberinsurat,
-                    Ayat.juz_id,
-                    Ayat.manzil_id,
-                    Ayat.page_id,
-                    Ayat.ruku_id,
-                    Ayat.hizbquarter_id,
-                    Ayat.sajda_id
-                ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                    Ayat.surat_id == surah_number,
-                    Ayat.edition_id == edition_id
-                ).order_by(Ayat.number).limit(limit).offset(offset)
+                statement("surah_ayahs", tuple(ayah_columns(fields, layout=SURAH_AYAH_LAYOUT))),
+                {"surah": surah_number, "edition_id": edition_id, "limit": limit, "offset": offset}
             )
-            ayahs = []
-            for item in result.fetchall():
-                ayahs.append({
-                    "number": item.number,
-                    "text": item.text,
-                    "numberInSurah": item.numberinsurat,
-                    "juz": item.juz_id,
-                    "manzil": item.manzil_id,
-                    "page": item.page_id,
-                    "ruku": item.ruku_id,
-                    "hizbQuarter": item.hizbquarter_id,
-                    "sajda": item.sajda_id if item.sajda_id else False
-                })
+            result = result.fetchall()
+            ayahs = [build_ayah(item, fields, layout=SURAH_AYAH_LAYOUT) for item in result]
+            ayah_numbers = [item.number for item in result]
 
         # Audio URLs for Surah and Ayahs
         surah_audio_url = ""
@@ -289,12 +284,7 @@ async def get_surah(surah_number, edition_identifier, limit, offset):
         if isinstance(edition, list):
             for item in edition:
                 if item.type == "versebyverse":
-                    bitrates = item.bitrates
-                    max_bitrate = max(bitrates)
-                    remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-                    for ayah in ayahs:
-                        ayah["audio"] =  get_ayah_audio_url(max_bitrate, item.identifier, ayah["number"])
-                        ayah["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, item.identifier, ayah["number"])
+                    add_ayah_audio(ayahs, ayah_numbers, item, fields)
                 elif item.type == "surah":
                     bitrates = item.bitrates
                     max_bitrate = max(bitrates)
@@ -305,12 +295,7 @@ async def get_surah(surah_number, edition_identifier, limit, offset):
         else:
             if edition.format == "audio":
                 if edition.type == "versebyverse":
-                    bitrates = edition.bitrates
-                    max_bitrate = max(bitrates)
-                    remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-                    for ayah in ayahs:
-                        ayah["audio"] = get_ayah_audio_url(max_bitrate, edition.identifier, ayah["number"])
-                        ayah["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, edition.identifier, ayah["number"])
+                    add_ayah_audio(ayahs, ayah_numbers, edition, fields)
                 elif edition.type == "surah":
                     bitrates = edition.bitrates
                     max_bitrate = max(bitrates)
@@ -345,7 +330,7 @@ async def get_surah(surah_number, edition_identifier, limit, offset):
         logger.error("An exception occurred: %s", str(e))
         return "An error occurred while fetching the Surah data."
 
-async def get_surah_by_multiple_editions(surah_number, edition_identifiers, limit, offset):
+async def get_surah_by_multiple_editions(surah_number, edition_identifiers, limit, offset, fields=None):
     try:
         editions = []
         for edition_identifier in edition_identifiers:
@@ -365,16 +350,7 @@ async def get_surah_by_multiple_editions(surah_number, edition_identifiers, limi
 
         # Query Surah metadata asynchronously
         async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(
-                    Surat.id,
-                    Surat.name,
-                    Surat.englishname,
-                    Surat.englishtranslation,
-                    Surat.numberofayats,
-                    Surat.revelationcity
-                ).filter(Surat.id == surah_number)
-            )
+            result = await session.execute(statement("surah_meta"), {"surah": surah_number})
             surah_meta = result.fetchone()
             if not surah_meta:
                 return "Surah not found."
@@ -394,20 +370,8 @@ async def get_surah_by_multiple_editions(surah_number, edition_identifiers, limi
                     edition_id = text_edition.id
 
                 result = await session.execute(
-                    select(
-                        Ayat.number,
-                        Ayat.text,
-                        Ayat.numberinsurat,
-                        Ayat.juz_id,
-                        Ayat.manzil_id,
-                        Ayat.page_id,
-                        Ayat.ruku_id,
-                        Ayat.hizbquarter_id,
-                        Ayat.sajda_id
-                    ).join(Surat, Ayat.surat_id == Surat.id).filter(
-                        Ayat.surat_id == surah_number,
-                        Ayat.edition_id == edition_id
-                    ).order_by(Ayat.number).limit(limit).offset(offset)
+                    statement("surah_ayahs", tuple(ayah_columns(fields, layout=SURAH_AYAH_LAYOUT))),
+                    {"surah": surah_number, "edition_id": edition_id, "limit": limit, "offset": offset}
                 )
                 fetched_results = result.fetchall()
                 if not fetched_results:  # Changed to fetchall() to check for empty results
@@ -416,29 +380,10 @@ async def get_surah_by_multiple_editions(surah_number, edition_identifiers, limi
 
         # Process each edition and generate the data with audio URLs
         for i in range(len(editions)):
-            ayahs = []
-            for j in range(len(results[i])):
-                ayah = {
-                    "number": results[i][j].number,
-                    "text": results[i][j].text,
-                    "numberInSurah": results[i][j].numberinsurat,
-                    "juz": results[i][j].juz_id,
-                    "manzil": results[i][j].manzil_id,
-                    "page": results[i][j].page_id,
-                    "ruku": results[i][j].ruku_id,
-                    "hizbQuarter": results[i][j].hizbquarter_id,
-                    "sajda": results[i][j].sajda_id if results[i][j].sajda_id else False
-                }
-                ayahs.append(ayah)
+            ayahs = [build_ayah(item, fields, layout=SURAH_AYAH_LAYOUT) for item in results[i]]
 
             # If edition format is audio, add audio URLs for the Ayahs
-            if editions[i].format == "audio":
-                bitrates = editions[i].bitrates
-                max_bitrate = max(bitrates)
-                remaining_bitrates = [bitrate for bitrate in bitrates if bitrate != max_bitrate]
-                for item in ayahs:
-                    item["audio"] = get_ayah_audio_url(max_bitrate, editions[i].identifier, item["number"])
-                    item["audioSecondary"] = get_ayah_audio_secondary_urls(remaining_bitrates, editions[i].identifier, item["number"])
+            add_ayah_audio(ayahs, [item.number for item in results[i]], editions[i], fields)
 
             edition_data = {
                 "identifier": editions[i].identifier,
@@ -1,14 +1,241 @@
-from sqlalchemy import select
+import asyncio
+from array import array
+from bisect import bisect_left, bisect_right
+from sqlalchemy import select, or_, tuple_
 from db.session import AsyncSessionLocal
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.models import Word  # Assuming Edition is in a models module
 from utils.logger import logger  # Assuming you have a logger module
-from utils.config import SPECIAL_CHARACTERS, NUMBERS_TRANSLATION_TABLE
+from utils.dataset import register_data_store
+from utils.config import SPECIAL_CHARACTERS, NUMBERS_TRANSLATION_TABLE, WORD_LOCATIONS_MAX_WORDS
 from typing import List, Dict
 from utils.helpers import get_ayah_audio_url, get_ayah_audio_secondary_urls
 from repositories.narrations_numbering_repo import get_narration_numbering_from_hafs
 
 
+class WordTable:
+    """
+    Read-only columnar copy of the word table.
+
+    Word attributes are kept in parallel arrays ordered by (surah, ayah,
+    position), with the texts concatenated into one string addressed by
+    offsets. `ayah_first_row` is a prefix sum of word counts per ayah and
+    `surah_first_ayah` a prefix sum of ayah counts per surah, so the words of
+    an ayah are the rows ayah_first_row[k]:ayah_first_row[k + 1] where
+    k = surah_first_ayah[surah] + ayah - 1.
+    """
+
+    def __init__(self, rows):
+        self.ids = array("i")
+        self.positions = array("H")
+        self.line_numbers = array("h")
+        self.text_offsets = array("I", [0])
+        texts = []
+        word_counts = {}
+        surah_ayah_counts = [0] * 115
+        for row in rows:
+            self.ids.append(row.id)
+            self.positions.append(row.position)
+            # -1 stands for a missing line number
+            self.line_numbers.append(row.line_number if row.line_number is not None else -1)
+            texts.append(row.text or "")
+            self.text_offsets.append(self.text_offsets[-1] + len(texts[-1]))
+            word_counts[(row.surat_id, row.numberinsurat)] = word_counts.get((row.surat_id, row.numberinsurat), 0) + 1
+            surah_ayah_counts[row.surat_id] = max(surah_ayah_counts[row.surat_id], row.numberinsurat)
+        self.texts = "".join(texts)
+
+        self.surah_first_ayah = array("I", [0, 0])
+        for surah in range(1, 115):
+            self.surah_first_ayah.append(self.surah_first_ayah[-1] + surah_ayah_counts[surah])
+        self.ayah_first_row = array("I", [0])
+        for surah in range(1, 115):
+            for ayah in range(1, surah_ayah_counts[surah] + 1):
+                self.ayah_first_row.append(self.ayah_first_row[-1] + word_counts.get((surah, ayah), 0))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def ayah_rows(self, surah: int, ayah: int):
+        """Row slice (start, end) of the words of an ayah; empty if unknown."""
+        if not 1 <= surah <= 114 or ayah < 1:
+            return 0, 0
+        index = self.surah_first_ayah[surah] + ayah - 1
+        if index >= self.surah_first_ayah[surah + 1]:
+            return 0, 0
+        return self.ayah_first_row[index], self.ayah_first_row[index + 1]
+
+    def span(self, surah: int, ayah: int, start_pos: int = None, end_pos: int = None):
+        """Row slice (start, end) of the words of an ayah between two positions, inclusive."""
+        start, end = self.ayah_rows(surah, ayah)
+        if start_pos is not None:
+            start = bisect_left(self.positions, start_pos, start, end)
+        if end_pos is not None:
+            end = bisect_right(self.positions, end_pos, start, end)
+        return start, end
+
+    def _row_bound(self, location, inclusive: bool) -> int:
+        """First row after a (surah, ayah, position) location; at it unless `inclusive`."""
+        surah, ayah, position = location
+        if surah < 1:
+            return 0
+        if surah > 114:
+            return len(self.ids)
+        first_ayah, next_surah_ayah = self.surah_first_ayah[surah], self.surah_first_ayah[surah + 1]
+        if ayah < 1:
+            return self.ayah_first_row[first_ayah]
+        if first_ayah + ayah - 1 >= next_surah_ayah:
+            return self.ayah_first_row[next_surah_ayah]
+        start, end = self.ayah_rows(surah, ayah)
+        return (bisect_right if inclusive else bisect_left)(self.positions, position, start, end)
+
+    def rows_between(self, lower, upper):
+        """Rows from the `lower` to the `upper` location, inclusive, as a range."""
+        return range(self._row_bound(lower, False), self._row_bound(upper, True))
+
+    def location(self, row: int):
+        """(surah, ayah, position) of a row."""
+        index = bisect_right(self.ayah_first_row, row) - 1
+        surah = bisect_right(self.surah_first_ayah, index) - 1
+        return surah, index - self.surah_first_ayah[surah] + 1, self.positions[row]
+
+    def line_number(self, surah: int, ayah: int, position: int):
+        start, end = self.span(surah, ayah, position, position)
+        if start == end:
+            return None
+        return self.row_line_number(start)
+
+    def row_line_number(self, row: int):
+        line_number = self.line_numbers[row]
+        return line_number if line_number != -1 else None
+
+    def text(self, row: int) -> str:
+        return self.texts[self.text_offsets[row]:self.text_offsets[row + 1]]
+
+    def span_text(self, surah: int, ayah: int, start_pos: int, end_pos: int) -> str:
+        """Words of an ayah between two positions joined by spaces, as a phrase."""
+        start, end = self.span(surah, ayah, start_pos, end_pos)
+        return " ".join(text for text in (self.text(row) for row in range(start, end)) if text)
+
+
+_word_table = None
+_word_table_lock = asyncio.Lock()
+
+
+async def get_word_table() -> WordTable:
+    """Load the word table into memory once and share it across requests."""
+    global _word_table
+    if _word_table is not None:
+        return _word_table
+    async with _word_table_lock:
+        if _word_table is None:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(Word.id, Word.surat_id, Word.numberinsurat, Word.position, Word.line_number, Word.text)
+                    .filter(Word.surat_id.isnot(None), Word.numberinsurat.isnot(None), Word.position.isnot(None))
+                    .order_by(Word.surat_id, Word.numberinsurat, Word.position)
+                )
+                _word_table = WordTable(result)
+            logger.info(f"Loaded word table with {len(_word_table)} words.")
+    return _word_table
+
+
+@register_data_store("word")
+def clear_word_table():
+    """Drop the in-memory word table so it is reloaded on next use."""
+    global _word_table
+    _word_table = None
+
+
+def _parse_location(location: str):
+    parts = location.strip().split(":")
+    if len(parts) not in (2, 3) or not all(part.isdigit() for part in parts):
+        return None
+    return tuple(int(part) for part in parts)
+
+
+def parse_word_locations(locations: str):
+    """
+    Parse a comma-separated list of word selectors. Each selector is a word
+    (surah:ayah:position), a whole ayah (surah:ayah) or an inclusive range
+    between two such locations (e.g. 1:1:1-1:3:2 or 2:1-2:5).
+
+    Returns:
+        list: (from_location, to_location) tuples, one per selector.
+        str: An error message if a selector is invalid.
+    """
+    selectors = []
+    for selector in locations.split(","):
+        if not selector.strip():
+            continue
+        start, _, end = selector.partition("-")
+        from_location = _parse_location(start)
+        to_location = _parse_location(end) if end else from_location
+        if from_location is None or to_location is None:
+            return f"Invalid location: {selector.strip()}"
+        selectors.append((from_location, to_location))
+    if not selectors:
+        return "At least one location is required"
+    return selectors
+
+
+def is_single_word_location(locations: str) -> bool:
+    return "," not in locations and "-" not in locations and len(locations.split(":")) == 3
+
+
+def _location_filter(from_location, to_location):
+    # Open-ended ayah bounds cover every position of the ayah
+    lower = from_location if len(from_location) == 3 else (*from_location, 0)
+    upper = to_location if len(to_location) == 3 else (*to_location, 2 ** 31 - 1)
+    if lower == upper:
+        return tuple_(Word.surat_id, Word.numberinsurat, Word.position) == tuple_(*lower)
+    return tuple_(Word.surat_id, Word.numberinsurat, Word.position).between(tuple_(*lower), tuple_(*upper))
+
+
+async def get_words_by_locations(selectors: list, *columns):
+    """
+    Fetch the requested columns of every word matched by the selectors with one
+    query on the (surah, ayah, position) index, ordered by location.
+
+    Returns:
+        list: Rows with surat_id, numberinsurat, position and the columns.
+        str: An error message if more than WORD_LOCATIONS_MAX_WORDS words match.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Word.surat_id, Word.numberinsurat, Word.position, *columns)
+            .filter(or_(*[_location_filter(from_location, to_location) for from_location, to_location in selectors]))
+            .order_by(Word.surat_id, Word.numberinsurat, Word.position)
+            .limit(WORD_LOCATIONS_MAX_WORDS + 1)
+        )
+        rows = result.all()
+    if len(rows) > WORD_LOCATIONS_MAX_WORDS:
+        return f"Too many words requested. The maximum is {WORD_LOCATIONS_MAX_WORDS}."
+    return rows
+
+
+async def get_word_line_numbers_by_locations(selectors: list):
+    """
+    Line numbers of every word matched by the selectors, read from the word
+    table and ordered by location, like get_words_by_locations.
+
+    Returns:
+        list: (surah, ayah, position, line_number) tuples.
+        str: An error message if more than WORD_LOCATIONS_MAX_WORDS words match.
+    """
+    word_table = await get_word_table()
+    rows = set()
+    for from_location, to_location in selectors:
+        lower = from_location if len(from_location) == 3 else (*from_location, 0)
+        upper = to_location if len(to_location) == 3 else (*to_location, 2 ** 31 - 1)
+        matched = word_table.rows_between(lower, upper)
+        if len(matched) > WORD_LOCATIONS_MAX_WORDS:
+            return f"Too many words requested. The maximum is {WORD_LOCATIONS_MAX_WORDS}."
+        rows.update(matched)
+        if len(rows) > WORD_LOCATIONS_MAX_WORDS:
+            return f"Too many words requested. The maximum is {WORD_LOCATIONS_MAX_WORDS}."
+    return [(*word_table.location(row), word_table.row_line_number(row)) for row in sorted(rows)]
+
+
 async def get_line_number(session: AsyncSession, surah_number: int, ayah_number: int, position: int):
     """
     Retrieve the line number of a word given its Surah number, Ayah number, and position.
@@ -27,14 +254,8 @@ async def get_line_number(session: AsyncSession, surah_number: int, ayah_number:
         RuntimeError: If an unexpected error occurs.
     """
     try:
-        result = await session.execute(
-            select(Word.line_number).filter(
-                Word.surat_id == surah_number,
-                Word.numberinsurat == ayah_number,
-                Word.position == position
-            )
-        )
-        line_number = result.scalar_one_or_none()
+        word_table = await get_word_table()
+        line_number = word_table.line_number(surah_number, ayah_number, position)
 
         if line_number is not None:
             return line_number
@@ -63,13 +284,11 @@ async def get_line_numbers_without_position(session: AsyncSession, surah_number:
         RuntimeError: If an unexpected error occurs.
     """
     try:
-        result = await session.execute(
-            select(Word.line_number).filter(
-                Word.surat_id == surah_number,
-                Word.numberinsurat.in_(ayah_numbers)
-            ).order_by(Word.numberinsurat, Word.position)
-        )
-        line_numbers = result.all()
+        word_table = await get_word_table()
+        line_numbers = []
+        for ayah_number in sorted(set(ayah_numbers)):
+            start, end = word_table.ayah_rows(surah_number, ayah_number)
+            line_numbers.extend((word_table.line_numbers[row] if word_table.line_numbers[row] != -1 else None,) for row in range(start, end))
 
         if line_numbers:
             return line_numbers
@@ -0,0 +1,57 @@
+# Audio API Documentation
+# Response examples for the audio playlist endpoint
+
+getAudioPlaylistResponse = {
+    200: {
+        "description": "Playlist of the verse-by-verse audio of an audio edition for a surah, page, juz or ayah range. The JSON manifest carries the edition's URL templates and one item per ayah; the M3U playlist can be loaded directly by audio players.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 200,
+                    "status": "OK",
+                    "data": {
+                        "edition": {
+                            "identifier": "ar.alafasy",
+                            "language": "ar",
+                            "name": "مشاري العفاسي",
+                            "englishName": "Alafasy",
+                            "format": "audio",
+                            "type": "versebyverse",
+                            "direction": None
+                        },
+                        "templates": {
+                            "audio": "https://quranhub.b-cdn.net/quran/audio/versebyverse/128/ar.alafasy/{number}.mp3",
+                            "audioSecondary": [
+                                "https://quranhub.b-cdn.net/quran/audio/versebyverse/64/ar.alafasy/{number}.mp3"
+                            ]
+                        },
+                        "count": 7,
+                        "items": [
+                            {
+                                "number": 1,
+                                "surah": 1,
+                                "numberInSurah": 1,
+                                "audio": "https://quranhub.b-cdn.net/quran/audio/versebyverse/128/ar.alafasy/1.mp3"
+                            }
+                        ]
+                    }
+                }
+            },
+            "audio/x-mpegurl": {
+                "example": "#EXTM3U\n#PLAYLIST:Alafasy\n#EXTINF:-1,Alafasy - 1:1\nhttps://quranhub.b-cdn.net/quran/audio/versebyverse/128/ar.alafasy/1.mp3\n"
+            }
+        }
+    },
+    400: {
+        "description": "Bad request. Check the edition identifier, that exactly one of surah, page, juz or range is given, and the requested format.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 400,
+                    "status": "Error",
+                    "data": "Something went wrong: Edition is not an audio edition."
+                }
+            }
+        }
+    }
+}
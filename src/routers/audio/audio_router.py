@@ -0,0 +1,87 @@
+from typing import Optional
+from fastapi import APIRouter, Query, Path
+from fastapi.responses import JSONResponse, Response
+
+from repositories import audio_repo
+from .audio_docs import getAudioPlaylistResponse
+from utils.logger import logger
+from utils.helpers import add_cache_headers
+
+audio_router = APIRouter()
+
+
+def _error_response(message: str):
+    response = JSONResponse(
+        content={"code": 400, "status": "Error", "data": message},
+        status_code=400
+    )
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@audio_router.get(
+    "/playlist/{editionIdentifier}",
+    responses=getAudioPlaylistResponse,
+    tags=["Audio"],
+    name="Get Audio Playlist",
+    summary="Get an audio playlist for a surah, page, juz or ayah range",
+    description="Returns the verse-by-verse audio URLs of an audio edition for a surah, page, juz or ayah range, as a JSON manifest or an M3U playlist. Ayah texts are not fetched; URLs are generated from the edition's URL templates, which are included in the JSON manifest so clients can build URLs for secondary bitrates themselves.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint to load audio for a whole surah, page or juz in one request instead of fetching ayahs with an audio edition. Give exactly one of surah, page, juz or range. Use format=m3u to hand the playlist directly to an audio player.",
+        "x-mcp-example": {
+            "name": "get_audio_playlist_v1_audio_playlist_editionIdentifier_get",
+            "arguments": {"editionIdentifier": "ar.alafasy", "juz": 30}
+        }
+    }
+)
+async def get_audio_playlist(
+    editionIdentifier: str = Path(..., description="A valid audio edition identifier", example="ar.alafasy"),
+    surah: Optional[int] = Query(None, description="Surah number (1-114)", example=1, ge=1, le=114),
+    page: Optional[int] = Query(None, description="Page number (1-604)", example=1, ge=1, le=604),
+    juz: Optional[int] = Query(None, description="Juz number (1-30)", example=30, ge=1, le=30),
+    range: Optional[str] = Query(None, description="Ayah range as two references (global number or surah:ayah) joined by '-'", example="2:1-2:5"),
+    format: str = Query("json", description="Playlist format: 'json' or 'm3u'", example="json")
+):
+    try:
+        if format not in audio_repo.PLAYLIST_FORMATS:
+            return _error_response("Format should be one of: " + ", ".join(audio_repo.PLAYLIST_FORMATS))
+
+        selectors = [value for value in (surah, page, juz, range) if value is not None]
+        if len(selectors) != 1:
+            return _error_response("Exactly one of surah, page, juz or range is required")
+
+        from_reference = to_reference = None
+        if range is not None:
+            from_reference, _, to_reference = range.partition("-")
+            if not from_reference or not to_reference:
+                return _error_response("Range should be given as fromReference-toReference")
+
+        data = await audio_repo.get_audio_playlist(
+            editionIdentifier,
+            surah=surah,
+            page=page,
+            juz=juz,
+            from_reference=from_reference,
+            to_reference=to_reference
+        )
+        if isinstance(data, str):
+            return _error_response(f"Something went wrong: {data}")
+
+        if format == "m3u":
+            response = Response(
+                content=audio_repo.render_m3u(data),
+                media_type=audio_repo.PLAYLIST_FORMATS["m3u"]
+            )
+        else:
+            response = JSONResponse(
+                content={"code": 200, "status": "OK", "data": data},
+                status_code=200
+            )
+
+        selector = f"surah:{surah}" if surah is not None else f"page:{page}" if page is not None else f"juz:{juz}" if juz is not None else f"range:{range}"
+        add_cache_headers(response, cache_tag=f"audio:playlist:{editionIdentifier}:{selector}:{format}")
+        return response
+
+    except Exception as e:
+        logger.exception("An exception occurred while fetching audio playlist for edition %s: %s", editionIdentifier, str(e))
+        return _error_response("Something went wrong")
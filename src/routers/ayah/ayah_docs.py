@@ -448,3 +448,382 @@ getTheAyahAudioResponse = {
         }
     }
 }
+
+getAyahBatchResponse = {
+    200: {
+    "description": "Returns one item per (reference, edition) pair, in the order of the request. Each item has its own status, so invalid references or missing ayahs do not fail the whole batch.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 200,
+                    "status": "OK",
+                    "data": [
+                        {
+                            "reference": "2:255",
+                            "edition": "quran-uthmani",
+                            "status": "OK",
+                            "data": {
+                                "number": 262,
+                                "text": "ٱللَّهُ لَآ إِلَـٰهَ إِلَّا هُوَ ٱلْحَىُّ ٱلْقَيُّومُ ۚ لَا تَأْخُذُهُۥ سِنَةٌۭ وَلَا نَوْمٌۭ ۚ لَّهُۥ مَا فِى ٱلسَّمَـٰوَٰتِ وَمَا فِى ٱلْأَرْضِ ۗ مَن ذَا ٱلَّذِى يَشْفَعُ عِندَهُۥٓ إِلَّا بِإِذْنِهِۦ ۚ يَعْلَمُ مَا بَيْنَ أَيْدِيهِمْ وَمَا خَلْفَهُمْ ۖ وَلَا يُحِيطُونَ بِشَىْءٍۢ مِّنْ عِلْمِهِۦٓ إِلَّا بِمَا شَآءَ ۚ وَسِعَ كُرْسِيُّهُ ٱلسَّمَـٰوَٰتِ وَٱلْأَرْضَ ۖ وَلَا يَـُٔودُهُۥ حِفْظُهُمَا ۚ وَهُوَ ٱلْعَلِىُّ ٱلْعَظِيمُ",
+                                "edition": {
+                                    "identifier": "quran-uthmani",
+                                    "language": "ar",
+                                    "name": "Uthmani",
+                                    "englishName": "Uthmani",
+                                    "format": "text",
+                                    "type": "quran",
+                                    "direction": "rtl"
+                                },
+                                "surah": {
+                                    "number": 2,
+                                    "name": "سورة البقرة",
+                                    "englishName": "Al-Baqara",
+                                    "englishNameTranslation": "The Cow",
+                                    "revelationType": "Medinan",
+                                    "numberOfAyahs": 286
+                                },
+                                "numberInSurah": 255,
+                                "juz": 3,
+                                "manzil": 1,
+                                "page": 42,
+                                "ruku": 35,
+                                "hizbQuarter": 17,
+                                "sajda": False
+                            }
+                        },
+                        {
+                            "reference": "2:999",
+                            "edition": "quran-uthmani",
+                            "status": "Error",
+                            "data": "Ayah not found."
+                        }
+                    ]
+                }
+            }
+        }
+    },
+    400: {
+    "description": "Bad request. The batch could not be processed. Check that references and editions are provided and within the allowed limits.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 400,
+                    "status": "Error",
+                    "data": "A batch can contain at most 100 references."
+                }
+            }
+        }
+    }
+}
+
+getAyahRangeResponse = {
+    200: {
+    "description": "Returns the ayahs of the range in the default edition, ordered by ayah number. Large ranges are streamed.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 200,
+                    "status": "OK",
+                    "data": [
+                        {
+                            "number": 8,
+                            "text": "الم",
+                            "edition": {
+                                "identifier": "quran-simple",
+                                "language": "ar",
+                                "name": "Simple",
+                                "englishName": "Simple",
+                                "format": "text",
+                                "type": "quran",
+                                "direction": "rtl"
+                            },
+                            "surah": {
+                                "number": 2,
+                                "name": "سورة البقرة",
+                                "englishName": "Al-Baqara",
+                                "englishNameTranslation": "The Cow",
+                                "revelationType": "Medinan",
+                                "numberOfAyahs": 286
+                            },
+                            "numberInSurah": 1,
+                            "juz": 1,
+                            "manzil": 1,
+                            "page": 2,
+                            "ruku": 2,
+                            "hizbQuarter": 1,
+                            "sajda": False
+                        },
+                        {
+                            "number": 9,
+                            "text": "ذَٰلِكَ الْكِتَابُ لَا رَيْبَ ۛ فِيهِ ۛ هُدًى لِلْمُتَّقِينَ",
+                            "edition": {
+                                "identifier": "quran-simple",
+                                "language": "ar",
+                                "name": "Simple",
+                                "englishName": "Simple",
+                                "format": "text",
+                                "type": "quran",
+                                "direction": "rtl"
+                            },
+                            "surah": {
+                                "number": 2,
+                                "name": "سورة البقرة",
+                                "englishName": "Al-Baqara",
+                                "englishNameTranslation": "The Cow",
+                                "revelationType": "Medinan",
+                                "numberOfAyahs": 286
+                            },
+                            "numberInSurah": 2,
+                            "juz": 1,
+                            "manzil": 1,
+                            "page": 2,
+                            "ruku": 2,
+                            "hizbQuarter": 1,
+                            "sajda": False
+                        }
+                    ]
+                }
+            }
+        }
+    },
+    400: {
+    "description": "Bad request. The range could not be retrieved. Check that both references are valid and the first comes before the last.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 400,
+                    "status": "Error",
+                    "data": "Something wrong happened: Invalid range: the first ayah comes after the last ayah."
+                }
+            }
+        }
+    }
+}
+
+getAyahRangebyEditionResponse = {
+    200: {
+    "description": "Returns the ayahs of the range in the specified edition, ordered by ayah number. Large ranges are streamed.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 200,
+                    "status": "OK",
+                    "data": [
+                        {
+                            "number": 8,
+                            "text": "الم",
+                            "edition": {
+                                "identifier": "quran-simple",
+                                "language": "ar",
+                                "name": "Simple",
+                                "englishName": "Simple",
+                                "format": "text",
+                                "type": "quran",
+                                "direction": "rtl"
+                            },
+                            "surah": {
+                                "number": 2,
+                                "name": "سورة البقرة",
+                                "englishName": "Al-Baqara",
+                                "englishNameTranslation": "The Cow",
+                                "revelationType": "Medinan",
+                                "numberOfAyahs": 286
+                            },
+                            "numberInSurah": 1,
+                            "juz": 1,
+                            "manzil": 1,
+                            "page": 2,
+                            "ruku": 2,
+                            "hizbQuarter": 1,
+                            "sajda": False
+                        },
+                        {
+                            "number": 9,
+                            "text": "ذَٰلِكَ الْكِتَابُ لَا رَيْبَ ۛ فِيهِ ۛ هُدًى لِلْمُتَّقِينَ",
+                            "edition": {
+                                "identifier": "quran-simple",
+                                "language": "ar",
+                                "name": "Simple",
+                                "englishName": "Simple",
+                                "format": "text",
+                                "type": "quran",
+                                "direction": "rtl"
+                            },
+                            "surah": {
+                                "number": 2,
+                                "name": "سورة البقرة",
+                                "englishName": "Al-Baqara",
+                                "englishNameTranslation": "The Cow",
+                                "revelationType": "Medinan",
+                                "numberOfAyahs": 286
+                            },
+                            "numberInSurah": 2,
+                            "juz": 1,
+                            "manzil": 1,
+                            "page": 2,
+                            "ruku": 2,
+                            "hizbQuarter": 1,
+                            "sajda": False
+                        }
+                    ]
+                }
+            }
+        }
+    },
+    400: {
+    "description": "Bad request. The range could not be retrieved for the specified edition. Check the references or edition identifier and try again.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 400,
+                    "status": "Error",
+                    "data": "Something wrong happened: Edition not found"
+                }
+            }
+        }
+    }
+}
+
+getAyahRangebyEditionsResponse = {
+    200: {
+    "description": "Returns one list of ayahs per edition, in the order of the requested editions. Large ranges are streamed.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 200,
+                    "status": "OK",
+                    "data": [
+                        [
+                            {
+                                "number": 8,
+                                "text": "الم",
+                                "edition": {
+                                    "identifier": "quran-simple",
+                                    "language": "ar",
+                                    "name": "Simple",
+                                    "englishName": "Simple",
+                                    "format": "text",
+                                    "type": "quran",
+                                    "direction": "rtl"
+                                },
+                                "surah": {
+                                    "number": 2,
+                                    "name": "سورة البقرة",
+                                    "englishName": "Al-Baqara",
+                                    "englishNameTranslation": "The Cow",
+                                    "revelationType": "Medinan",
+                                    "numberOfAyahs": 286
+                                },
+                                "numberInSurah": 1,
+                                "juz": 1,
+                                "manzil": 1,
+                                "page": 2,
+                                "ruku": 2,
+                                "hizbQuarter": 1,
+                                "sajda": False
+                            },
+                            {
+                                "number": 9,
+                                "text": "ذَٰلِكَ الْكِتَابُ لَا رَيْبَ ۛ فِيهِ ۛ هُدًى لِلْمُتَّقِينَ",
+                                "edition": {
+                                    "identifier": "quran-simple",
+                                    "language": "ar",
+                                    "name": "Simple",
+                                    "englishName": "Simple",
+                                    "format": "text",
+                                    "type": "quran",
+                                    "direction": "rtl"
+                                },
+                                "surah": {
+                                    "number": 2,
+                                    "name": "سورة البقرة",
+                                    "englishName": "Al-Baqara",
+                                    "englishNameTranslation": "The Cow",
+                                    "revelationType": "Medinan",
+                                    "numberOfAyahs": 286
+                                },
+                                "numberInSurah": 2,
+                                "juz": 1,
+                                "manzil": 1,
+                                "page": 2,
+                                "ruku": 2,
+                                "hizbQuarter": 1,
+                                "sajda": False
+                            }
+                        ],
+                        [
+                            {
+                                "number": 8,
+                                "text": "Alif, Lam, Meem.",
+                                "edition": {
+                                    "identifier": "en.sahih",
+                                    "language": "en",
+                                    "name": "Saheeh International",
+                                    "englishName": "Saheeh International",
+                                    "format": "text",
+                                    "type": "translation",
+                                    "direction": "ltr"
+                                },
+                                "surah": {
+                                    "number": 2,
+                                    "name": "سورة البقرة",
+                                    "englishName": "Al-Baqara",
+                                    "englishNameTranslation": "The Cow",
+                                    "revelationType": "Medinan",
+                                    "numberOfAyahs": 286
+                                },
+                                "numberInSurah": 1,
+                                "juz": 1,
+                                "manzil": 1,
+                                "page": 2,
+                                "ruku": 2,
+                                "hizbQuarter": 1,
+                                "sajda": False
+                            },
+                            {
+                                "number": 9,
+                                "text": "This is the Book about which there is no doubt, a guidance for those conscious of Allah -",
+                                "edition": {
+                                    "identifier": "en.sahih",
+                                    "language": "en",
+                                    "name": "Saheeh International",
+                                    "englishName": "Saheeh International",
+                                    "format": "text",
+                                    "type": "translation",
+                                    "direction": "ltr"
+                                },
+                                "surah": {
+                                    "number": 2,
+                                    "name": "سورة البقرة",
+                                    "englishName": "Al-Baqara",
+                                    "englishNameTranslation": "The Cow",
+                                    "revelationType": "Medinan",
+                                    "numberOfAyahs": 286
+                                },
+                                "numberInSurah": 2,
+                                "juz": 1,
+                                "manzil": 1,
+                                "page": 2,
+                                "ruku": 2,
+                                "hizbQuarter": 1,
+                                "sajda": False
+                            }
+                        ]
+                    ]
+                }
+            }
+        }
+    },
+    400: {
+    "description": "Bad request. The range could not be retrieved for the specified editions. Check the references or edition identifiers and try again.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 400,
+                    "status": "Error",
+                    "data": "Something wrong happened: Edition not found"
+                }
+            }
+        }
+    }
+}
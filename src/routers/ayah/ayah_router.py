@@ -1,8 +1,11 @@
 
 
-from fastapi import APIRouter, Query, Path
-from fastapi.responses import JSONResponse
+from typing import List, Union
+from fastapi import APIRouter, Query, Path, Body
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
 from utils.helpers import add_cache_headers
+from utils.dataset import render_json
 
 # Constants for repeated strings
 ERROR_SOMETHING_WRONG = "Something went wrong"
@@ -12,20 +15,30 @@ CACHE_NO_CACHE = "no-cache, no-store, must-revalidate"
 
 import random
 from repositories import ayah_repo  # Using the repository now
+from repositories import ayah_fast_repo
 from .ayah_docs import (
 getTheAyahbyEditionsResponse,
 getTheAyahbyEditionResponse,
 getTheAyahResponse,
 getRandomAyahbyEditionsResponse,
 getRandomAyahbyEditionResponse,
-getRandomAyahResponse
+getRandomAyahResponse,
+getAyahBatchResponse,
+getAyahRangeResponse,
+getAyahRangebyEditionResponse,
+getAyahRangebyEditionsResponse
 )
 from utils.logger import logger 
-from utils.config import DEFAULT_EDITION_IDENTIFIER
+from utils.config import DEFAULT_EDITION_IDENTIFIER, AYAH_FAST_PATH_ENABLED, AYAH_BATCH_MAX_REFERENCES, AYAH_BATCH_MAX_EDITIONS, AYAH_RANGE_STREAM_THRESHOLD
 
 ayah_router = APIRouter()
 
 
+class AyahBatchRequest(BaseModel):
+    references: List[Union[int, str]] = Field(..., description="Ayah references as global ayah numbers or surah:ayah", example=["2:255", 1, "112:1"])
+    editions: List[str] = Field([DEFAULT_EDITION_IDENTIFIER], description="Valid edition identifiers", example=["quran-uthmani", "en.sahih"])
+
+
 @ayah_router.get(
     "/random",
     responses=getRandomAyahResponse,
@@ -179,6 +192,234 @@ async def get_random_ayah_by_editions(
         return response
     
 
+@ayah_router.post(
+    "/batch",
+    responses=getAyahBatchResponse,
+    tags=["Ayah"],
+    name="Get Ayahs in Batch",
+    summary="Get many ayahs by reference for one or more editions",
+    description=f"Resolves a list of ayah references (global numbers or surah:ayah) for one or more editions in a single request. Results are returned in input order, one item per reference and edition, each with its own status. Up to {AYAH_BATCH_MAX_REFERENCES} references and {AYAH_BATCH_MAX_EDITIONS} editions per request.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint instead of calling /v1/ayah/{reference}/{editionIdentifier} many times. Check the 'status' of each item, since a missing ayah or invalid reference does not fail the whole batch.",
+        "x-mcp-example": {
+            "name": "get_ayahs_in_batch_v1_ayah_batch_post",
+            "arguments": {"references": ["2:255", 1, "112:1"], "editions": ["quran-uthmani", "en.sahih"]}
+        }
+    }
+)
+async def get_ayahs_batch(
+    batch: AyahBatchRequest = Body(..., description="The ayah references and edition identifiers to resolve")
+):
+    try:
+        editions = [edition.strip() for edition in batch.editions if edition.strip()]
+        error = None
+        if not batch.references:
+            error = "At least one ayah reference must be provided."
+        elif not editions:
+            error = "At least one valid edition identifier must be provided."
+        elif len(batch.references) > AYAH_BATCH_MAX_REFERENCES:
+            error = f"A batch can contain at most {AYAH_BATCH_MAX_REFERENCES} references."
+        elif len(editions) > AYAH_BATCH_MAX_EDITIONS:
+            error = f"A batch can contain at most {AYAH_BATCH_MAX_EDITIONS} editions."
+
+        if error:
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": error},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = CACHE_NO_STORE
+            return response
+
+        data = await ayah_repo.get_ayahs_batch(batch.references, editions)
+
+        if isinstance(data, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": f"Something wrong happened: {data}"},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = CACHE_NO_STORE
+            return response
+
+        return JSONResponse(
+            content={"code": 200, "status": "OK", "data": data},
+            status_code=200
+        )
+
+    except Exception as e:
+        logger.exception("An exception occurred while fetching ayah batch: %s", e)
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": ERROR_SOMETHING_WRONG},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = CACHE_NO_STORE
+        return response
+
+
+async def _stream_ayah_range(bounds, multiple_editions: bool):
+    yield b'{"code":200,"status":"OK","data":['
+    try:
+        for index, (edition, edition_id, start, end) in enumerate(bounds):
+            if multiple_editions:
+                yield b",[" if index else b"["
+            first = True
+            async for chunk in ayah_repo.iter_ayah_range(edition, edition_id, start, end):
+                for ayah in chunk:
+                    yield render_json(ayah) if first else b"," + render_json(ayah)
+                    first = False
+            if multiple_editions:
+                yield b"]"
+    except Exception as e:
+        # Abort the response: closing the body would make a truncated range look complete
+        logger.exception("An exception occurred while streaming ayah range: %s", e)
+        raise
+    yield b"]}"
+
+
+async def _get_ayah_range_response(fromReference: str, toReference: str, edition_identifiers: list, multiple_editions: bool, cache_tag: str):
+    bounds = await ayah_repo.get_ayah_range_bounds(fromReference, toReference, edition_identifiers)
+
+    if isinstance(bounds, str):
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": f"Something wrong happened: {bounds}"},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = CACHE_NO_STORE
+        return response
+
+    # Large spans are streamed instead of being built in memory
+    if sum(end - start + 1 for _, _, start, end in bounds) > AYAH_RANGE_STREAM_THRESHOLD:
+        response = StreamingResponse(
+            _stream_ayah_range(bounds, multiple_editions),
+            media_type="application/json"
+        )
+        add_cache_headers(response, cache_tag=cache_tag)
+        return response
+
+    data = await ayah_repo.get_ayah_range(bounds)
+
+    if isinstance(data, str):
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": f"Something wrong happened: {data}"},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = CACHE_NO_STORE
+        return response
+
+    response = JSONResponse(
+        content={"code": 200, "status": "OK", "data": data if multiple_editions else data[0]},
+        status_code=200
+    )
+    add_cache_headers(response, cache_tag=cache_tag)
+    return response
+
+
+@ayah_router.get(
+    "/range/{fromReference}-{toReference}",
+    responses=getAyahRangeResponse,
+    tags=["Ayah"],
+    name="Get Ayah Range",
+    summary="Get a range of ayahs (e.g. 2:1-2:50)",
+    description="Returns all ayahs between two references in the default edition, including ranges that cross surahs (e.g., 2:280-3:10). References are global ayah numbers or surah:ayah in Hafs numbering. Large ranges are streamed.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint to fetch a passage in one request instead of calling /v1/ayah/{reference} for each ayah.",
+        "x-mcp-example": {
+            "name": "get_ayah_range_v1_ayah_range_fromReference__toReference_get",
+            "arguments": {"fromReference": "2:1", "toReference": "2:5"}
+        }
+    }
+)
+async def get_ayah_range(
+    fromReference: str = Path(..., description="First ayah of the range, as global ayah number or surah:ayah", example="2:1"),
+    toReference: str = Path(..., description="Last ayah of the range, as global ayah number or surah:ayah", example="2:5")
+):
+    try:
+        return await _get_ayah_range_response(
+            fromReference, toReference, [DEFAULT_EDITION_IDENTIFIER], False,
+            f"ayah:range:{fromReference}-{toReference}"
+        )
+
+    except Exception as e:
+        logger.exception("An exception occurred while fetching ayah range: %s", e)
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": ERROR_SOMETHING_WRONG},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = CACHE_NO_STORE
+        return response
+
+
+@ayah_router.get(
+    "/range/{fromReference}-{toReference}/editions/{editionIdentifiers}",
+    responses=getAyahRangebyEditionsResponse,
+    tags=["Ayah"],
+    name="Get Ayah Range by Multiple Editions",
+    summary="Get a range of ayahs in multiple editions",
+    description="Returns all ayahs between two references for multiple editions, as one list of ayahs per edition. For editions of other narrations (e.g., Warsh), the range is mapped through the narrations numbering so it covers the same passage. Large ranges are streamed.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint to compare a passage across translations or narrations. Provide a comma-separated list of edition identifiers; the response has one list per edition in the same order.",
+        "x-mcp-example": {
+            "name": "get_ayah_range_by_editions_v1_ayah_range_fromReference__toReference_editions_editionIdentifiers_get",
+            "arguments": {"fromReference": "2:1", "toReference": "2:5", "editionIdentifiers": "quran-uthmani,en.sahih"}
+        }
+    }
+)
+async def get_ayah_range_by_editions(
+    fromReference: str = Path(..., description="First ayah of the range, as global ayah number or surah:ayah", example="2:1"),
+    toReference: str = Path(..., description="Last ayah of the range, as global ayah number or surah:ayah", example="2:5"),
+    editionIdentifiers: str = Path(..., description="Valid edition identifiers, separated by commas", example="quran-uthmani,en.sahih")
+):
+    try:
+        return await _get_ayah_range_response(
+            fromReference, toReference, editionIdentifiers.split(','), True,
+            f"ayah:range:{fromReference}-{toReference}:editions:{editionIdentifiers}"
+        )
+
+    except Exception as e:
+        logger.exception("An exception occurred while fetching ayah range by editions: %s", e)
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": ERROR_SOMETHING_WRONG},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = CACHE_NO_STORE
+        return response
+
+
+@ayah_router.get(
+    "/range/{fromReference}-{toReference}/{editionIdentifier}",
+    responses=getAyahRangebyEditionResponse,
+    tags=["Ayah"],
+    name="Get Ayah Range by Edition",
+    summary="Get a range of ayahs by edition",
+    description="Returns all ayahs between two references for a specified edition. For editions of other narrations (e.g., Warsh), the range is mapped through the narrations numbering so it covers the same passage. Large ranges are streamed.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint to fetch a passage in a specific edition in one request instead of calling /v1/ayah/{reference}/{editionIdentifier} for each ayah.",
+        "x-mcp-example": {
+            "name": "get_ayah_range_by_edition_v1_ayah_range_fromReference__toReference_editionIdentifier_get",
+            "arguments": {"fromReference": "2:1", "toReference": "2:5", "editionIdentifier": "quran-uthmani"}
+        }
+    }
+)
+async def get_ayah_range_by_edition(
+    fromReference: str = Path(..., description="First ayah of the range, as global ayah number or surah:ayah", example="2:1"),
+    toReference: str = Path(..., description="Last ayah of the range, as global ayah number or surah:ayah", example="2:5"),
+    editionIdentifier: str = Path(..., description="A valid edition identifier for edition", example="quran-uthmani")
+):
+    try:
+        return await _get_ayah_range_response(
+            fromReference, toReference, [editionIdentifier], False,
+            f"ayah:range:{fromReference}-{toReference}:edition:{editionIdentifier}"
+        )
+
+    except Exception as e:
+        logger.exception("An exception occurred while fetching ayah range by edition: %s", e)
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": ERROR_SOMETHING_WRONG},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = CACHE_NO_STORE
+        return response
+
+
 @ayah_router.get(
     "/{reference}",
     responses=getTheAyahResponse,
@@ -198,6 +439,13 @@ async def get_the_ayah(
     reference: str = Path(..., description="Reference can be global ayah number or surah:ayah format", example="2:255")
 ):
     try:
+        if AYAH_FAST_PATH_ENABLED:
+            body = await ayah_fast_repo.get_ayah_body(reference, DEFAULT_EDITION_IDENTIFIER)
+            if body is not None:
+                response = Response(content=body, media_type="application/json")
+                add_cache_headers(response, cache_tag=f"ayah:{reference}")
+                return response
+
         if ":" in reference:
             ayah_number_list = reference.split(":")
             data = await ayah_repo.get_an_ayah_by_surah_number(
@@ -261,6 +509,13 @@ async def get_the_ayah_by_edition(
     editionIdentifier: str = Path(..., description="A valid edition identifier for edition", example="quran-uthmani")
 ):
     try:
+        if AYAH_FAST_PATH_ENABLED:
+            body = await ayah_fast_repo.get_ayah_body(reference, editionIdentifier)
+            if body is not None:
+                response = Response(content=body, media_type="application/json")
+                add_cache_headers(response, cache_tag=f"ayah:{reference}:edition:{editionIdentifier}")
+                return response
+
         if ":" in reference:
             ayah_number_list = reference.split(":")
             data = await ayah_repo.get_an_ayah_by_surah_number(
@@ -1,6 +1,6 @@
 APPLICATION_JSON = "application/json"
 
-__all__ = ["getAyahThemesResponse", "getThemesForAyahResponse"]
+__all__ = ["getAyahThemesResponse", "getThemesForAyahResponse", "getThemesByKeywordResponse", "getThemeAyahsQueryResponse"]
 
 getAyahThemesResponse = {
     200: {
@@ -108,3 +108,83 @@ getThemesForAyahResponse = {
         }
     }
 }
+getThemesByKeywordResponse = {
+    200: {
+        "description": "Returns the themes tagged with a keyword, with their ids for theme queries.",
+        "content": {
+            APPLICATION_JSON: {
+                "examples": {
+                    "success": {
+                        "summary": "Canonical success response",
+                        "value": [
+                            {
+                                "id": 3,
+                                "name": "How can you deny Allah?",
+                                "keywords": ["Allah"],
+                                "totalAyahs": 2
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+    },
+    404: {
+        "description": "No themes found for this keyword.",
+        "content": {
+            APPLICATION_JSON: {
+                "examples": {
+                    "not_found": {
+                        "summary": "No themes found for this keyword",
+                        "value": {"code": 404, "status": "Not Found", "data": "No themes found for this keyword."}
+                    }
+                }
+            }
+        }
+    }
+}
+getThemeAyahsQueryResponse = {
+    200: {
+        "description": "Returns the total number of ayahs matching the theme query and the requested page of ayahs.",
+        "content": {
+            APPLICATION_JSON: {
+                "examples": {
+                    "success": {
+                        "summary": "Canonical success response",
+                        "value": {
+                            "total": 1,
+                            "ayahs": [
+                                {
+                                    "number": 37,
+                                    "text": "فَتَلَقَّىٰٓ ءَادَمُ مِن رَّبِّهِۦ كَلِمَـٰتٍۢ فَتَابَ عَلَيْهِ ۚ إِنَّهُۥ هُوَ ٱلتَّوَّابُ ٱلرَّحِيمُ",
+                                    "numberInSurah": 30,
+                                    "surah": {
+                                        "number": 2,
+                                        "name": "سُورَةُ البَقَرَةِ",
+                                        "englishName": "Al-Baqara",
+                                        "englishNameTranslation": "The Cow",
+                                        "revelationType": "Medinan",
+                                        "numberOfAyahs": 286
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Invalid theme query.",
+        "content": {
+            APPLICATION_JSON: {
+                "examples": {
+                    "invalid_query": {
+                        "summary": "No theme or keyword given",
+                        "value": {"code": 400, "status": "Error", "data": "Something went wrong: At least one theme or keyword to match is required"}
+                    }
+                }
+            }
+        }
+    }
+}
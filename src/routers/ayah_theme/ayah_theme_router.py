@@ -1,10 +1,12 @@
 
 
 
+from typing import Optional
 from fastapi import APIRouter, Query, Path
 from fastapi.responses import JSONResponse
-from repositories.ayah_theme_repo import get_all_themes, get_themes_for_ayah
-from .ayah_theme_docs import getAyahThemesResponse, getThemesForAyahResponse
+from repositories.ayah_theme_repo import get_all_themes, get_themes_for_ayah, get_themes_by_keyword, query_theme_ayahs
+from .ayah_theme_docs import getAyahThemesResponse, getThemesForAyahResponse, getThemesByKeywordResponse, getThemeAyahsQueryResponse
+from utils.config import DEFAULT_EDITION_IDENTIFIER
 from utils.helpers import add_cache_headers
 
 ayah_theme_router = APIRouter()
@@ -45,6 +47,97 @@ async def get_ayah_themes(
 
 
 
+def _parse_theme_ids(value: Optional[str]):
+    """Parse a comma-separated list of theme ids; None if any id is invalid."""
+    if not value:
+        return []
+    try:
+        return [int(theme_id) for theme_id in value.split(",") if theme_id.strip()]
+    except ValueError:
+        return None
+
+
+@ayah_theme_router.get(
+    "/themes/keyword/{keyword}",
+    tags=["Ayah Theme"],
+    summary="Get themes by keyword",
+    description="Returns the themes tagged with a keyword (case-insensitive), with the theme ids used by the theme query endpoint.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint to find the ids of the themes about a topic before combining them with /v1/ayah-theme/query.",
+        "x-mcp-example": {"keyword": "Adam"}
+    },
+    responses=getThemesByKeywordResponse
+)
+async def get_themes_by_keyword_endpoint(
+    keyword: str = Path(..., description="Theme keyword", example="Adam")
+):
+    themes = await get_themes_by_keyword(keyword)
+    if not themes:
+        response = JSONResponse(
+            content={"code": 404, "status": "Not Found", "data": "No themes found for this keyword."},
+            status_code=404
+        )
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    response = JSONResponse(
+        content={
+            "code": 200,
+            "status": "OK",
+            "data": [
+                {
+                    "id": t.theme_id,
+                    "name": t.name,
+                    "keywords": t.keywords,
+                    "totalAyahs": t.total_ayahs
+                } for t in themes
+            ]
+        },
+        status_code=200
+    )
+    add_cache_headers(response, cache_tag=f"ayah_theme:keyword:{keyword}")
+    return response
+
+
+@ayah_theme_router.get(
+    "/query",
+    tags=["Ayah Theme"],
+    summary="Query ayahs by a combination of themes",
+    description="Returns the ayahs that are in all themes of `all`, in at least one theme of `any` or tagged with one of `keywords`, and in none of the themes of `not`, optionally within a surah or juz. Ayahs are returned in mushaf order from the given edition with the total number of matches for pagination.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint to explore where themes meet, e.g. all=3,6 for the ayahs in both themes, or any=3&not=6 for the ayahs of theme 3 outside theme 6. Get theme ids from /v1/ayah-theme/themes/keyword/{keyword}.",
+        "x-mcp-example": {"all": "3,6", "edition": "quran-uthmani", "limit": 20, "offset": 0}
+    },
+    responses=getThemeAyahsQueryResponse
+)
+async def query_theme_ayahs_endpoint(
+    all_of: Optional[str] = Query(None, alias="all", description="Comma-separated theme ids the ayahs must all be in", example="3,6"),
+    any_of: Optional[str] = Query(None, alias="any", description="Comma-separated theme ids the ayahs must be in at least one of", example="1,2"),
+    none_of: Optional[str] = Query(None, alias="not", description="Comma-separated theme ids the ayahs must not be in", example="5"),
+    keywords: Optional[str] = Query(None, description="Comma-separated keywords; their themes are matched like `any`", example="Adam"),
+    surah: Optional[int] = Query(None, ge=1, le=114, description="Only ayahs of this surah"),
+    juz: Optional[int] = Query(None, ge=1, le=30, description="Only ayahs of this juz"),
+    edition: str = Query(DEFAULT_EDITION_IDENTIFIER, description="Edition the ayahs are returned from", example="quran-uthmani"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of ayahs to return (default 20, max 100)."),
+    offset: int = Query(0, ge=0, description="Number of ayahs to skip for pagination (default 0).")
+):
+    theme_ids = [_parse_theme_ids(value) for value in (all_of, any_of, none_of)]
+    if any(ids is None for ids in theme_ids):
+        data = "Theme ids should be comma-separated integers"
+    else:
+        keyword_list = [keyword.strip() for keyword in (keywords or "").split(",") if keyword.strip()]
+        data = await query_theme_ayahs(
+            edition, *theme_ids, keywords=keyword_list, surah=surah, juz=juz, limit=limit, offset=offset
+        )
+    if isinstance(data, str):
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": f"Something went wrong: {data}"},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    response = JSONResponse(content={"code": 200, "status": "OK", "data": data}, status_code=200)
+    add_cache_headers(response, cache_tag=f"ayah_theme:query:{all_of}:{any_of}:{none_of}:{keywords}:{surah}:{juz}:{edition}:{limit}:{offset}")
+    return response
 
 
 @ayah_theme_router.get(
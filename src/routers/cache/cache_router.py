@@ -0,0 +1,56 @@
+import hmac
+from typing import List
+from fastapi import APIRouter, Header
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from utils.cache import purge
+from utils.config import CACHE_PURGE_TOKEN
+from utils.logger import logger
+
+cache_router = APIRouter()
+
+
+class CachePurgeRequest(BaseModel):
+    tags: List[str] = []
+    prefixes: List[str] = []
+
+
+def _error(status_code: int, message: str):
+    response = JSONResponse(
+        content={"code": status_code, "status": "Error", "data": message},
+        status_code=status_code
+    )
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@cache_router.post("/purge", include_in_schema=False)
+async def purge_cache(
+    request: CachePurgeRequest,
+    authorization: str = Header(None)
+):
+    """
+    Purge origin cache entries by Cache-Tag or Cache-Tag prefix, e.g. after a
+    data correction. Authenticated with `Authorization: Bearer <CACHE_PURGE_TOKEN>`;
+    disabled when no token is configured.
+    """
+    if not CACHE_PURGE_TOKEN:
+        return _error(404, "Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), CACHE_PURGE_TOKEN.encode()):
+        return _error(401, "Unauthorized")
+    tags = [tag for tag in request.tags if tag]
+    prefixes = [prefix for prefix in request.prefixes if prefix]
+    if not tags and not prefixes:
+        return _error(400, "At least one tag or prefix is required")
+
+    try:
+        data = await purge(tags=tags, prefixes=prefixes)
+    except Exception as e:
+        logger.exception("An exception occurred while purging the cache: %s", str(e))
+        return _error(500, "Something went wrong while purging the cache")
+
+    response = JSONResponse(content={"code": 200, "status": "OK", "data": data}, status_code=200)
+    response.headers["Cache-Control"] = "no-store"
+    return response
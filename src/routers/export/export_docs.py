@@ -0,0 +1,28 @@
+# Export API Documentation
+# Response examples for the streaming bulk export endpoint
+
+getEditionExportResponse = {
+    200: {
+        "description": "Streams every ayah of the edition with its division metadata, one record per ayah. NDJSON and CSV are supported. Responses served from a generated artifact support Range requests for resuming interrupted downloads.",
+        "content": {
+            "application/x-ndjson": {
+                "example": "{\"number\": 1, \"surah\": 1, \"numberInSurah\": 1, \"juz\": 1, \"manzil\": 1, \"page\": 1, \"ruku\": 1, \"hizbQuarter\": 1, \"hizb\": 1, \"sajda\": false, \"text\": \"بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ\"}\n{\"number\": 2, \"surah\": 1, \"numberInSurah\": 2, \"juz\": 1, \"manzil\": 1, \"page\": 1, \"ruku\": 1, \"hizbQuarter\": 1, \"hizb\": 1, \"sajda\": false, \"text\": \"الْحَمْدُ لِلَّهِ رَبِّ الْعَالَمِينَ\"}\n"
+            },
+            "text/csv": {
+                "example": "number,surah,numberInSurah,juz,manzil,page,ruku,hizbQuarter,hizb,sajda,text\n1,1,1,1,1,1,1,1,1,False,بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ\n2,1,2,1,1,1,1,1,1,False,الْحَمْدُ لِلَّهِ رَبِّ الْعَالَمِينَ\n"
+            }
+        }
+    },
+    400: {
+        "description": "Bad request. The edition could not be exported. Check the edition identifier and the requested format.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 400,
+                    "status": "Error",
+                    "data": "Something went wrong: Edition not found"
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,86 @@
+import os
+from fastapi import APIRouter, Query, Path, Request
+from fastapi.responses import JSONResponse, StreamingResponse, FileResponse
+
+from repositories import export_repo
+from .export_docs import getEditionExportResponse
+from utils.logger import logger
+from utils.helpers import add_cache_headers
+
+export_router = APIRouter()
+
+
+@export_router.get(
+    "/{editionIdentifier}",
+    responses=getEditionExportResponse,
+    tags=["Export"],
+    name="Export Edition",
+    summary="Stream a complete edition as NDJSON or CSV",
+    description="Streams every ayah of an edition with its juz, manzil, page, ruku, hizbQuarter, hizb and sajda metadata as NDJSON or CSV. The export is read with a server-side cursor and sent with chunked transfer, so memory stays constant for any edition size. Once generated, the export is kept as an artifact that supports Range requests for resuming downloads.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint to mirror a whole edition in one request instead of fetching it surah by surah. Use format=csv for spreadsheets and format=ndjson for line-by-line processing.",
+        "x-mcp-example": {
+            "name": "export_edition_v1_export_editionIdentifier_get",
+            "arguments": {"editionIdentifier": "quran-uthmani", "format": "ndjson"}
+        }
+    }
+)
+async def export_edition(
+    request: Request,
+    editionIdentifier: str = Path(..., description="A valid edition identifier for the edition", example="quran-uthmani"),
+    format: str = Query("ndjson", description="Export format: 'ndjson' or 'csv'", example="ndjson")
+):
+    try:
+        if format not in export_repo.EXPORT_FORMATS:
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": "Format should be one of: " + ", ".join(export_repo.EXPORT_FORMATS)},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await export_repo.get_export_edition(editionIdentifier)
+        if isinstance(data, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": f"Something went wrong: {data}"},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        edition, edition_id = data
+        media_type = export_repo.EXPORT_FORMATS[format]
+        filename = f"{edition.identifier}.{format}"
+        artifact_path = export_repo.get_export_artifact_path(edition.identifier, format)
+
+        # Range/resume requests need a stable artifact on disk
+        if request.headers.get("range") and not os.path.exists(artifact_path):
+            artifact_path = await export_repo.build_export_artifact(edition, edition_id, format)
+            if not artifact_path:
+                response = JSONResponse(
+                    content={"code": 500, "status": "Error", "data": "Something went wrong while generating the export"},
+                    status_code=500
+                )
+                response.headers["Cache-Control"] = "no-store"
+                return response
+
+        if os.path.exists(artifact_path):
+            response = FileResponse(artifact_path, media_type=media_type, filename=filename)
+        else:
+            response = StreamingResponse(
+                export_repo.stream_export(edition, edition_id, format, artifact_path),
+                media_type=media_type,
+                headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+            )
+
+        add_cache_headers(response, cache_tag=f"export:{editionIdentifier}:{format}")
+        return response
+
+    except Exception as e:
+        logger.exception("An exception occurred while exporting edition %s: %s", editionIdentifier, str(e))
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": "Something went wrong"},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = "no-store"
+        return response
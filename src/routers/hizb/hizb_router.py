@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Query, Path
 from fastapi.responses import JSONResponse
 from utils.helpers import add_cache_headers
+from utils.fields import parse_fields, HIZB_AYAH_LAYOUT
 
 from repositories import hizb_repo  # Using the repository now
 from .hizb_docs import (
@@ -124,7 +125,9 @@ async def get_all_hizbs_metadata_by_edition(
 async def get_hizb_by_number(
     hizbNumber: int = Path(..., ge=1, le=60, description="An integer between 1 and 60"),
     limit: int = Query(None, description="The number of ayahs that the response will be limited to.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a hizb by the given number", example=0)
+    offset: int = Query(None, description="Offset ayahs in a hizb by the given number", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text"),
+    compact: bool = Query(False, description="Send each surah once in the top-level 'surahs' list and reference it by number from the ayahs.", example=False)
 ):
     try:
         # Validate hizbNumber range
@@ -137,7 +140,16 @@ async def get_hizb_by_number(
             return response
 
         # Fetch hizb data
-        data = await hizb_repo.get_hizb(hizbNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset)
+        parsed_fields = parse_fields(fields, layout=HIZB_AYAH_LAYOUT)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await hizb_repo.get_hizb(hizbNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset, parsed_fields, compact)
 
         # Check if data is an error message (string)
         if isinstance(data, str):
@@ -186,7 +198,9 @@ async def get_hizb_by_edition(
     hizbNumber: int = Path(..., ge=1, le=60, description="An integer between 1 and 60"),
     editionIdentifier: str = Path(..., description="A valid edition identifier for edition", example="quran-uthmani"),
     limit: int = Query(None, description="The number of ayahs that the response will be limited to.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a hizb by the given number", example=0)
+    offset: int = Query(None, description="Offset ayahs in a hizb by the given number", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text"),
+    compact: bool = Query(False, description="Send each surah once in the top-level 'surahs' list and reference it by number from the ayahs.", example=False)
 ):
     try:
         # Validate hizbNumber range
@@ -199,7 +213,16 @@ async def get_hizb_by_edition(
             return response
 
         # Fetch hizb data for a specific edition
-        data = await hizb_repo.get_hizb(hizbNumber, editionIdentifier, limit, offset)
+        parsed_fields = parse_fields(fields, layout=HIZB_AYAH_LAYOUT)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await hizb_repo.get_hizb(hizbNumber, editionIdentifier, limit, offset, parsed_fields, compact)
 
         # Check if data is an error message (string)
         if isinstance(data, str):
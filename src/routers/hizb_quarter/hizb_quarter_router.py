@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Query, Path
 from fastapi.responses import JSONResponse
 from utils.helpers import add_cache_headers
+from utils.fields import parse_fields
 
 from repositories import hizb_quarter_repo  # Using the repository now
 from .hizb_quarter_docs import (
@@ -30,7 +31,8 @@ hizb_quarter_router = APIRouter()
 async def get_hizb_quarter_by_number(
     hizbQuarterNumber: int = Path(..., ge=1, le=240, description="An integer between 1 and 240"),
     limit: int = Query(None, description="The number of ayahs that the response will be limited to.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a hizb quarter by the given number", example=0)
+    offset: int = Query(None, description="Offset ayahs in a hizb quarter by the given number", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         # Validate hizbQuarterNumber range
@@ -43,7 +45,16 @@ async def get_hizb_quarter_by_number(
             return response
 
         # Fetch hizb quarter data
-        data = await hizb_quarter_repo.get_hizb_quarter(hizbQuarterNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await hizb_quarter_repo.get_hizb_quarter(hizbQuarterNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset, parsed_fields)
 
         # Check if data is an error message (string)
         if isinstance(data, str):
@@ -88,7 +99,8 @@ async def get_hizb_quarter_by_edition(
     hizbQuarterNumber: int = Path(..., ge=1, le=240, description="An integer between 1 and 240"),
     editionIdentifier: str = Path(..., description="A valid edition identifier for edition", example="quran-uthmani"),
     limit: int = Query(None, description="The number of ayahs that the response will be limited to.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a hizb quarter by the given number", example=0)
+    offset: int = Query(None, description="Offset ayahs in a hizb quarter by the given number", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         # Validate hizbQuarterNumber range
@@ -101,7 +113,16 @@ async def get_hizb_quarter_by_edition(
             return response
 
         # Fetch hizb quarter data
-        data = await hizb_quarter_repo.get_hizb_quarter(hizbQuarterNumber, editionIdentifier, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await hizb_quarter_repo.get_hizb_quarter(hizbQuarterNumber, editionIdentifier, limit, offset, parsed_fields)
 
         # Check if data is an error message (string)
         if isinstance(data, str):
@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Query, Path
 from fastapi.responses import JSONResponse
 from utils.helpers import add_cache_headers
+from utils.fields import parse_fields
 
 from repositories import juz_repo  # Using the repository now
 from .juz_docs import (
@@ -110,7 +111,9 @@ async def get_all_juzs_metadata_by_edition(
 async def get_the_juz(
     juzNumber: int = Path(..., ge=1, le=30, description="Juz number (1-30)"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a juz by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a juz by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text"),
+    compact: bool = Query(False, description="Send each surah once in the top-level 'surahs' list and reference it by number from the ayahs.", example=False)
 ):
     try:
         if juzNumber < 1 or juzNumber > 30:
@@ -121,7 +124,17 @@ async def get_the_juz(
             response.headers["Cache-Control"] = "no-store"
             return response
 
-        data = await juz_repo.get_juz(juzNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        cache_tag = f"juz:{juzNumber}"
+        data = await juz_repo.get_juz(juzNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset, parsed_fields, compact, cache_tag=cache_tag)
 
         if isinstance(data, str):
             response = JSONResponse(
@@ -135,7 +148,7 @@ async def get_the_juz(
             content={"code": 200, "status": "OK", "data": data},
             status_code=200
         )
-        add_cache_headers(response, cache_tag=f"juz:{juzNumber}")
+        add_cache_headers(response, cache_tag=cache_tag)
         return response
 
     except Exception as e:
@@ -163,7 +176,9 @@ async def get_the_juz_by_edition(
     juzNumber: int = Path(..., ge=1, le=30, description="Juz number (1-30)"),
     editionIdentifier: str = Path(..., description="Edition identifier (e.g., 'quran-uthmani')", example="quran-uthmani"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a juz by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a juz by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text"),
+    compact: bool = Query(False, description="Send each surah once in the top-level 'surahs' list and reference it by number from the ayahs.", example=False)
 ):
     try:
         if juzNumber < 1 or juzNumber > 30:
@@ -174,7 +189,17 @@ async def get_the_juz_by_edition(
             response.headers["Cache-Control"] = "no-store"
             return response
 
-        data = await juz_repo.get_juz(juzNumber, editionIdentifier, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        cache_tag = f"juz:{juzNumber}:edition:{editionIdentifier}"
+        data = await juz_repo.get_juz(juzNumber, editionIdentifier, limit, offset, parsed_fields, compact, cache_tag=cache_tag)
 
         if isinstance(data, str):
             response = JSONResponse(
@@ -188,7 +213,7 @@ async def get_the_juz_by_edition(
             content={"code": 200, "status": "OK", "data": data},
             status_code=200
         )
-        add_cache_headers(response, cache_tag=f"juz:{juzNumber}:edition:{editionIdentifier}")
+        add_cache_headers(response, cache_tag=cache_tag)
         return response
 
     except Exception as e:
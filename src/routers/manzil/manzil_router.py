@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Query, Path
 from fastapi.responses import JSONResponse
 from utils.helpers import add_cache_headers
+from utils.fields import parse_fields
 
 from repositories import manzil_repo  # Using the repository now
 from .manzil_docs import (
@@ -27,7 +28,8 @@ manzil_router = APIRouter()
 async def get_manzil_by_number(
     manzilNumber: int = Path(..., ge=1, le=7, description="Manzil number (1-7)"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a manzil by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a manzil by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         # Validation (although Path already does ge/le, but you want extra safety log)
@@ -40,7 +42,16 @@ async def get_manzil_by_number(
             return response
 
         # Fetch manzil data
-        data = await manzil_repo.get_manzil(manzilNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await manzil_repo.get_manzil(manzilNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset, parsed_fields)
 
         # Check if data retrieval failed
         if isinstance(data, str):
@@ -84,7 +95,8 @@ async def get_manzil_by_edition(
     manzilNumber: int = Path(..., ge=1, le=7, description="Manzil number (1-7)"),
     editionIdentifier: str = Path(..., description="Edition identifier (e.g., 'quran-uthmani')", example="quran-uthmani"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a manzil by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a manzil by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         # Manual Validation
@@ -97,7 +109,16 @@ async def get_manzil_by_edition(
             return response
 
         # Fetch Manzil by Edition
-        data = await manzil_repo.get_manzil(manzilNumber, editionIdentifier, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await manzil_repo.get_manzil(manzilNumber, editionIdentifier, limit, offset, parsed_fields)
 
         # Check for error
         if isinstance(data, str):
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Query, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from repositories import meta_repo  # Using the repository now
 from .meta_docs import (
@@ -8,6 +8,7 @@ getAllMetaResponse
 
 from utils.logger import logger
 from utils.helpers import add_cache_headers
+from utils.dataset import get_precomputed_body
 
 meta_router = APIRouter()
 
@@ -29,8 +30,8 @@ meta_router = APIRouter()
 )
 async def get_all_meta():
     try:
-        # Fetch meta data
-        data = await meta_repo.get_meta()
+        # Meta data is precomputed once per dataset version
+        data = await get_precomputed_body("meta:all", meta_repo.get_meta)
 
         # Check if data is an error message (string)
         if isinstance(data, str):
@@ -42,10 +43,7 @@ async def get_all_meta():
             return response
 
         # Return successful response
-        response = JSONResponse(
-            content={"code": 200, "status": "OK", "data": data},
-            status_code=200
-        )
+        response = Response(content=data, media_type="application/json")
         add_cache_headers(response, cache_tag="meta:all")
         return response
 
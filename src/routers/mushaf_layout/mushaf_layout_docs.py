@@ -5,7 +5,8 @@ __all__ = [
     "getMushafLayoutDetailResponse",
     "getMushafLayoutPageLinesResponse",
     "getMushafLayoutSurahLinesResponse",
-    "getMushafLayoutLookupResponse"
+    "getMushafLayoutLookupResponse",
+    "getMushafLayoutPageBundleResponse"
 ]
 
 getMushafLayoutsResponse = {
@@ -153,16 +154,66 @@ getMushafLayoutLookupResponse = {
                         "summary": "No lines found for lookup (404)",
                         "value": {"code": 404, "status": "Not Found", "data": "No lines found for lookup."},
                         "status": 404
-                    },
-                    "bad_request": {
-                        "summary": "Range too large (400)",
-                        "value": {"code": 400, "status": "Bad Request", "data": "The difference between toWord and fromWord must not be greater than 20."},
-                        "status": 400
                     }
                 }
             }
         }
     },
-    400: {"description": "The difference between toWord and fromWord must not be greater than 20."},
     404: {"description": "No lines found for lookup."}
 }
+
+getMushafLayoutPageBundleResponse = {
+    200: {
+        "description": "Render bundle for a mushaf page: layout, font with its page files, and the page lines with their words and word images.",
+        "content": {
+            APPLICATION_JSON: {
+                "examples": {
+                    "success": {
+                        "summary": "Canonical success response",
+                        "value": {
+                            "code": 200,
+                            "status": "OK",
+                            "data": {
+                                "layout": {"code": "qpc-v1-15-lines", "name": "QPC V1 15 lines", "numberOfPages": 604, "linesPerPage": 15},
+                                "font": {
+                                    "code": "qpc-v1",
+                                    "name": "QPC V1",
+                                    "category": "glyph",
+                                    "pageFiles": {"woff2": "https://quranhub.b-cdn.net/quran/fonts/qpc-v1/pages/p1.woff2"}
+                                },
+                                "pageNumber": 1,
+                                "lines": [
+                                    {"lineNumber": 1, "lineType": "surah_name", "isCentered": True, "surahNumber": 1, "fromWord": None, "toWord": None, "words": []},
+                                    {
+                                        "lineNumber": 2,
+                                        "lineType": "ayah",
+                                        "isCentered": True,
+                                        "surahNumber": 1,
+                                        "fromWord": 1,
+                                        "toWord": 5,
+                                        "words": [
+                                            {
+                                                "id": 1,
+                                                "location": "1:1:1",
+                                                "verseKey": "1:1",
+                                                "position": 1,
+                                                "text": "بِسۡمِ",
+                                                "images": {"v4": "https://quranhub.b-cdn.net/quran/images/word/v4/1:1:1.png", "rq": None, "qa": None}
+                                            }
+                                        ]
+                                    }
+                                ]
+                            }
+                        }
+                    },
+                    "not_found": {
+                        "summary": "Layout or page not found (404)",
+                        "value": {"code": 404, "status": "Not Found", "data": "Layout or page not found."},
+                        "status": 404
+                    }
+                }
+            }
+        }
+    },
+    404: {"description": "Layout or page not found."}
+}
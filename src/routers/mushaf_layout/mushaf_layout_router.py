@@ -2,8 +2,8 @@
 from fastapi import APIRouter, Query, Path
 from fastapi.responses import JSONResponse
 from utils.helpers import add_cache_headers
-from repositories.mushaf_layout_repo import get_layouts, get_layout_by_code, get_layout_font, get_lines_for_page, get_lines_for_surah, lookup_lines
-from routers.mushaf_layout.mushaf_layout_docs import getMushafLayoutsResponse, getMushafLayoutDetailResponse, getMushafLayoutPageLinesResponse, getMushafLayoutSurahLinesResponse, getMushafLayoutLookupResponse
+from repositories.mushaf_layout_repo import get_layouts, get_layout_by_code, get_layout_font, get_lines_for_page, get_lines_for_surah, lookup_lines, get_page_bundle
+from routers.mushaf_layout.mushaf_layout_docs import getMushafLayoutsResponse, getMushafLayoutDetailResponse, getMushafLayoutPageLinesResponse, getMushafLayoutSurahLinesResponse, getMushafLayoutLookupResponse, getMushafLayoutPageBundleResponse
 
 
 mushaf_layout_router = APIRouter()
@@ -126,6 +126,33 @@ async def layout_page_lines(
     add_cache_headers(response, cache_tag=f"mushaf_layout:page:{layoutCode}:{pageNumber}")
     return response
 
+@mushaf_layout_router.get(
+    "/{layoutCode}/pages/{pageNumber}/bundle",
+    tags=["Mushaf Layout"],
+    summary="Get a page render bundle",
+    description="Get everything needed to render a mushaf page in one request: the page lines with their words, glyph text and word image URLs, plus the layout font and its files for the page.",
+    openapi_extra={
+        "x-agent-hints": "Use this endpoint to render a mushaf page with a single request instead of combining the page lines, page words, font page files and word image endpoints.",
+        "x-mcp-example": {"code": "qpc-v1-15-lines", "pageNumber": 1}
+    },
+    responses=getMushafLayoutPageBundleResponse
+)
+async def layout_page_bundle(
+    layoutCode: str = Path(..., alias="layoutCode", description="Mushaf layout code (e.g., 'qpc-v1-15-lines')"),
+    pageNumber: int = Path(..., ge=1, alias="pageNumber")
+):
+    bundle = await get_page_bundle(layoutCode, pageNumber)
+    if isinstance(bundle, str):
+        response = JSONResponse(status_code=404, content={"code": 404, "status": "Not Found", "data": bundle})
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    response = JSONResponse(
+        content={"code": 200, "status": "OK", "data": bundle},
+        status_code=200
+    )
+    add_cache_headers(response, cache_tag=f"mushaf_layout:bundle:{layoutCode}:{pageNumber}")
+    return response
+
 @mushaf_layout_router.get(
     "/{layoutCode}/surah/{surahNumber}",
     tags=["Mushaf Layout"],
@@ -175,7 +202,7 @@ async def layout_surah_lines(
     "/{layoutCode}/word/{fromWord}/{toWord}",
     tags=["Mushaf Layout"],
     summary="Lookup page/line spans",
-    description="Lookup page/line spans by word id range. The maximum allowed range (toWord - fromWord) is 20.",
+    description="Lookup page/line spans by word id range. Any span is supported, so whole ayah ranges can be mapped to page and line positions.",
     openapi_extra={
         "x-agent-hints": "Use this endpoint to lookup page/line spans by word id range in a mushaf layout.",
         "x-mcp-example": {"code": "qpc-v1-15-lines", "fromWord": 100, "toWord": 120}
@@ -187,10 +214,6 @@ async def layout_lookup(
     fromWord: int = Path(..., alias="fromWord", description="Start word id (inclusive)"),
     toWord: int = Path(..., alias="toWord", description="End word id (inclusive)")
 ):
-    if toWord - fromWord > 20:
-        response = JSONResponse(status_code=400, content={"code": 400, "status": "Bad Request", "data": "The difference between toWord and fromWord must not be greater than 20."})
-        response.headers["Cache-Control"] = "no-store"
-        return response
     layout = await get_layout_by_code(layoutCode)
     if not layout:
         response = JSONResponse(status_code=404, content={"code": 404, "status": "Not Found", "data": "Layout not found."})
@@ -10,6 +10,7 @@ from .page_docs import (
 )
 from utils.logger import logger
 from utils.helpers import add_cache_headers
+from utils.fields import parse_fields
 from utils.config import DEFAULT_EDITION_IDENTIFIER
 
 page_router = APIRouter()
@@ -109,7 +110,9 @@ async def get_page_by_number(
     pageNumber: int = Path(..., ge=1, le=604, description="Page number (1-604)"),
     words: bool = Query(False, description="Include word breakdowns for each ayah."),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a page by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a page by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text"),
+    compact: bool = Query(False, description="Send each surah once in the top-level 'surahs' list and reference it by number from the ayahs.", example=False)
 ):
     try:
         # Validate pageNumber range
@@ -122,7 +125,17 @@ async def get_page_by_number(
             return response
 
         # Fetch page data
-        data = await page_repo.get_page(pageNumber, DEFAULT_EDITION_IDENTIFIER, words, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        cache_tag = f"page:number:{pageNumber}"
+        data = await page_repo.get_page(pageNumber, DEFAULT_EDITION_IDENTIFIER, words, limit, offset, parsed_fields, compact, cache_tag=cache_tag)
 
         # Check if data is an error message (string)
         if isinstance(data, str):
@@ -138,7 +151,7 @@ async def get_page_by_number(
             content={"code": 200, "status": "OK", "data": data},
             status_code=200
         )
-        add_cache_headers(response, cache_tag=f"page:number:{pageNumber}")
+        add_cache_headers(response, cache_tag=cache_tag)
         return response
 
     except Exception as e:
@@ -166,7 +179,9 @@ async def get_page_by_edition(
     editionIdentifier: str = Path(..., description="Edition identifier (e.g., 'quran-uthmani')", example="quran-uthmani"),
     words: bool = Query(False, description="Include word breakdowns for each ayah."),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a page by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a page by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text"),
+    compact: bool = Query(False, description="Send each surah once in the top-level 'surahs' list and reference it by number from the ayahs.", example=False)
 ):
     try:
         # Validate pageNumber range
@@ -179,7 +194,17 @@ async def get_page_by_edition(
             return response
 
         # Fetch page data from the specified edition
-        data = await page_repo.get_page(pageNumber, editionIdentifier, words, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        cache_tag = f"page:number:{pageNumber}:edition:{editionIdentifier}"
+        data = await page_repo.get_page(pageNumber, editionIdentifier, words, limit, offset, parsed_fields, compact, cache_tag=cache_tag)
 
         # Check if data is an error message (string)
         if isinstance(data, str):
@@ -195,7 +220,7 @@ async def get_page_by_edition(
             content={"code": 200, "status": "OK", "data": data},
             status_code=200
         )
-        add_cache_headers(response, cache_tag=f"page:number:{pageNumber}:edition:{editionIdentifier}")
+        add_cache_headers(response, cache_tag=cache_tag)
         return response
 
     except Exception as e:
@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Query, Path
 from fastapi.responses import JSONResponse
 from utils.helpers import add_cache_headers
+from utils.fields import parse_fields
 
 from repositories import ruku_repo  # Using the repository now
 from .ruku_docs import (
@@ -28,7 +29,8 @@ ruku_router = APIRouter()
 async def get_ruku_by_number(
     rukuNumber: int = Path(..., ge=1, le=556, description="Ruku number (1-556)"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a ruku by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a ruku by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         # Validate rukuNumber range
@@ -41,7 +43,16 @@ async def get_ruku_by_number(
             return response
 
         # Fetch ruku data
-        data = await ruku_repo.get_ruku(rukuNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await ruku_repo.get_ruku(rukuNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset, parsed_fields)
         
         # Check if data is an error message (string)
         if isinstance(data, str):
@@ -86,7 +97,8 @@ async def get_ruku_by_edition(
     rukuNumber: int = Path(..., ge=1, le=556, description="Ruku number (1-556)"),
     editionIdentifier: str = Path(..., description="Edition identifier (e.g., 'quran-uthmani')", example="quran-uthmani"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a ruku by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a ruku by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         # Validate rukuNumber range
@@ -99,7 +111,16 @@ async def get_ruku_by_edition(
             return response
 
         # Fetch ruku data
-        data = await ruku_repo.get_ruku(rukuNumber, editionIdentifier, limit, offset)
+        parsed_fields = parse_fields(fields)
+        if isinstance(parsed_fields, str):
+            response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+        data = await ruku_repo.get_ruku(rukuNumber, editionIdentifier, limit, offset, parsed_fields)
 
         # Check if data is an error message (string)
         if isinstance(data, str):
@@ -39,7 +39,8 @@ async def search_quran_by_keyword(
     surahNumber: int = Query(None, description="Surah number (1-114)", ge=1, le=114),
     exactSearch: bool = Query(True, description="Exact search match required or not", example=True),
     limit: int = Query(10, description="Number of ayahs to limit the response to.", example=10, le=20),
-    offset: int = Query(0, description="Offset ayahs by the given number.", example=0, ge=0)
+    offset: int = Query(0, description="Offset ayahs by the given number.", example=0, ge=0),
+    compact: bool = Query(False, description="Send each surah once in the top-level 'surahs' list and reference it by number from the ayahs.", example=False)
 ):
     """
     Enhanced search endpoint with pg_trgm support
@@ -83,7 +84,8 @@ async def search_quran_by_keyword(
             edition_identifier=edition_id,
             exact_search=exactSearch,
             limit=limit,
-            offset=offset
+            offset=offset,
+            compact=compact
         )
         
         # Handle error responses
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Query, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 import random
 from repositories import surah_repo  # Using the repository now
@@ -13,6 +13,8 @@ getAllSurahResponse
 from utils.logger import logger
 from utils.config import DEFAULT_EDITION_IDENTIFIER
 from utils.helpers import add_cache_headers
+from utils.dataset import get_precomputed_body
+from utils.fields import parse_fields, SURAH_AYAH_LAYOUT
 
 surah_router = APIRouter()
 
@@ -34,7 +36,7 @@ async def get_all_surah(
     revelationOrder: bool = Query(False, description="If true, order by revelation order instead of canonical order.", example=False)
 ):
     try:
-        data = await surah_repo.get_all_surahs(revelationOrder)
+        data = await get_precomputed_body(f"surahs:{revelationOrder}", lambda: surah_repo.get_all_surahs(revelationOrder), tag="surahs-list")
         if isinstance(data, str):
             logger.error("Something went wrong: %s", str(data))
             error_response = JSONResponse(
@@ -43,10 +45,7 @@ async def get_all_surah(
             )
             error_response.headers["Cache-Control"] = "no-store"
             return error_response
-        response = JSONResponse(
-            content={"code": 200, "status": "OK", "data": data},
-            status_code=200
-        )
+        response = Response(content=data, media_type="application/json")
         add_cache_headers(response, cache_duration=2592000, browser_cache=3600, cache_tag="surahs-list")
         return response
     except Exception as e:
@@ -71,7 +70,7 @@ async def get_all_surah(
 )
 async def get_surahs_by_revelation_city():
     try:
-        data = await surah_repo.get_all_revelation_cities_with_surahs()
+        data = await get_precomputed_body("surahs:byRevelationCity", surah_repo.get_all_revelation_cities_with_surahs, tag="surahs-by-revelation-city")
         if isinstance(data, str):
             logger.error("Something went wrong: %s", str(data))
             error_response = JSONResponse(
@@ -80,10 +79,7 @@ async def get_surahs_by_revelation_city():
             )
             error_response.headers["Cache-Control"] = "no-store"
             return error_response
-        response = JSONResponse(
-            content={"code": 200, "status": "OK", "data": data},
-            status_code=200
-        )
+        response = Response(content=data, media_type="application/json")
         add_cache_headers(response, cache_duration=2592000, browser_cache=3600, cache_tag="surahs-by-revelation-city")
         return response
     except Exception as e:
@@ -108,7 +104,7 @@ async def get_surahs_by_revelation_city():
 )
 async def get_surahs_by_juz():
     try:
-        data = await surah_repo.get_all_juzs_with_surahs()
+        data = await get_precomputed_body("surahs:byJuz", surah_repo.get_all_juzs_with_surahs, tag="surahs-by-juz")
         if isinstance(data, str):
             logger.error("Something went wrong: %s", str(data))
             error_response = JSONResponse(
@@ -117,10 +113,7 @@ async def get_surahs_by_juz():
             )
             error_response.headers["Cache-Control"] = "no-store"
             return error_response
-        response = JSONResponse(
-            content={"code": 200, "status": "OK", "data": data},
-            status_code=200
-        )
+        response = Response(content=data, media_type="application/json")
         add_cache_headers(response, cache_duration=2592000, browser_cache=3600, cache_tag="surahs-by-juz")
         return response
     except Exception as e:
@@ -147,7 +140,8 @@ async def get_surahs_by_juz():
 async def get_the_surah(
     surahNumber: int = Path(..., ge=1, le=114, description="Surah number (1-114)"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a surah by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a surah by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         if surahNumber < 1 or surahNumber > 114:
@@ -157,7 +151,16 @@ async def get_the_surah(
             )
             error_response.headers["Cache-Control"] = "no-store"
             return error_response
-        data = await surah_repo.get_surah(surahNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset)
+        parsed_fields = parse_fields(fields, layout=SURAH_AYAH_LAYOUT)
+        if isinstance(parsed_fields, str):
+            error_response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            error_response.headers["Cache-Control"] = "no-store"
+            return error_response
+
+        data = await surah_repo.get_surah(surahNumber, DEFAULT_EDITION_IDENTIFIER, limit, offset, parsed_fields)
         if isinstance(data, str):
             error_response = JSONResponse(
                 content={"code": 400, "status": "Error", "data": f"Something went wrong: {data}"},
@@ -196,7 +199,8 @@ async def get_the_surah_by_edition(
     surahNumber: int = Path(..., ge=1, le=114, description="Surah number (1-114)"),
     editionIdentifier: str = Path(..., description="Edition identifier (e.g., 'ar.abdulbasitmurattal.hafs') as a required path parameter, not a query parameter.", example="quran-uthmani"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a surah by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a surah by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         if surahNumber < 1 or surahNumber > 114:
@@ -206,7 +210,16 @@ async def get_the_surah_by_edition(
             )
             error_response.headers["Cache-Control"] = "no-store"
             return error_response
-        data = await surah_repo.get_surah(surahNumber, editionIdentifier, limit, offset)
+        parsed_fields = parse_fields(fields, layout=SURAH_AYAH_LAYOUT)
+        if isinstance(parsed_fields, str):
+            error_response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            error_response.headers["Cache-Control"] = "no-store"
+            return error_response
+
+        data = await surah_repo.get_surah(surahNumber, editionIdentifier, limit, offset, parsed_fields)
         if isinstance(data, str):
             error_response = JSONResponse(
                 content={"code": 400, "status": "Error", "data": f"Something went wrong: {data}"},
@@ -245,7 +258,8 @@ async def get_the_surah_by_editions(
     surahNumber: int = Path(..., ge=1, le=114, description="Surah number (1-114)"),
     editionIdentifiers: str = Path(..., description="Comma-separated edition identifiers (e.g., 'quran-uthmani,en.sahih')", example="quran-uthmani,quran-simple-clean"),
     limit: int = Query(None, description="Limit the number of ayahs returned.", example=2000),
-    offset: int = Query(None, description="Offset ayahs in a surah by the given number.", example=0)
+    offset: int = Query(None, description="Offset ayahs in a surah by the given number.", example=0),
+    fields: str = Query(None, description="Comma-separated ayah fields to return (e.g., 'number,text'). Omit to return all fields.", example="number,text")
 ):
     try:
         if surahNumber < 1 or surahNumber > 114:
@@ -256,7 +270,16 @@ async def get_the_surah_by_editions(
             error_response.headers["Cache-Control"] = "no-store"
             return error_response
         edition_list = editionIdentifiers.split(',')
-        data = await surah_repo.get_surah_by_multiple_editions(surahNumber, edition_list, limit, offset)
+        parsed_fields = parse_fields(fields, layout=SURAH_AYAH_LAYOUT)
+        if isinstance(parsed_fields, str):
+            error_response = JSONResponse(
+                content={"code": 400, "status": "Error", "data": parsed_fields},
+                status_code=400
+            )
+            error_response.headers["Cache-Control"] = "no-store"
+            return error_response
+
+        data = await surah_repo.get_surah_by_multiple_editions(surahNumber, edition_list, limit, offset, parsed_fields)
         if isinstance(data, str):
             error_response = JSONResponse(
                 content={"code": 400, "status": "Error", "data": f"Something went wrong: {data}"},
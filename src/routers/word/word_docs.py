@@ -8,15 +8,31 @@ get_word_tajweed_response = {
         "description": "Returns the tajweed rules for a specific word in the Quran, identified by its location (surah:ayah:position). Use this to analyze or display tajweed for a word in context.",
         "content": {
             "application/json": {
-                "example": {
-                    "code": 200,
-                    "status": "OK",
-                    "data": {
-                        "location": "1:1:2",
-                        "tajweed": {
-                            "text": "ٱللَّهِ",
-                            "rules": [
-                                {"cls": "ham_wasl", "len": 1, "span": "ٱ", "offset": 1}
+                "examples": {
+                    "single": {
+                        "summary": "Single location",
+                        "value": {
+                            "code": 200,
+                            "status": "OK",
+                            "data": {
+                                "location": "1:1:2",
+                                "tajweed": {
+                                    "text": "ٱللَّهِ",
+                                    "rules": [
+                                        {"cls": "ham_wasl", "len": 1, "span": "ٱ", "offset": 1}
+                                    ]
+                                }
+                            }
+                        }
+                    },
+                    "multiple": {
+                        "summary": "List or range of locations (e.g. 1:1:1-1:1:2)",
+                        "value": {
+                            "code": 200,
+                            "status": "OK",
+                            "data": [
+                                {"location": "1:1:1", "tajweed": {"text": "بِسْمِ", "rules": []}},
+                                {"location": "1:1:2", "tajweed": {"text": "ٱللَّهِ", "rules": [{"cls": "ham_wasl", "len": 1, "span": "ٱ", "offset": 1}]}}
                             ]
                         }
                     }
@@ -43,12 +59,28 @@ get_word_line_number_response = {
         "description": "Returns the line number on the page for a specific word in the Quran, identified by its location (surah:ayah:position). Use this to map a word to its printed line in a Mushaf or digital display.",
         "content": {
             "application/json": {
-                "example": {
-                    "code": 200,
-                    "status": "OK",
-                    "data": {
-                        "location": "1:1:2",
-                        "line_number": 9
+                "examples": {
+                    "single": {
+                        "summary": "Single location",
+                        "value": {
+                            "code": 200,
+                            "status": "OK",
+                            "data": {
+                                "location": "1:1:2",
+                                "line_number": 9
+                            }
+                        }
+                    },
+                    "multiple": {
+                        "summary": "List or range of locations (e.g. 1:1:1-1:1:2)",
+                        "value": {
+                            "code": 200,
+                            "status": "OK",
+                            "data": [
+                                {"location": "1:1:1", "line_number": 9},
+                                {"location": "1:1:2", "line_number": 9}
+                            ]
+                        }
                     }
                 }
             }
@@ -73,13 +105,29 @@ get_word_image_response = {
         "description": "Returns the image URL for a specific word in the Quran, identified by its location (surah:ayah:position) and image type (v4, rq, qa). Use this to display a rendered image of the word in different tajweed styles or color schemes.",
         "content": {
             "application/json": {
-                "example": {
-                    "code": 200,
-                    "status": "OK",
-                    "data": {
-                        "location": "1:1:2",
-                        "type": "v4",
-                        "img_url": "https://quranhub.b-cdn.net/quran/images/word/v4/1:1:2.png"
+                "examples": {
+                    "single": {
+                        "summary": "Single location",
+                        "value": {
+                            "code": 200,
+                            "status": "OK",
+                            "data": {
+                                "location": "1:1:2",
+                                "type": "v4",
+                                "img_url": "https://quranhub.b-cdn.net/quran/images/word/v4/1:1:2.png"
+                            }
+                        }
+                    },
+                    "multiple": {
+                        "summary": "List or range of locations (e.g. 1:1:1-1:1:2)",
+                        "value": {
+                            "code": 200,
+                            "status": "OK",
+                            "data": [
+                                {"location": "1:1:1", "type": "v4", "img_url": "https://quranhub.b-cdn.net/quran/images/word/v4/1:1:1.png"},
+                                {"location": "1:1:2", "type": "v4", "img_url": "https://quranhub.b-cdn.net/quran/images/word/v4/1:1:2.png"}
+                            ]
+                        }
                     }
                 }
             }
@@ -5,6 +5,9 @@ from utils.helpers import add_cache_headers
 from sqlalchemy import select
 from db.session import AsyncSessionLocal
 from db.models import Word
+from repositories.word_repo import (
+    parse_word_locations, is_single_word_location, get_words_by_locations, get_word_line_numbers_by_locations, get_word_table
+)
 from .word_docs import (
     get_word_tajweed_response,
     get_word_line_number_response,
@@ -13,16 +16,61 @@ from .word_docs import (
 from utils.logger import logger
 
 
-LOCATION_DESC = "Location in the format surah:ayah:position"
+LOCATION_DESC = (
+    "Location in the format surah:ayah:position. Several words can be requested at once as a comma-separated list of "
+    "locations, whole ayahs (surah:ayah) and inclusive ranges (e.g. 1:1:1-1:3:2 or 2:1-2:5); the response is then an ordered list."
+)
+IMAGE_COLUMNS = {"v4": Word.v4_img_url, "rq": Word.rq_img_url, "qa": Word.qa_img_url}
 word_router = APIRouter()
 
+
+async def _get_words_response(location: str, fetch_words, build_item, cache_tag: str):
+    """
+    Answer a multi-location request with one ordered list of words.
+    `fetch_words` returns (surah, ayah, position, value) rows for the selectors.
+    """
+    selectors = parse_word_locations(location)
+    if isinstance(selectors, str):
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": selectors},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    rows = await fetch_words(selectors)
+    if isinstance(rows, str):
+        response = JSONResponse(
+            content={"code": 400, "status": "Error", "data": rows},
+            status_code=400
+        )
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    if not rows:
+        response = JSONResponse(
+            content={"code": 404, "status": "Error", "data": f"Word not found for location {location}"},
+            status_code=404
+        )
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    response = JSONResponse(
+        content={
+            "code": 200,
+            "status": "OK",
+            "data": [build_item(f"{row[0]}:{row[1]}:{row[2]}", row[3]) for row in rows]
+        },
+        status_code=200
+    )
+    add_cache_headers(response, cache_tag=cache_tag)
+    return response
+
+
 @word_router.get(
     "/tajweed",
     responses=get_word_tajweed_response,
     tags=["Word"],
     name="Get Tajweed Rules by Location",
     summary="Get tajweed rules for a word by location",
-    description="Returns the tajweed rules for a specific word in the Quran, identified by its location (surah:ayah:position). Use this to analyze or display tajweed for a word in context. The response includes the word's text and a list of tajweed rules.",
+    description="Returns the tajweed rules for a specific word in the Quran, identified by its location (surah:ayah:position), or for a list or range of words such as a whole ayah. Use this to analyze or display tajweed for a word in context. The response includes the word's text and a list of tajweed rules.",
     openapi_extra={
         "x-agent-hints": "Call this endpoint after identifying a word's location (surah:ayah:position) to retrieve its tajweed rules. Use the 'tajweed' field in the response to display or process tajweed information for the word.",
         "x-mcp-example": {
@@ -35,6 +83,12 @@ async def get_word_tajweed(
     location: str = Query(..., description=LOCATION_DESC, example="1:1:2")
 ):
     try:
+        if not is_single_word_location(location):
+            return await _get_words_response(
+                location, lambda selectors: get_words_by_locations(selectors, Word.tajweed),
+                lambda word_location, tajweed: {"location": word_location, "tajweed": tajweed},
+                f"word:tajweed:{location}"
+            )
         surah, ayah, position = map(int, location.split(":"))
         async with AsyncSessionLocal() as session:
             result = await session.execute(
@@ -81,7 +135,7 @@ async def get_word_tajweed(
     tags=["Word"],
     name="Get Line Number by Location",
     summary="Get line number for a word by location",
-    description="Returns the line number on the page for a specific word in the Quran, identified by its location (surah:ayah:position). Use this to map a word to its printed line in a Mushaf or digital display.",
+    description="Returns the line number on the page for a specific word in the Quran, identified by its location (surah:ayah:position), or for a list or range of words such as a whole ayah. Use this to map a word to its printed line in a Mushaf or digital display.",
     openapi_extra={
         "x-agent-hints": "Call this endpoint after determining a word's location to find its line number in the printed or digital Quran. Use the 'line_number' field in the response for layout or highlighting.",
         "x-mcp-example": {
@@ -94,37 +148,36 @@ async def get_word_line_number(
     location: str = Query(..., description=LOCATION_DESC, example="1:1:2")
 ):
     try:
+        if not is_single_word_location(location):
+            return await _get_words_response(
+                location, get_word_line_numbers_by_locations,
+                lambda word_location, line_number: {"location": word_location, "line_number": line_number},
+                f"word:line_number:{location}"
+            )
         surah, ayah, position = map(int, location.split(":"))
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(Word.line_number).filter(
-                    Word.surat_id == surah,
-                    Word.numberinsurat == ayah,
-                    Word.position == position
-                )
+        word_table = await get_word_table()
+        line_number = word_table.line_number(surah, ayah, position)
+        if line_number is not None:
+            response = JSONResponse(
+                content={
+                    "code": 200,
+                    "status": "OK",
+                    "data": {
+                        "location": location,
+                        "line_number": line_number
+                    }
+                },
+                status_code=200
             )
-            line_number = result.scalar_one_or_none()
-            if line_number is not None:
-                response = JSONResponse(
-                    content={
-                        "code": 200,
-                        "status": "OK",
-                        "data": {
-                            "location": location,
-                            "line_number": line_number
-                        }
-                    },
-                    status_code=200
-                )
-                add_cache_headers(response, cache_tag=f"word:line_number:{location}")
-                return response
-            else:
-                response = JSONResponse(
-                    content={"code": 404, "status": "Error", "data": f"Word not found for location {location}"},
-                    status_code=404
-                )
-                response.headers["Cache-Control"] = "no-store"
-                return response
+            add_cache_headers(response, cache_tag=f"word:line_number:{location}")
+            return response
+        else:
+            response = JSONResponse(
+                content={"code": 404, "status": "Error", "data": f"Word not found for location {location}"},
+                status_code=404
+            )
+            response.headers["Cache-Control"] = "no-store"
+            return response
     except Exception as e:
         logger.error(f"Error in get_word_line_number: {e}", exc_info=True)
         response = JSONResponse(
@@ -142,6 +195,7 @@ async def get_word_line_number(
     summary="Get per-word image by location and type",
     description=(
         "Returns the image URL for a specific word in the Quran, identified by its location (surah:ayah:position) and image type (v4, rq, qa). "
+        "A list or range of locations, such as a whole ayah, returns an ordered list of image URLs. "
         "Use this to display a rendered image of the word in different tajweed styles or color schemes. "
         "The response includes the image URL and type."
     ),
@@ -167,6 +221,19 @@ async def get_word_image(
     )
 ):
     try:
+        if not is_single_word_location(location):
+            if type not in IMAGE_COLUMNS:
+                response = JSONResponse(
+                    content={"code": 400, "status": "Error", "data": f"Invalid image type: {type}"},
+                    status_code=400
+                )
+                response.headers["Cache-Control"] = "no-store"
+                return response
+            return await _get_words_response(
+                location, lambda selectors: get_words_by_locations(selectors, IMAGE_COLUMNS[type]),
+                lambda word_location, img_url: {"location": word_location, "type": type, "img_url": img_url},
+                f"word:image:{location}:{type}"
+            )
         surah, ayah, position = map(int, location.split(":"))
         async with AsyncSessionLocal() as session:
             result = await session.execute(
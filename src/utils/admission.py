@@ -0,0 +1,153 @@
+import asyncio
+from collections import deque
+from urllib.parse import parse_qsl
+from utils.config import (
+    ADMISSION_HEAVY_PREFIXES, ADMISSION_HEAVY_LIMIT, ADMISSION_HEAVY_QUEUE,
+    ADMISSION_PRIORITY_PREFIXES, ADMISSION_PRIORITY_LIMIT, ADMISSION_PRIORITY_QUEUE,
+    ADMISSION_DEFAULT_LIMIT, ADMISSION_DEFAULT_QUEUE, ADMISSION_QUEUE_TIMEOUT, ADMISSION_RETRY_AFTER
+)
+from utils.dataset import render_json
+from utils.logger import logger
+
+_limiters = {}
+
+
+class ConcurrencyLimiter:
+    """
+    Admits at most `limit` concurrent requests of a route group. Requests
+    over the limit wait in a FIFO queue of at most `queue_limit` entries;
+    a request is shed when the queue is full or it waited `timeout` seconds.
+    """
+
+    def __init__(self, name: str, limit: int, queue_limit: int, timeout: float = ADMISSION_QUEUE_TIMEOUT):
+        self.name = name
+        self.limit = limit
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self.active = 0
+        self.waiters = deque()
+        self.metrics = {"admitted": 0, "queued": 0, "shed": 0, "timeouts": 0}
+        _limiters[name] = self
+
+    async def acquire(self) -> bool:
+        """Wait for a slot. Returns False when the request is shed."""
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            self.metrics["admitted"] += 1
+            return True
+        if len(self.waiters) >= self.queue_limit:
+            self.metrics["shed"] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        self.metrics["queued"] += 1
+        try:
+            # release() hands its slot over to the waiter
+            await asyncio.wait_for(waiter, self.timeout)
+        except asyncio.TimeoutError:
+            self.metrics["timeouts"] += 1
+            self.metrics["shed"] += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+        self.metrics["admitted"] += 1
+        return True
+
+    def release(self):
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self.active -= 1
+
+    def get_metrics(self):
+        return {
+            **self.metrics,
+            "active": self.active,
+            "waiting": len(self.waiters),
+            "limit": self.limit,
+            "queueLimit": self.queue_limit,
+        }
+
+
+def get_admission_metrics():
+    """Load of every route group, by name."""
+    return {name: limiter.get_metrics() for name, limiter in _limiters.items()}
+
+
+def _matches(path: str, prefixes) -> bool:
+    # Whole path segments only, so /v1/ayah does not match /v1/ayah-theme
+    return any(path == prefix or path.startswith(prefix + "/") for prefix in prefixes if prefix)
+
+
+def is_fuzzy_search(scope) -> bool:
+    if not _matches(scope["path"], ("/v1/search",)):
+        return False
+    query = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+    return query.get("exactSearch", "true").lower() in ("false", "0", "no", "off")
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware limiting concurrent API requests per route group, so
+    heavy endpoints (complete editions, ayah ranges and batches, narration
+    differences, fuzzy search) cannot take the whole connection pool. Cheap
+    lookups have their own priority lane and are never queued behind heavy
+    requests. Requests that cannot be admitted get a 503 with Retry-After
+    right away.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.priority = ConcurrencyLimiter("priority", ADMISSION_PRIORITY_LIMIT, ADMISSION_PRIORITY_QUEUE)
+        self.heavy = ConcurrencyLimiter("heavy", ADMISSION_HEAVY_LIMIT, ADMISSION_HEAVY_QUEUE)
+        self.default = ConcurrencyLimiter("default", ADMISSION_DEFAULT_LIMIT, ADMISSION_DEFAULT_QUEUE)
+
+    def route_group(self, scope):
+        """The limiter of a request, or None for requests outside the API."""
+        path = scope["path"]
+        if not path.startswith("/v1/"):
+            return None
+        # Heavy prefixes are matched first, as some (ayah ranges and batches) sit under priority ones
+        if _matches(path, ADMISSION_HEAVY_PREFIXES) or is_fuzzy_search(scope):
+            return self.heavy
+        if _matches(path, ADMISSION_PRIORITY_PREFIXES):
+            return self.priority
+        return self.default
+
+    async def __call__(self, scope, receive, send):
+        limiter = self.route_group(scope) if scope["type"] == "http" else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            logger.warning(f"Shedding {scope['path']}: {limiter.name} requests at capacity.")
+            await self._send_busy(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def _send_busy(self, send):
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"retry-after", str(ADMISSION_RETRY_AFTER).encode()),
+                (b"cache-control", b"no-store"),
+            ],
+        })
+        await send({
+            "type": "http.response.body",
+            "body": render_json({"code": 503, "status": "Error", "data": "The server is busy, please try again later."}),
+        })
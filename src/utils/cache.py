@@ -0,0 +1,299 @@
+import asyncio
+import functools
+import json
+import time
+import urllib.request
+import uuid
+import zlib
+from cachetools import LRUCache
+from utils.cache_store import CacheStoreError, escape_pattern, open_cache_store
+from utils.config import (
+    CACHE_STORE_URL, CACHE_STORE_RETRY_INTERVAL, CACHE_LOCAL_MAX_BYTES, CACHE_TTL, CACHE_COMPRESSION_LEVEL,
+    CACHE_PURGE_POLL_INTERVAL, CACHE_PURGE_EVENT_TTL, CACHE_PURGE_WEBHOOK_URL
+)
+from utils.dataset import get_dataset_version, render_json, purge_precomputed_bodies
+from utils.logger import logger
+
+# Two cache tiers: an LRU in each process, then the shared store (if
+# configured) so a result computed by one worker is a hit for all others.
+# Keys carry the dataset version, so a new dataset never reads old entries.
+# Both tiers hold (tag, compressed JSON) entries; the local LRU is bounded by
+# their size and values are decoded on every hit, so callers get their own copy.
+_local = LRUCache(maxsize=CACHE_LOCAL_MAX_BYTES, getsizeof=lambda entry: len(entry[1]))
+_store = {"store": None, "opened": False, "down_until": 0.0}
+_metrics = {"localHits": 0, "sharedHits": 0, "misses": 0, "storeErrors": 0, "purges": 0, "purgedEntries": 0}
+
+# Other in-memory caches register a handler to take part in purges, and
+# purge hooks (e.g. a CDN purge) receive every purge event
+_purge_handlers = [purge_precomputed_bodies]
+_purge_hooks = []
+_purge_sync = {"checked_at": 0.0, "seen": set()}
+PURGE_EVENT_PREFIX = "quranhub:purge:"
+
+
+def get_cache_store():
+    """The shared store, or None when none is configured or it is unavailable."""
+    if not _store["opened"]:
+        _store["store"] = open_cache_store(CACHE_STORE_URL)
+        _store["opened"] = True
+    if _store["store"] is None or time.monotonic() < _store["down_until"]:
+        return None
+    return _store["store"]
+
+
+def set_cache_store(store):
+    """Use another shared store, e.g. a MemoryStore stand-in."""
+    _store.update(store=store, opened=True, down_until=0.0)
+
+
+def _store_failed(error):
+    # Skip the store for a while instead of paying its timeout on every request
+    _metrics["storeErrors"] += 1
+    _store["down_until"] = time.monotonic() + CACHE_STORE_RETRY_INTERVAL
+    logger.warning(f"Shared cache store unavailable, using the local tier only: {error}")
+
+
+def _key_prefix() -> str:
+    return f"quranhub:{get_dataset_version()}:"
+
+
+def cache_key(tag: str, namespace: str, *parts) -> str:
+    """
+    Versioned cache key of an entry. The entry's Cache-Tag leads the key, so
+    entries can be purged by tag or tag prefix with a key pattern.
+    """
+    return _key_prefix() + tag + "#" + ":".join([namespace, *(str(part) for part in parts)])
+
+
+def _key_part(value):
+    # Field sets come in any order; everything else is keyed by its repr
+    if isinstance(value, (set, frozenset)):
+        return repr(sorted(value))
+    return repr(value)
+
+
+def encode_value(value) -> bytes:
+    return zlib.compress(render_json(value), CACHE_COMPRESSION_LEVEL)
+
+
+def decode_value(data: bytes):
+    return json.loads(zlib.decompress(data))
+
+
+async def cache_get(key: str, tag: str):
+    """Cached value of a key from the local tier, then the shared store, or None."""
+    entry = _local.get(key)
+    if entry is not None:
+        _metrics["localHits"] += 1
+        return decode_value(entry[1])
+    store = get_cache_store()
+    if store is not None:
+        try:
+            data = await store.get(key)
+        except CacheStoreError as e:
+            _store_failed(e)
+            data = None
+        if data is not None:
+            _metrics["sharedHits"] += 1
+            _set_local(key, tag, data)
+            return decode_value(data)
+    _metrics["misses"] += 1
+    return None
+
+
+def _set_local(key: str, tag: str, data: bytes):
+    # Local entries keep their tag for purges; entries over the whole budget stay out
+    if len(data) <= _local.maxsize:
+        _local[key] = (tag, data)
+
+
+async def cache_set(key: str, tag: str, value, ttl: int = CACHE_TTL):
+    data = encode_value(value)
+    _set_local(key, tag, data)
+    store = get_cache_store()
+    if store is not None:
+        try:
+            await store.set(key, data, ttl)
+        except CacheStoreError as e:
+            _store_failed(e)
+
+
+def cached(namespace: str, ttl: int = CACHE_TTL, tag=None):
+    """
+    Cache the results of an async repository function in both tiers, keyed
+    on its arguments. Error strings are not cached. Results are stored as
+    compressed JSON, so only opt in functions whose results are JSON data.
+
+    `tag` is called with the function's arguments and returns the Cache-Tag
+    the entry is purged by; entries are tagged with the namespace otherwise.
+    Callers can pass `cache_tag=` to tag the entry with the Cache-Tag of
+    their own response, so purging what the CDN sees also purges the entry.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        async def wrapper(*args, cache_tag: str = None, **kwargs):
+            entry_tag = cache_tag or (tag(*args, **kwargs) if tag else namespace)
+            key = cache_key(entry_tag, namespace, *(_key_part(arg) for arg in args), *(f"{name}={_key_part(value)}" for name, value in sorted(kwargs.items())))
+            value = await cache_get(key, entry_tag)
+            if value is not None:
+                return value
+            value = await function(*args, **kwargs)
+            if not isinstance(value, str):
+                await cache_set(key, entry_tag, value, ttl)
+            return value
+
+        wrapper.uncached = function
+        return wrapper
+    return decorator
+
+
+def clear_local_cache():
+    _local.clear()
+
+
+def get_cache_metrics():
+    return {**_metrics, "localEntries": len(_local), "localBytes": _local.currsize}
+
+
+def register_purge_handler(handler):
+    """
+    Include another in-memory cache in purges. The handler is called with a
+    predicate telling whether a Cache-Tag is purged and returns the number
+    of entries it dropped.
+    """
+    _purge_handlers.append(handler)
+    return handler
+
+
+def add_purge_hook(hook):
+    """Call `hook(event)` (sync or async) for every purge made by this process."""
+    _purge_hooks.append(hook)
+    return hook
+
+
+def tag_matcher(tags=(), prefixes=()):
+    tags = frozenset(tags)
+    prefixes = tuple(prefixes)
+    return lambda tag: tag in tags or tag.startswith(prefixes)
+
+
+def _purge_local(matches) -> int:
+    purged = 0
+    for key, (tag, _) in list(_local.items()):
+        if matches(tag):
+            _local.pop(key, None)
+            purged += 1
+    for handler in _purge_handlers:
+        purged += handler(matches)
+    return purged
+
+
+async def _purge_shared(store, tags, prefixes) -> int:
+    patterns = [_key_prefix() + escape_pattern(tag) + "#*" for tag in tags]
+    patterns += [_key_prefix() + escape_pattern(prefix) + "*" for prefix in prefixes]
+    purged = 0
+    for pattern in patterns:
+        keys = await store.scan(pattern)
+        if keys:
+            purged += await store.delete(*keys)
+    return purged
+
+
+def _post_webhook(event):
+    request = urllib.request.Request(
+        CACHE_PURGE_WEBHOOK_URL,
+        data=render_json(event),
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        response.read()
+
+
+async def _emit_purge_event(event):
+    for hook in _purge_hooks:
+        try:
+            result = hook(event)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            logger.error(f"Purge hook {hook!r} failed: {str(e)}", exc_info=True)
+    if CACHE_PURGE_WEBHOOK_URL:
+        try:
+            await asyncio.to_thread(_post_webhook, event)
+        except Exception as e:
+            logger.error(f"Purge webhook failed: {str(e)}")
+
+
+async def purge(tags=(), prefixes=()):
+    """
+    Purge the cached entries whose Cache-Tag is one of `tags` or starts with
+    one of `prefixes`, in this process, in the shared store and, through a
+    purge event in the shared store, in the local tiers of other workers.
+    Purge hooks then receive the event, e.g. to purge the same tags at the CDN.
+
+    Returns:
+        dict: The purge event with the number of entries purged.
+    """
+    tags = sorted(set(tags))
+    prefixes = sorted(set(prefixes))
+    event = {
+        "id": uuid.uuid4().hex,
+        "tags": tags,
+        "prefixes": prefixes,
+        "datasetVersion": get_dataset_version(),
+        "time": int(time.time() * 1000),
+    }
+    purged = _purge_local(tag_matcher(tags, prefixes))
+    store = get_cache_store()
+    if store is not None:
+        try:
+            purged += await _purge_shared(store, tags, prefixes)
+            event_key = f"{PURGE_EVENT_PREFIX}{event['time']}:{event['id']}"
+            _purge_sync["seen"].add(event_key)
+            await store.set(event_key, render_json(event), CACHE_PURGE_EVENT_TTL)
+        except CacheStoreError as e:
+            _store_failed(e)
+
+    _metrics["purges"] += 1
+    _metrics["purgedEntries"] += purged
+    logger.info(f"Purged {purged} cached entries for tags {tags} and prefixes {prefixes}.")
+    await _emit_purge_event(event)
+    return {**event, "purged": purged}
+
+
+async def sync_purges():
+    """
+    Apply the purges made by other workers to the local tier. The shared
+    store is checked at most every CACHE_PURGE_POLL_INTERVAL seconds.
+    """
+    if time.monotonic() - _purge_sync["checked_at"] < CACHE_PURGE_POLL_INTERVAL:
+        return
+    _purge_sync["checked_at"] = time.monotonic()
+    store = get_cache_store()
+    if store is None:
+        return
+    try:
+        keys = await store.scan(PURGE_EVENT_PREFIX + "*")
+        new_keys = sorted(key for key in keys if key not in _purge_sync["seen"])
+        for key in new_keys:
+            data = await store.get(key)
+            if data is not None:
+                event = json.loads(data)
+                _purge_local(tag_matcher(event["tags"], event["prefixes"]))
+        # Expired events are no longer listed, so only listed ones are remembered
+        _purge_sync["seen"] = set(keys)
+    except CacheStoreError as e:
+        _store_failed(e)
+
+
+class PurgeSyncMiddleware:
+    """ASGI middleware applying other workers' purges before requests are served."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            await sync_purges()
+        await self.app(scope, receive, send)
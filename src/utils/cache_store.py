@@ -0,0 +1,263 @@
+"""
+Shared cache stores. RespStore speaks the Redis protocol to any compatible
+server; MemoryStore is an in-process stand-in with the same interface. For
+local development with several workers, `python -m utils.cache_store` runs
+a small Redis-protocol server backed by a MemoryStore.
+"""
+import asyncio
+import re
+import time
+from urllib.parse import urlparse, unquote
+from utils.config import CACHE_STORE_TIMEOUT
+from utils.logger import logger
+
+
+class CacheStoreError(Exception):
+    pass
+
+
+def _pattern_regex(pattern: str):
+    """Compile a Redis glob pattern (*, ?, [...] and backslash escapes)."""
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        elif char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        elif char == "[":
+            end = pattern.find("]", index + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                parts.append("[" + pattern[index + 1:end].replace("\\", "\\\\") + "]")
+                index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return re.compile("".join(parts) + r"\Z", re.DOTALL)
+
+
+def escape_pattern(text: str) -> str:
+    """Escape text to match literally in a Redis glob pattern."""
+    return re.sub(r"([*?\[\]\\])", r"\\\1", text)
+
+
+class MemoryStore:
+    """In-process key-value store with expiry, used as a stand-in for a shared store."""
+
+    def __init__(self):
+        self.values = {}
+
+    def _alive(self, key):
+        entry = self.values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.values[key]
+            return None
+        return value
+
+    async def get(self, key: str):
+        return self._alive(key)
+
+    async def set(self, key: str, value: bytes, ttl: int = None):
+        self.values[key] = (value, time.monotonic() + ttl if ttl else None)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def scan(self, pattern: str):
+        regex = _pattern_regex(pattern)
+        return [key for key in list(self.values) if regex.match(key) and self._alive(key) is not None]
+
+    async def flush(self):
+        self.values.clear()
+
+    async def close(self):
+        pass
+
+
+def _encode_command(*args) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode("utf-8")
+        parts.append(f"${len(arg)}\r\n".encode())
+        parts.append(arg)
+        parts.append(b"\r\n")
+    return b"".join(parts)
+
+
+async def _read_reply(reader):
+    line = await reader.readline()
+    if not line:
+        raise CacheStoreError("Connection closed by the cache store")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        raise CacheStoreError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise CacheStoreError(f"Unexpected reply from the cache store: {line!r}")
+
+
+class RespStore:
+    """
+    Minimal Redis-protocol client for the shared cache tier. Commands are
+    sent over one connection, one at a time, and each is bounded by
+    CACHE_STORE_TIMEOUT; a failed connection is reopened on the next command.
+    """
+
+    def __init__(self, url: str, timeout: float = CACHE_STORE_TIMEOUT):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+        self.lock = asyncio.Lock()
+
+    async def _connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            await self._call("AUTH", self.password)
+        if self.db:
+            await self._call("SELECT", self.db)
+
+    async def _call(self, *args):
+        self.writer.write(_encode_command(*args))
+        await self.writer.drain()
+        return await _read_reply(self.reader)
+
+    async def execute(self, *args):
+        async with self.lock:
+            try:
+                return await asyncio.wait_for(self._execute(*args), self.timeout)
+            except CacheStoreError:
+                raise
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                await self.close()
+                raise CacheStoreError(f"Cache store {self.host}:{self.port} unavailable: {e!r}") from e
+
+    async def _execute(self, *args):
+        if self.writer is None:
+            await self._connect()
+        return await self._call(*args)
+
+    async def get(self, key: str):
+        return await self.execute("GET", key)
+
+    async def set(self, key: str, value: bytes, ttl: int = None):
+        if ttl:
+            await self.execute("SET", key, value, "EX", ttl)
+        else:
+            await self.execute("SET", key, value)
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return await self.execute("DEL", *keys)
+
+    async def scan(self, pattern: str):
+        keys = []
+        cursor = b"0"
+        while True:
+            cursor, batch = await self.execute("SCAN", cursor, "MATCH", pattern, "COUNT", 1000)
+            keys.extend(key.decode("utf-8") for key in batch)
+            if cursor in (b"0", "0"):
+                return keys
+
+    async def flush(self):
+        await self.execute("FLUSHDB")
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            self.reader = None
+
+
+def open_cache_store(url: str):
+    """The shared store for a CACHE_STORE_URL, or None when it is empty."""
+    if not url:
+        return None
+    scheme = urlparse(url).scheme
+    if scheme == "memory":
+        return MemoryStore()
+    if scheme in ("redis", "resp"):
+        return RespStore(url)
+    raise ValueError(f"Unsupported cache store URL scheme: {scheme}")
+
+
+async def _serve_connection(store: MemoryStore, reader, writer):
+    try:
+        while True:
+            try:
+                command = await _read_reply(reader)
+            except (CacheStoreError, asyncio.IncompleteReadError):
+                break
+            name = command[0].decode().upper()
+            # Values stay bytes; keys and options are text
+            args = [arg if name == "SET" and index == 1 else arg.decode("utf-8") for index, arg in enumerate(command[1:])]
+            if name in ("PING", "AUTH", "SELECT"):
+                writer.write(b"+PONG\r\n" if name == "PING" else b"+OK\r\n")
+            elif name == "GET":
+                value = await store.get(args[0])
+                writer.write(b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value))
+            elif name == "SET":
+                ttl = int(args[3]) if len(args) > 3 and args[2].upper() == "EX" else None
+                await store.set(args[0], args[1], ttl)
+                writer.write(b"+OK\r\n")
+            elif name == "DEL":
+                writer.write(b":%d\r\n" % await store.delete(*args))
+            elif name == "SCAN":
+                keys = await store.scan(args[args.index("MATCH") + 1] if "MATCH" in args else "*")
+                # One pass: cursor 0 and all matching keys
+                writer.write(b"*2\r\n$1\r\n0\r\n" + _encode_command(*keys))
+            elif name == "FLUSHDB":
+                await store.flush()
+                writer.write(b"+OK\r\n")
+            else:
+                writer.write(f"-ERR unknown command '{name}'\r\n".encode())
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 6379):
+    """Run a Redis-protocol stand-in server backed by a MemoryStore."""
+    store = MemoryStore()
+    server = await asyncio.start_server(lambda reader, writer: _serve_connection(store, reader, writer), host, port)
+    logger.info(f"Cache store stand-in listening on {host}:{port}.")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Redis-protocol cache store stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    options = parser.parse_args()
+    asyncio.run(serve(options.host, options.port))
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 DEFAULT_EDITION_IDENTIFIER="quran-simple"
@@ -38,4 +39,94 @@ DB_USERNAME = os.environ.get('DB_USERNAME')
 DB_PASSWORD = os.environ.get('DB_PASSWORD')
 DB_HOST = os.environ.get('DB_HOST')
 DB_PORT = os.environ.get('DB_PORT')
-DB_NAME = os.environ.get('DB_NAME')
\ No newline at end of file
+DB_NAME = os.environ.get('DB_NAME')
+
+EXPORT_CACHE_DIR = os.environ.get('EXPORT_CACHE_DIR', os.path.join(tempfile.gettempdir(), "quranhub-exports"))
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 500))
+
+AYAH_BATCH_MAX_REFERENCES = int(os.environ.get('AYAH_BATCH_MAX_REFERENCES', 100))
+AYAH_BATCH_MAX_EDITIONS = int(os.environ.get('AYAH_BATCH_MAX_EDITIONS', 10))
+AYAH_RANGE_STREAM_THRESHOLD = int(os.environ.get('AYAH_RANGE_STREAM_THRESHOLD', 300))
+AYAH_RANGE_CHUNK_SIZE = int(os.environ.get('AYAH_RANGE_CHUNK_SIZE', 200))
+
+MUSHAF_PAGE_BUNDLE_CACHE_SIZE = int(os.environ.get('MUSHAF_PAGE_BUNDLE_CACHE_SIZE', 2048))
+
+WORD_LOCATIONS_MAX_WORDS = int(os.environ.get('WORD_LOCATIONS_MAX_WORDS', 2000))
+
+DATASET_VERSION = os.environ.get('DATASET_VERSION', '1')
+EDITION_ANALYSIS_PROBE_INTERVAL = int(os.environ.get('EDITION_ANALYSIS_PROBE_INTERVAL', 60))
+EDITION_CATALOG_PROBE_INTERVAL = int(os.environ.get('EDITION_CATALOG_PROBE_INTERVAL', 60))
+
+SINGLE_FLIGHT_TIMEOUT = float(os.environ.get('SINGLE_FLIGHT_TIMEOUT', 10))
+SINGLE_FLIGHT_EXCLUDED_PREFIXES = tuple(os.environ.get('SINGLE_FLIGHT_EXCLUDED_PREFIXES', '/health,/v1/export').split(','))
+
+# Shared cache tier: redis://[:password@]host:port/db, memory:// for a
+# process-local stand-in, or empty to use only the in-process tier
+CACHE_STORE_URL = os.environ.get('CACHE_STORE_URL', '')
+CACHE_STORE_TIMEOUT = float(os.environ.get('CACHE_STORE_TIMEOUT', 0.5))
+CACHE_STORE_RETRY_INTERVAL = int(os.environ.get('CACHE_STORE_RETRY_INTERVAL', 30))
+# Budget of the in-process tier, in compressed bytes
+CACHE_LOCAL_MAX_BYTES = int(os.environ.get('CACHE_LOCAL_MAX_BYTES', 128 * 1024 * 1024))
+CACHE_TTL = int(os.environ.get('CACHE_TTL', 86400))
+CACHE_COMPRESSION_LEVEL = int(os.environ.get('CACHE_COMPRESSION_LEVEL', 6))
+CACHE_PURGE_TOKEN = os.environ.get('CACHE_PURGE_TOKEN', '')
+CACHE_PURGE_POLL_INTERVAL = float(os.environ.get('CACHE_PURGE_POLL_INTERVAL', 2))
+CACHE_PURGE_EVENT_TTL = int(os.environ.get('CACHE_PURGE_EVENT_TTL', 3600))
+CACHE_PURGE_WEBHOOK_URL = os.environ.get('CACHE_PURGE_WEBHOOK_URL', '')
+
+DATA_CHANGE_CHANNEL = os.environ.get('DATA_CHANGE_CHANNEL', 'quranhub_data_change')
+DATA_CHANGE_LISTEN = os.environ.get('DATA_CHANGE_LISTEN', 'true').lower() == 'true'
+DATA_CHANGE_DEBOUNCE = float(os.environ.get('DATA_CHANGE_DEBOUNCE', 0.5))
+DATA_CHANGE_RECONNECT_INTERVAL = int(os.environ.get('DATA_CHANGE_RECONNECT_INTERVAL', 10))
+
+DB_COMMAND_TIMEOUT = float(os.environ.get('DB_COMMAND_TIMEOUT', 30))
+DB_BREAKER_FAILURE_THRESHOLD = int(os.environ.get('DB_BREAKER_FAILURE_THRESHOLD', 5))
+DB_BREAKER_RESET_TIMEOUT = float(os.environ.get('DB_BREAKER_RESET_TIMEOUT', 10))
+
+STALE_FALLBACK_ENABLED = os.environ.get('STALE_FALLBACK_ENABLED', 'true').lower() == 'true'
+STALE_SNAPSHOT_DIR = os.environ.get('STALE_SNAPSHOT_DIR', os.path.join(tempfile.gettempdir(), "quranhub-snapshots"))
+STALE_SNAPSHOT_MAX_BYTES = int(os.environ.get('STALE_SNAPSHOT_MAX_BYTES', 5 * 1024 * 1024))
+STALE_SNAPSHOT_REFRESH_INTERVAL = int(os.environ.get('STALE_SNAPSHOT_REFRESH_INTERVAL', 3600))
+# Disk budget of all snapshots; the least recently used are pruned past it
+STALE_SNAPSHOT_DIR_MAX_BYTES = int(os.environ.get('STALE_SNAPSHOT_DIR_MAX_BYTES', 256 * 1024 * 1024))
+STALE_SNAPSHOT_PRUNE_INTERVAL = int(os.environ.get('STALE_SNAPSHOT_PRUNE_INTERVAL', 60))
+# Routes keyed by free text are not snapshotted; neither are requests with a query string
+STALE_SNAPSHOT_EXCLUDED_PREFIXES = tuple(os.environ.get('STALE_SNAPSHOT_EXCLUDED_PREFIXES', '/v1/search').split(','))
+
+# Read replicas (DATABASE_REPLICA_URLS in the environment, comma-separated)
+DATABASE_REPLICA_ROUTING = os.environ.get('DATABASE_REPLICA_ROUTING', 'round_robin')  # or 'least_connections'
+DATABASE_REPLICA_RETRY_INTERVAL = float(os.environ.get('DATABASE_REPLICA_RETRY_INTERVAL', 15))
+DATABASE_HEDGED_READS = os.environ.get('DATABASE_HEDGED_READS', 'false').lower() == 'true'
+DATABASE_HEDGE_MIN_DELAY = float(os.environ.get('DATABASE_HEDGE_MIN_DELAY', 0.05))
+DATABASE_HEDGE_LATENCY_WINDOW = int(os.environ.get('DATABASE_HEDGE_LATENCY_WINDOW', 500))
+
+# Admission control: concurrent requests and queue depth per route group.
+# Together the limits should stay within the pool (pool_size + max_overflow).
+ADMISSION_CONTROL_ENABLED = os.environ.get('ADMISSION_CONTROL_ENABLED', 'true').lower() == 'true'
+ADMISSION_HEAVY_PREFIXES = tuple(os.environ.get('ADMISSION_HEAVY_PREFIXES', '/v1/quran,/v1/narrations-differences,/v1/ayah/range,/v1/ayah/batch').split(','))
+ADMISSION_HEAVY_LIMIT = int(os.environ.get('ADMISSION_HEAVY_LIMIT', 6))
+ADMISSION_HEAVY_QUEUE = int(os.environ.get('ADMISSION_HEAVY_QUEUE', 24))
+ADMISSION_PRIORITY_PREFIXES = tuple(os.environ.get('ADMISSION_PRIORITY_PREFIXES', '/v1/ayah').split(','))
+ADMISSION_PRIORITY_LIMIT = int(os.environ.get('ADMISSION_PRIORITY_LIMIT', 10))
+ADMISSION_PRIORITY_QUEUE = int(os.environ.get('ADMISSION_PRIORITY_QUEUE', 200))
+ADMISSION_DEFAULT_LIMIT = int(os.environ.get('ADMISSION_DEFAULT_LIMIT', 14))
+ADMISSION_DEFAULT_QUEUE = int(os.environ.get('ADMISSION_DEFAULT_QUEUE', 64))
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', 5))
+ADMISSION_RETRY_AFTER = int(os.environ.get('ADMISSION_RETRY_AFTER', 2))
+
+# Repository calls of a request share one session (and pool connection)
+DATABASE_REQUEST_SESSIONS = os.environ.get('DATABASE_REQUEST_SESSIONS', 'true').lower() == 'true'
+DATABASE_POOL_WAIT_WINDOW = int(os.environ.get('DATABASE_POOL_WAIT_WINDOW', 1000))
+
+# Registered hot statements: variants kept, and how many of them each new
+# pool connection prepares (asyncpg keeps 100 prepared statements per connection)
+DATABASE_STATEMENT_CACHE_SIZE = int(os.environ.get('DATABASE_STATEMENT_CACHE_SIZE', 256))
+DATABASE_PREPARE_STATEMENTS = os.environ.get('DATABASE_PREPARE_STATEMENTS', 'true').lower() == 'true'
+DATABASE_PREPARE_LIMIT = int(os.environ.get('DATABASE_PREPARE_LIMIT', 50))
+
+# Raw asyncpg fast path for single-ayah lookups, routed over the read
+# replicas like other reads. The repo has no test suite: the gate for
+# enabling it is `python -m repositories.ayah_fast_repo [--edition X]`, which
+# must report 0 mismatches and 0 fallbacks against the target database.
+AYAH_FAST_PATH_ENABLED = os.environ.get('AYAH_FAST_PATH_ENABLED', 'false').lower() == 'true'
+AYAH_FAST_PATH_POOL_SIZE = int(os.environ.get('AYAH_FAST_PATH_POOL_SIZE', 4))
@@ -0,0 +1,100 @@
+import asyncio
+import json
+from utils.config import DATASET_VERSION
+from utils.logger import logger
+
+# Version of the Quran dataset currently served. Anything precomputed from
+# the data is tied to the version it was built from and rebuilt on change.
+_dataset_version = DATASET_VERSION
+
+_precomputed_bodies = {}
+_precomputed_locks = {}
+
+# In-process stores built from content tables: (tables, clear function)
+_data_stores = []
+
+
+def get_dataset_version() -> str:
+    return _dataset_version
+
+
+def set_dataset_version(version: str):
+    """Switch to a new dataset version; precomputed responses are rebuilt on next use."""
+    global _dataset_version
+    if version != _dataset_version:
+        logger.info(f"Dataset version changed from {_dataset_version} to {version}.")
+        _dataset_version = version
+
+
+def register_data_store(*tables: str):
+    """
+    Register the clear function of an in-process store built from content
+    tables, so the store is dropped when any of those tables changes.
+    """
+    def decorator(clear):
+        _data_stores.append((frozenset(tables), clear))
+        return clear
+    return decorator
+
+
+def apply_data_change(tables=None, version: str = None):
+    """
+    Drop the in-process stores built from the changed tables (all of them
+    when tables is None) and switch to the new dataset version, which also
+    retires cached responses. Stores are rebuilt on next use.
+    """
+    cleared = 0
+    for store_tables, clear in _data_stores:
+        if tables is None or store_tables.intersection(tables):
+            clear()
+            cleared += 1
+    if version is not None:
+        set_dataset_version(version)
+    logger.info(f"Data change in {sorted(tables) if tables is not None else 'all tables'}: cleared {cleared} in-process stores.")
+
+
+def render_json(content) -> bytes:
+    """Serialize content exactly as JSONResponse does."""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+async def get_precomputed_body(key: str, build, tag: str = None):
+    """
+    Pre-serialized success response body for data that only changes with the
+    dataset. `build` is awaited once per dataset version and its result is
+    kept as the rendered {"code": 200, "status": "OK", "data": ...} bytes.
+    `tag` is the Cache-Tag the body is purged by, the key by default.
+
+    Returns:
+        bytes: The response body.
+        str: The error message returned by `build`, which is not cached.
+    """
+    entry = _precomputed_bodies.get(key)
+    if entry is not None and entry[0] == _dataset_version:
+        return entry[1]
+    lock = _precomputed_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        entry = _precomputed_bodies.get(key)
+        if entry is not None and entry[0] == _dataset_version:
+            return entry[1]
+        version = _dataset_version
+        data = await build()
+        if isinstance(data, str):
+            return data
+        body = render_json({"code": 200, "status": "OK", "data": data})
+        _precomputed_bodies[key] = (version, body, tag or key)
+        return body
+
+
+def purge_precomputed_bodies(matches) -> int:
+    """Drop the precomputed bodies whose Cache-Tag `matches` accepts."""
+    keys = [key for key, entry in _precomputed_bodies.items() if matches(entry[2])]
+    for key in keys:
+        del _precomputed_bodies[key]
+    return len(keys)
@@ -0,0 +1,114 @@
+from typing import Optional
+from db.models import Ayat, Surat
+from utils.helpers import get_ayah_audio_url_templates
+
+# Columns needed by each ayah field that can be requested with `fields=`
+AYAH_FIELD_COLUMNS = {
+    "number": (Ayat.number,),
+    "text": (Ayat.text,),
+    "surah": (Surat.id, Surat.name, Surat.englishname, Surat.englishtranslation, Surat.revelationcity, Surat.numberofayats),
+    "numberInSurah": (Ayat.numberinsurat,),
+    "juz": (Ayat.juz_id,),
+    "manzil": (Ayat.manzil_id,),
+    "page": (Ayat.page_id,),
+    "ruku": (Ayat.ruku_id,),
+    "hizb": (Ayat.hizb_id,),
+    "hizbQuarter": (Ayat.hizbquarter_id,),
+    "sajda": (Ayat.sajda_id,),
+    "audio": (),
+    "audioSecondary": (),
+}
+
+_AYAH_FIELD_VALUES = {
+    "number": lambda item: item.number,
+    "text": lambda item: item.text,
+    "surah": lambda item: {
+        "number": item.id,
+        "name": item.name,
+        "englishName": item.englishname,
+        "englishNameTranslation": item.englishtranslation,
+        "revelationType": item.revelationcity,
+        "numberOfAyahs": item.numberofayats
+    },
+    "numberInSurah": lambda item: item.numberinsurat,
+    "juz": lambda item: item.juz_id,
+    "manzil": lambda item: item.manzil_id,
+    "page": lambda item: item.page_id,
+    "ruku": lambda item: item.ruku_id,
+    "hizb": lambda item: item.hizb_id,
+    "hizbQuarter": lambda item: item.hizbquarter_id,
+    "sajda": lambda item: item.sajda_id if item.sajda_id else False,
+}
+
+# In compact mode the surah is sent once in the top-level surahs list and
+# referenced by number from each ayah
+_COMPACT_AYAH_FIELD_VALUES = {**_AYAH_FIELD_VALUES, "surah": lambda item: item.id}
+
+# Ayah layouts of the list endpoints, in response order
+AYAH_LAYOUT = ("number", "text", "surah", "numberInSurah", "juz", "manzil", "page", "ruku", "hizbQuarter", "sajda", "audio", "audioSecondary")
+HIZB_AYAH_LAYOUT = ("number", "text", "surah", "numberInSurah", "juz", "manzil", "page", "ruku", "hizb", "sajda", "audio", "audioSecondary")
+SURAH_AYAH_LAYOUT = ("number", "text", "numberInSurah", "juz", "manzil", "page", "ruku", "hizbQuarter", "sajda", "audio", "audioSecondary")
+
+
+def parse_fields(fields: Optional[str], layout=AYAH_LAYOUT):
+    """
+    Parse a comma-separated `fields=` value against an ayah layout.
+
+    Returns:
+        None: If no fields were given, meaning all fields.
+        set: The requested field names.
+        str: An error message if a field is not part of the layout.
+    """
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    invalid = [field for field in requested if field not in layout]
+    if invalid:
+        return f"Invalid fields: {', '.join(invalid)}. Valid fields are: {', '.join(layout)}."
+    return set(requested)
+
+
+def has_field(fields, name: str) -> bool:
+    return fields is None or name in fields
+
+
+def ayah_columns(fields, *required, layout=AYAH_LAYOUT):
+    """
+    Columns to select for the requested fields, plus the columns the caller
+    needs for its own bookkeeping. Ayat.number is always selected.
+    """
+    columns = [Ayat.number]
+    for name in layout:
+        if has_field(fields, name):
+            columns.extend(column for column in AYAH_FIELD_COLUMNS[name] if column not in columns)
+    columns.extend(column for column in required if column not in columns)
+    return columns
+
+
+def build_ayah(item, fields=None, layout=AYAH_LAYOUT, compact=False):
+    """
+    Build an ayah dict from a row with only the requested fields. With
+    compact, the surah is given by its number instead of a nested object.
+    """
+    values = _COMPACT_AYAH_FIELD_VALUES if compact else _AYAH_FIELD_VALUES
+    return {
+        name: values[name](item)
+        for name in layout
+        if name in values and has_field(fields, name)
+    }
+
+
+def add_ayah_audio(ayahs, numbers, edition, fields=None):
+    """
+    Add the verse-by-verse audio URLs of an audio edition to the ayah dicts.
+    `numbers` are the global ayah numbers of the ayahs, in the same order.
+    """
+    if edition.format != "audio" or not (has_field(fields, "audio") or has_field(fields, "audioSecondary")):
+        return ayahs
+    primary, secondary = get_ayah_audio_url_templates(edition.identifier, tuple(edition.bitrates))
+    for ayah, number in zip(ayahs, numbers):
+        if has_field(fields, "audio"):
+            ayah["audio"] = f"{primary}{number}.mp3"
+        if has_field(fields, "audioSecondary"):
+            ayah["audioSecondary"] = [f"{prefix}{number}.mp3" for prefix in secondary]
+    return ayahs
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from utils.config import BUNNY_URL
 from typing import List, Tuple
 from utils.logger import logger
@@ -38,6 +39,21 @@ def get_ayah_audio_url(bitrate, edition_identifier, ayah_number):
 def get_ayah_audio_secondary_urls(bitrates, edition_identifier, ayah_number):
     return [f"{BUNNY_URL}/audio/versebyverse/{bitrate}/{edition_identifier}/{ayah_number}.mp3" for bitrate in bitrates]
 
+@lru_cache(maxsize=1024)
+def get_ayah_audio_url_templates(edition_identifier, bitrates: Tuple[int, ...]):
+    """
+    Precomputed verse-by-verse audio URL prefixes for an edition, computed once
+    per (edition, bitrates). Append "{ayah_number}.mp3" to get an ayah URL.
+
+    Returns:
+        tuple: (primary_prefix, secondary_prefixes) for the max bitrate and the
+        remaining bitrates.
+    """
+    max_bitrate = max(bitrates)
+    primary = f"{BUNNY_URL}/audio/versebyverse/{max_bitrate}/{edition_identifier}/"
+    secondary = tuple(f"{BUNNY_URL}/audio/versebyverse/{bitrate}/{edition_identifier}/" for bitrate in bitrates if bitrate != max_bitrate)
+    return primary, secondary
+
 def get_surah_audio_url(bitrate, edition_identifier, ayah_number):
     return f"{BUNNY_URL}/audio/surah/{bitrate}/{edition_identifier}/{ayah_number}.mp3"
     
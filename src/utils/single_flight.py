@@ -0,0 +1,146 @@
+import asyncio
+from urllib.parse import parse_qsl, urlencode
+from utils.config import SINGLE_FLIGHT_TIMEOUT, SINGLE_FLIGHT_EXCLUDED_PREFIXES
+from utils.logger import logger
+
+# Result of a call whose leader failed; waiters then run the call themselves
+_FAILED = object()
+
+_flights = {}
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the
+    call and everyone arriving while it is in flight awaits its result. A
+    waiter gives up after `timeout` seconds, or when the leader fails, and
+    runs the call itself.
+    """
+
+    def __init__(self, name: str, timeout: float = SINGLE_FLIGHT_TIMEOUT):
+        self.name = name
+        self.timeout = timeout
+        self.calls = {}
+        self.metrics = {"leaders": 0, "coalesced": 0, "timeouts": 0, "failures": 0, "abandoned": 0, "inFlight": 0}
+        _flights[name] = self
+
+    async def do(self, key, call):
+        """
+        Run `call()` once for all concurrent callers of `key`.
+
+        Returns:
+            tuple: (result, shared), where shared is True for waiters that
+            received the result of another caller.
+        """
+        future = self.calls.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.calls[key] = future
+            self.metrics["leaders"] += 1
+            self.metrics["inFlight"] = len(self.calls)
+            result = _FAILED
+            try:
+                result = await call()
+                return result, False
+            finally:
+                if result is _FAILED:
+                    self.metrics["failures"] += 1
+                if not future.done():
+                    future.set_result(result)
+                if self.calls.get(key) is future:
+                    del self.calls[key]
+                self.metrics["inFlight"] = len(self.calls)
+
+        self.metrics["coalesced"] += 1
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.metrics["timeouts"] += 1
+            logger.warning(f"Single-flight {self.name} timed out after {self.timeout}s waiting for {key}.")
+            return await call(), False
+        if result is _FAILED:
+            return await call(), False
+        return result, True
+
+
+    def abandon(self, key):
+        """
+        Stop sharing the call in flight for `key`: its waiters, and callers
+        arriving later, run the call themselves.
+        """
+        future = self.calls.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(_FAILED)
+            self.metrics["abandoned"] += 1
+            self.metrics["inFlight"] = len(self.calls)
+
+
+def get_single_flight_metrics():
+    """Counters of every single-flight group, by name."""
+    return {name: dict(flight.metrics) for name, flight in _flights.items()}
+
+
+def request_key(scope) -> str:
+    """Normalized request key: the path with its query parameters sorted."""
+    query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+    return f"{scope['path']}?{urlencode(sorted(query))}"
+
+
+def _copy_message(message):
+    if "headers" in message:
+        return {**message, "headers": list(message["headers"])}
+    return dict(message)
+
+
+class SingleFlightMiddleware:
+    """
+    ASGI middleware sharing one response between identical concurrent GET
+    requests. The first request runs normally while its response is
+    recorded; duplicates arriving before it completes are answered with a
+    replay of the recorded status, headers and body. Streamed responses are
+    not shared: once the leader streams, duplicates run on their own.
+    """
+
+    def __init__(self, app, timeout: float = SINGLE_FLIGHT_TIMEOUT, excluded_prefixes=SINGLE_FLIGHT_EXCLUDED_PREFIXES):
+        self.app = app
+        self.excluded_prefixes = tuple(prefix for prefix in excluded_prefixes if prefix)
+        self.flight = SingleFlight("requests", timeout)
+
+    def _is_shareable(self, scope) -> bool:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return False
+        if scope["path"].startswith(self.excluded_prefixes):
+            return False
+        # Partial responses depend on the requested range
+        return not any(name == b"range" for name, _ in scope["headers"])
+
+    async def __call__(self, scope, receive, send):
+        if not self._is_shareable(scope):
+            await self.app(scope, receive, send)
+            return
+
+        key = request_key(scope)
+
+        async def run():
+            messages = []
+            streaming = False
+
+            async def record(message):
+                nonlocal streaming
+                if not streaming and message["type"] == "http.response.body" and message.get("more_body"):
+                    # Streamed responses are not held in memory: waiters make their own
+                    streaming = True
+                    messages.clear()
+                    self.flight.abandon(key)
+                if not streaming:
+                    # Outer middleware (e.g. CORS) edits the headers of the message it is sent
+                    messages.append(_copy_message(message))
+                await send(message)
+
+            await self.app(scope, receive, record)
+            return messages
+
+        messages, shared = await self.flight.do(key, run)
+        if shared:
+            for message in messages:
+                await send(_copy_message(message))
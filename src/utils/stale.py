@@ -0,0 +1,207 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from cachetools import LRUCache
+from db.resilience import track_request
+from utils.config import (
+    STALE_SNAPSHOT_DIR, STALE_SNAPSHOT_MAX_BYTES, STALE_SNAPSHOT_REFRESH_INTERVAL, STALE_SNAPSHOT_DIR_MAX_BYTES,
+    STALE_SNAPSHOT_PRUNE_INTERVAL, STALE_SNAPSHOT_EXCLUDED_PREFIXES, SINGLE_FLIGHT_EXCLUDED_PREFIXES
+)
+from utils.single_flight import request_key
+from utils.logger import logger
+
+# Response headers kept in snapshots
+SNAPSHOT_HEADERS = (b"content-type", b"cache-tag", b"content-disposition")
+STALE_WARNING = '110 - "Response is Stale"'
+
+# When each snapshot was last written by this process
+_written = LRUCache(maxsize=65536)
+_metrics = {"snapshotsWritten": 0, "staleServed": 0, "snapshotsPruned": 0}
+_pruning = {"prunedAt": time.monotonic(), "writtenSince": 0}
+
+
+def snapshot_path(key: str) -> str:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(STALE_SNAPSHOT_DIR, digest[:2], f"{digest}.snapshot")
+
+
+def _write_snapshot(path: str, meta: dict, body: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, spool_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            spool.write(json.dumps(meta).encode("utf-8") + b"\n")
+            spool.write(body)
+        os.replace(spool_path, path)
+    finally:
+        if os.path.exists(spool_path):
+            os.remove(spool_path)
+
+
+def _read_snapshot(path: str):
+    try:
+        with open(path, "rb") as snapshot:
+            meta = json.loads(snapshot.readline())
+            body = snapshot.read()
+        # The modification time orders snapshots by last use for pruning
+        os.utime(path)
+        return meta, body
+    except FileNotFoundError:
+        return None
+
+
+def _prune_snapshots() -> int:
+    """Remove the least recently used snapshots until they fit the disk budget."""
+    snapshots = []
+    total = 0
+    for root, _, names in os.walk(STALE_SNAPSHOT_DIR):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            snapshots.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+    pruned = 0
+    for _, size, path in sorted(snapshots):
+        if total <= STALE_SNAPSHOT_DIR_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+            pruned += 1
+        except FileNotFoundError:
+            pass
+        total -= size
+    return pruned
+
+
+async def _maybe_prune(written: int):
+    # Workers share the directory, so each one prunes by scanning it from time to time
+    _pruning["writtenSince"] += written
+    if _pruning["writtenSince"] < STALE_SNAPSHOT_DIR_MAX_BYTES // 20 and time.monotonic() - _pruning["prunedAt"] < STALE_SNAPSHOT_PRUNE_INTERVAL:
+        return
+    _pruning.update(prunedAt=time.monotonic(), writtenSince=0)
+    try:
+        _metrics["snapshotsPruned"] += await asyncio.to_thread(_prune_snapshots)
+    except OSError as e:
+        logger.warning(f"Could not prune response snapshots: {str(e)}")
+
+
+def is_snapshotted(scope) -> bool:
+    """Whether a request's responses are snapshotted: canonical routes only, without a query string."""
+    return not scope.get("query_string") and not scope["path"].startswith(STALE_SNAPSHOT_EXCLUDED_PREFIXES)
+
+
+async def save_snapshot(key: str, headers, body: bytes):
+    """Keep the last good response of a request on disk, rewritten at most every refresh interval."""
+    written_at = _written.get(key)
+    if written_at is not None and time.monotonic() - written_at < STALE_SNAPSHOT_REFRESH_INTERVAL:
+        return
+    _written[key] = time.monotonic()
+    meta = {
+        "headers": [[name.decode("latin-1"), value.decode("latin-1")] for name, value in headers if name.lower() in SNAPSHOT_HEADERS],
+        "savedAt": int(time.time() * 1000),
+    }
+    try:
+        await asyncio.to_thread(_write_snapshot, snapshot_path(key), meta, body)
+        _metrics["snapshotsWritten"] += 1
+    except OSError as e:
+        logger.warning(f"Could not write response snapshot for {key}: {str(e)}")
+        return
+    await _maybe_prune(len(body))
+
+
+async def load_snapshot(key: str):
+    """(meta, body) of the snapshot of a request, or None."""
+    try:
+        return await asyncio.to_thread(_read_snapshot, snapshot_path(key))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read response snapshot for {key}: {str(e)}")
+        return None
+
+
+class StaleFallbackMiddleware:
+    """
+    ASGI middleware serving the last good response of a GET request when the
+    database is unavailable. Successful responses are snapshotted to disk as
+    they are sent; when a request fails because the database could not be
+    reached (or the circuit breaker is open), its snapshot is sent instead,
+    marked with X-Data-Stale and Warning headers and not cached downstream.
+    Only canonical requests (see is_snapshotted) are snapshotted, and the
+    snapshots are kept within STALE_SNAPSHOT_DIR_MAX_BYTES on disk.
+    """
+
+    def __init__(self, app, excluded_prefixes=SINGLE_FLIGHT_EXCLUDED_PREFIXES):
+        self.app = app
+        self.excluded_prefixes = tuple(prefix for prefix in excluded_prefixes if prefix)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"].startswith(self.excluded_prefixes) or not is_snapshotted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        database = track_request()
+        key = request_key(scope)
+        start = None
+        held = None
+        body = []
+        size = 0
+
+        async def forward(message):
+            nonlocal start, held, size
+            if message["type"] == "http.response.start":
+                start = message
+                if message["status"] != 200:
+                    # Errors are held back until it is known whether a snapshot replaces them
+                    held = [message]
+                    return
+            elif held is not None:
+                held.append(message)
+                return
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if size <= STALE_SNAPSHOT_MAX_BYTES:
+                    body.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, forward)
+        except Exception:
+            # Only a failure before anything was sent can still be replaced
+            if not database["unavailable"] or (start is not None and held is None) or not await self._send_snapshot(key, send):
+                raise
+            return
+
+        if held is None:
+            if start is not None and start["status"] == 200 and size <= STALE_SNAPSHOT_MAX_BYTES:
+                await save_snapshot(key, start["headers"], b"".join(body))
+            return
+
+        if not database["unavailable"] or not await self._send_snapshot(key, send):
+            for message in held:
+                await send(message)
+
+    async def _send_snapshot(self, key: str, send) -> bool:
+        snapshot = await load_snapshot(key)
+        if snapshot is None:
+            return False
+        meta, snapshot_body = snapshot
+        _metrics["staleServed"] += 1
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in meta["headers"]]
+        headers += [
+            (b"content-length", str(len(snapshot_body)).encode()),
+            (b"cache-control", b"no-store"),
+            (b"x-data-stale", b"true"),
+            (b"warning", STALE_WARNING.encode()),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": snapshot_body})
+        return True
+
+
+def get_stale_metrics():
+    return dict(_metrics)